@@ -0,0 +1,113 @@
+"""
+Benchmarks the curve sensitivities of a swap from one valuation on dual numbers against bump and revalue, which
+values the swap once per pillar on top of the base valuation.
+
+Run from the root of the repository with
+
+    python -m benchmarks.dual
+"""
+
+import time
+import numpy as np
+from supersnabb.math.dual import Dual
+from supersnabb.time.date import Date, Tenor
+from supersnabb.time.schedule import Schedule
+from supersnabb.time.calendars.sweden import Sweden
+from supersnabb.time.daycounters.act360 import ACT360
+from supersnabb.time.daycounters.act365 import ACT365
+from supersnabb.time.business_day_convention import BusinessDayConvention
+from supersnabb.termstructure.curve import DiscountCurve
+from supersnabb.termstructure.interpolation import InterpolationType
+from supersnabb.indices.ibor_index import IborIndex
+from supersnabb.cashflows.fixed_rate_coupon import FixedRateLeg
+from supersnabb.cashflows.float_rate_coupon import FloatRateLeg
+
+REFERENCE_DATE = Date(2023, 1, 2)
+SCHEDULE = Schedule(
+    REFERENCE_DATE,
+    REFERENCE_DATE + Tenor("30Y"),
+    Tenor("3M"),
+    Sweden(),
+    BusinessDayConvention.MODIFIEDFOLLOWING,
+    BusinessDayConvention.MODIFIEDFOLLOWING,
+    "forward",
+)
+
+
+def curve_inputs(n_pillars):
+    dates = [REFERENCE_DATE] + [
+        REFERENCE_DATE + Tenor(f"{12 * 31 // (n_pillars - 1) * idx}M")
+        for idx in range(1, n_pillars)
+    ]
+    times = np.array(
+        [(dt.serial_number - REFERENCE_DATE.serial_number) / 365 for dt in dates]
+    )
+    return dates, np.exp(-(0.02 + 0.001 * times) * times)
+
+
+def swap_npv(dates, discount_factors):
+    curve = DiscountCurve(
+        dates, discount_factors, ACT365, Sweden, InterpolationType.LOGLINEAR
+    )
+    ibor_index = IborIndex(
+        Tenor("3M"),
+        Tenor("2D"),
+        "SEK",
+        Sweden,
+        BusinessDayConvention.MODIFIEDFOLLOWING,
+        ACT360(),
+        curve,
+    )
+    fixed_leg = FixedRateLeg(
+        SCHEDULE, 10e6, 0.03, ACT365, BusinessDayConvention.FOLLOWING, Sweden, curve
+    )
+    float_leg = FloatRateLeg(
+        SCHEDULE, 10e6, ibor_index, ACT365, BusinessDayConvention.FOLLOWING, curve
+    )
+    return fixed_leg.npv - float_leg.npv
+
+
+def bump_and_revalue(dates, discount_factors, size=1e-7):
+    base = swap_npv(dates, discount_factors)
+    gradient = np.empty(len(dates))
+    for idx in range(len(dates)):
+        bumped = discount_factors.copy()
+        bumped[idx] += size
+        gradient[idx] = (swap_npv(dates, bumped) - base) / size
+    return base, gradient
+
+
+def dual(dates, discount_factors):
+    npv = swap_npv(dates, Dual.variables(discount_factors))
+    return npv.value, npv.gradient
+
+
+def timeit(function, *args, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print(f"{'pillars':>8}{'bump':>12}{'dual':>12}{'speedup':>10}{'max rel diff':>14}")
+    for n_pillars in (5, 10, 20, 40):
+        dates, discount_factors = curve_inputs(n_pillars)
+        bump_npv, bump_gradient = bump_and_revalue(dates, discount_factors)
+        dual_npv, dual_gradient = dual(dates, discount_factors)
+        assert abs(bump_npv - dual_npv) < 1e-6
+        difference = np.max(
+            np.abs(dual_gradient - bump_gradient) / np.maximum(np.abs(dual_gradient), 1)
+        )
+        bump_time = timeit(bump_and_revalue, dates, discount_factors)
+        dual_time = timeit(dual, dates, discount_factors)
+        print(
+            f"{n_pillars:>8}{bump_time * 1e3:>10.2f}ms{dual_time * 1e3:>10.2f}ms"
+            f"{bump_time / dual_time:>9.1f}x{difference:>14.2e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+"""
+Benchmarks the schedule generator against the loop based generator it replaced and against QuantLib.
+
+Run from the root of the repository with
+
+    python -m benchmarks.schedule
+"""
+
+import time
+import QuantLib as ql
+from supersnabb.time.date import Date, Tenor
+from supersnabb.time.schedule import Schedule
+from supersnabb.time.calendars.null_calendar import NullCalendar
+from supersnabb.time.calendars.sweden import Sweden
+from supersnabb.time.business_day_convention import BusinessDayConvention
+
+
+class LegacySchedule(Schedule):
+    """
+    The loop based generator, kept as a reference. The backward rule calls NullCalendar().advance, the original
+    called it on the class and could not run.
+    """
+
+    def _create_schedule(self):
+        # Checks for forward generation and IMM generation
+        if self.first_date is not None:
+            match self.rule:
+                case "forward":  # Note there is indeed more cases but not implemented yet
+                    if not (self.first_date > self.effective_date) or not (
+                        self.first_date <= self.termination_date
+                    ):
+                        raise ValueError(
+                            f"first_date must be after effective_date: {self.effective_date} and before termination_date: {self.termination_date}, received: {self.first_date}."
+                        )
+        if self.next_to_last is not None:
+            match self.rule:
+                case "forward":
+                    if not (
+                        self.effective_date <= self.next_to_last < self.termination_date
+                    ):
+                        raise ValueError(
+                            f"next_to_last must be after effective_date: {self.effective_date} and before termination_date: {self.termination_date}, received: {self.next_to_last}."
+                        )
+        periods = 1
+
+        match self.rule:
+            case "backward":
+                self._dates.append(self.termination_date)
+                seed = self.termination_date
+
+                # Checks if next_to_last is regular or not
+                if self.next_to_last is not None:
+                    self._dates.insert(0, self.next_to_last)
+                    temp = NullCalendar().advance(
+                        seed, self.tenor * -1, self.convention
+                    )
+                    if temp != self.next_to_last:
+                        self._is_regular.insert(0, False)
+                    else:
+                        self._is_regular.insert(0, True)
+                    seed = self.next_to_last
+
+                exit_date = self.effective_date
+                if self.first_date is not None:
+                    exit_date = self.first_date
+
+                while True:
+                    # temp moves back in time using -periods * tenor
+                    temp = NullCalendar().advance(
+                        seed, self.tenor * -periods, self.convention
+                    )
+                    if temp < exit_date:
+                        # Checks if first_date is regular or not
+                        if self.first_date is not None:
+                            adjusted_front_date = self.calendar.adjust(
+                                self._dates[0], self.convention
+                            )
+                            adjusted_first_date = self.calendar.adjust(
+                                self.first_date, self.convention
+                            )
+                            if adjusted_front_date != adjusted_first_date:
+                                self._dates.insert(0, self.first_date)
+                                self._is_regular.insert(0, False)
+                        break
+                    else:
+                        # Appends all other dates not related to first_date or next_to_last
+                        adjusted_front_date = self.calendar.adjust(
+                            self._dates[0], self.convention
+                        )
+                        adjusted_temp = self.calendar.adjust(temp, self.convention)
+                        if adjusted_front_date != adjusted_temp:
+                            self._dates.insert(0, temp)
+                            self._is_regular.insert(0, True)
+                        periods += 1
+                # Checks if effective_date is regular or not
+                adjusted_front_date = self.calendar.adjust(
+                    self._dates[0], self.convention
+                )
+                adjusted_effective_date = self.calendar.adjust(
+                    self.effective_date, self.convention
+                )
+                if adjusted_front_date != adjusted_effective_date:
+                    self._dates.insert(0, self.effective_date)
+                    self._is_regular.insert(0, False)
+
+            case "forward":
+                self._dates.append(self.effective_date)
+                seed = self.effective_date
+                # Checks if first_date is regular or not
+                if self.first_date is not None:
+                    self._dates.append(self.first_date)
+                    temp = NullCalendar().advance(
+                        seed, self.tenor * periods, self.convention
+                    )
+                    if temp != self.first_date:
+                        self._is_regular.append(False)
+                    else:
+                        self._is_regular.append(True)
+                    seed = self.first_date
+                exit_date = self.termination_date
+                if self.next_to_last is not None:
+                    exit_date = self.next_to_last
+                while True:
+                    temp = NullCalendar().advance(
+                        seed, self.tenor * periods, self.convention
+                    )
+                    if temp > exit_date:
+                        # Checks if next_to_last is regular or not
+                        if self.next_to_last is not None:
+                            adjusted_back_date = self.calendar.adjust(
+                                self._dates[-1], self.convention
+                            )
+                            adjusted_next_to_last = self.calendar.adjust(
+                                self.next_to_last, self.convention
+                            )
+                            if adjusted_back_date != adjusted_next_to_last:
+                                self._dates.append(self.next_to_last)
+                                self._is_regular.append(False)
+                        break
+                    else:
+                        # Appends all other dates not related to first_date or next_to_last
+                        adjusted_back_date = self.calendar.adjust(
+                            self._dates[-1], self.convention
+                        )
+                        adjusted_temp = self.calendar.adjust(temp, self.convention)
+                        if adjusted_back_date != adjusted_temp:
+                            self._dates.append(temp)
+                            self._is_regular.append(True)
+                        periods += 1
+                    # Checks if termination_date is regular or not
+                adjusted_back_date = self.calendar.adjust(
+                    self._dates[-1], self.convention
+                )
+                adjusted_termination_date = self.calendar.adjust(
+                    self.termination_date, self.convention
+                )
+                if adjusted_back_date != adjusted_termination_date:
+                    self._dates.append(self.termination_date)
+                    self._is_regular.append(False)
+        # At last adjust the resulting dates
+        for idx, date in enumerate(self._dates):
+            self._dates[idx] = self.calendar.adjust(date, self.convention)
+
+        return self._dates
+
+
+CASES = [
+    # effective date, maturity, tenor, rule, first date, next to last
+    (Date(2023, 1, 31), "50Y", "1D", "forward", None, None),
+    (Date(2023, 1, 31), "50Y", "1W", "backward", None, None),
+    (Date(2023, 1, 31), "50Y", "1M", "forward", None, None),
+    (Date(2023, 1, 31), "30Y", "3M", "backward", None, None),
+    (Date(2023, 3, 15), "10Y", "6M", "forward", Date(2023, 6, 30), None),
+    (Date(2023, 3, 15), "10Y", "6M", "forward", None, Date(2032, 12, 30)),
+    (Date(2023, 3, 15), "10Y", "6M", "backward", Date(2023, 6, 30), None),
+    (Date(2023, 3, 15), "10Y", "6M", "backward", None, Date(2032, 12, 30)),
+]
+
+
+def _rule(rule):
+    return (
+        ql.DateGeneration.Forward if rule == "forward" else ql.DateGeneration.Backward
+    )
+
+
+def _ql_date(dt):
+    return ql.Date(dt.day_of_month(), dt.month(), dt.year())
+
+
+def build(cls, effective_date, maturity, tenor, rule, first_date, next_to_last):
+    return cls(
+        effective_date,
+        Tenor(maturity) + effective_date,
+        Tenor(tenor),
+        Sweden(),
+        BusinessDayConvention.MODIFIEDFOLLOWING,
+        BusinessDayConvention.MODIFIEDFOLLOWING,
+        rule,
+        False,
+        first_date,
+        next_to_last,
+    )
+
+
+def build_ql(effective_date, maturity, tenor, rule, first_date, next_to_last):
+    return ql.Schedule(
+        _ql_date(effective_date),
+        _ql_date(Tenor(maturity) + effective_date),
+        ql.Period(tenor),
+        ql.Sweden(),
+        ql.ModifiedFollowing,
+        ql.ModifiedFollowing,
+        _rule(rule),
+        False,
+        ql.Date() if first_date is None else _ql_date(first_date),
+        ql.Date() if next_to_last is None else _ql_date(next_to_last),
+    )
+
+
+def timeit(function, *args, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    # Warm up the business day tables so that neither generator pays for building them
+    build(Schedule, *CASES[0])
+    print(f"{'case':<42}{'dates':>8}{'legacy':>12}{'new':>12}{'speedup':>10}")
+    for case in CASES:
+        schedule = build(Schedule, *case)
+        legacy = build(LegacySchedule, *case)
+        assert schedule.dates == legacy.dates
+        assert schedule.is_regular == legacy.is_regular
+        if case[4] is None and case[5] is None:
+            ql_schedule = build_ql(*case)
+            assert [dt.ISO() for dt in schedule.dates] == [
+                dt.ISO() for dt in ql_schedule
+            ]
+            assert schedule.is_regular == list(ql_schedule.isRegular())
+        legacy_time = timeit(build, LegacySchedule, *case)
+        new_time = timeit(build, Schedule, *case)
+        name = f"{case[0]} {case[1]} {case[2]} {case[3]}"
+        if case[4] is not None:
+            name += f" first {case[4]}"
+        if case[5] is not None:
+            name += f" ntl {case[5]}"
+        print(
+            f"{name:<42}{len(schedule):>8}{legacy_time * 1e3:>10.2f}ms"
+            f"{new_time * 1e3:>10.2f}ms{legacy_time / new_time:>9.1f}x"
+        )
+
+    # A portfolio of trades, generated one schedule at a time and as a batch
+    effective_dates = [Date(2023, 1, 2) + idx for idx in range(0, 10000)]
+    termination_dates = [Tenor("10Y") + dt for dt in effective_dates]
+    start = time.perf_counter()
+    for effective_date, termination_date in zip(effective_dates, termination_dates):
+        Schedule(
+            effective_date,
+            termination_date,
+            Tenor("3M"),
+            Sweden(),
+            BusinessDayConvention.MODIFIEDFOLLOWING,
+            BusinessDayConvention.MODIFIEDFOLLOWING,
+            "forward",
+        )
+    loop_time = time.perf_counter() - start
+    batch_time = timeit(
+        Schedule.generate_many,
+        effective_dates,
+        termination_dates,
+        "3M",
+        Sweden(),
+        BusinessDayConvention.MODIFIEDFOLLOWING,
+        "forward",
+    )
+    print(
+        f"{'10000 trades 10Y 3M forward, batch':<42}{'':>8}{loop_time * 1e3:>10.2f}ms"
+        f"{batch_time * 1e3:>10.2f}ms{loop_time / batch_time:>9.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,26 @@
 from supersnabb.time.date import Date, Tenor
+from supersnabb.time.date_array import DateArray
 from supersnabb.time.calendars.sweden import Sweden
 from supersnabb.time.calendars.null_calendar import NullCalendar
+from supersnabb.time.calendars.joint_calendar import JointCalendar, JointCalendarRule
 from supersnabb.time.business_day_convention import BusinessDayConvention
-from supersnabb.time.schedule import Schedule
+from supersnabb.time.schedule import Schedule, ScheduleBatch
 from supersnabb.termstructure.curve import DiscountCurve
+from supersnabb.termstructure.scenario_curve import (
+    ScenarioCurve,
+    parallel_shift,
+    twist,
+    key_rate_shifts,
+)
 from supersnabb.termstructure.interpolation import Interpolation, InterpolationType
+from supersnabb.termstructure.rate_helpers import (
+    DepositRateHelper,
+    FraRateHelper,
+    SwapRateHelper,
+)
+from supersnabb.termstructure.bootstrap import Bootstrapper
+from supersnabb.quotes.simple_quote import SimpleQuote
+from supersnabb.math.dual import Dual
+from supersnabb.patterns.handle import RelinkableHandle
 from supersnabb.time.daycounters.act360 import ACT360
 from supersnabb.time.daycounters.act365 import ACT365
@@ -5,11 +5,14 @@ from supersnabb.time.daycounter import Daycounter
 from supersnabb.time.business_day_convention import BusinessDayConvention
 from supersnabb.time.calendar import Calendar
 from supersnabb.time.date import Tenor, Date
+from supersnabb.time.date_array import DateArray
 from supersnabb.termstructure.curve import DiscountCurve
+from supersnabb.patterns.observable import LazyObject
 from typing import Optional
+import numpy as np
 
 
-class FixedRateCoupon(Coupon):
+class FixedRateCoupon(Coupon, LazyObject):
     def __init__(
         self,
         payment_date: Date,
@@ -31,24 +34,35 @@ class FixedRateCoupon(Coupon):
         self.end_ref_date = end_ref_date
         self.daycount = daycount
         self.discount_curve = discount_curve
+        # The results are kept until the curve notifies a change
+        LazyObject.__init__(self)
+        self.register_with(discount_curve)
 
     @property
     def discount_factor(self):
-        return self.discount_curve(self.payment_date)
+        return self._cached(
+            "discount_factor", lambda: self.discount_curve(self.payment_date)
+        )
 
     @property
     def coupon(self):
-        return self.nominal * self.rate * self.discount_factor * self.accrual
+        return self._cached(
+            "coupon",
+            lambda: self.nominal * self.rate * self.discount_factor * self.accrual,
+        )
 
     @property
     def accrual(self):
-        return self.daycount().year_fraction(
-            self.start_accrual_date, self.end_accrual_date
+        return self._cached(
+            "accrual",
+            lambda: self.daycount().year_fraction(
+                self.start_accrual_date, self.end_accrual_date
+            ),
         )
 
     @property
     def amount(self):
-        return self.accrual * self.nominal * self.rate
+        return self._cached("amount", lambda: self.accrual * self.nominal * self.rate)
 
     @property
     def num_days(self):
@@ -57,9 +71,12 @@ class FixedRateCoupon(Coupon):
         )
 
 
-class FixedRateLeg:
+class FixedRateLeg(LazyObject):
     """
     # TODO: Implement ex coupon dates and varying of coupon rates
+
+    The discount factors, cashflows and NPV are calculated once and kept until the discount curve notifies a
+    change, e.g. when the handle the leg was built on is relinked to a new curve.
     """
 
     def __init__(
@@ -82,24 +99,92 @@ class FixedRateLeg:
         self.payment_lag = payment_lag
         self.discount_curve = discount_curve
         self.coupons = self._create_fixed_coupons()
+        LazyObject.__init__(self)
+        self.register_with(discount_curve)
+        # The dates and accruals do not depend on the market and are computed once
+        self._payment_dates = DateArray(
+            [coupon.payment_date for coupon in self.coupons]
+        )
+        self._start_accrual_dates = DateArray(
+            [coupon.start_accrual_date for coupon in self.coupons]
+        )
+        self._end_accrual_dates = DateArray(
+            [coupon.end_accrual_date for coupon in self.coupons]
+        )
+        self._accruals = self.fixed_daycount().year_fraction(
+            self._start_accrual_dates, self._end_accrual_dates
+        )
+
+    @property
+    def discount_factors(self) -> np.ndarray:
+        """
+        Returns the discount factor of the payment date of every coupon, looked up in one call to the curve.
+        """
+        return self._cached(
+            "discount_factors",
+            lambda: self.discount_curve.discount_factors(self._payment_dates),
+        )
 
     @property
     def cashflows(self):
-        _ = {}
-        for idx, coupon in enumerate(self.coupons):
-            _[idx] = {
+        return self._cached("cashflows", self._calculate_cashflows)
+
+    @property
+    def npv(self) -> float:
+        """
+        Returns the sum of the discounted coupons, one per scenario if the curve is a ScenarioCurve.
+        """
+        return self._cached(
+            "npv",
+            lambda: (self._accruals * self.nominal * self.fixed_rate)
+            @ self.discount_factors,
+        )
+
+    def key_rate_deltas(self, size: float = 0.0001) -> np.ndarray:
+        """
+        Returns the first order change of the NPV when the zero rate of each pillar of the discount curve is
+        shifted up by size, aligned with the dates of the curve. Each coupon is discounted off the two pillars
+        around its payment date, so all pillars come out of one pass over the coupons.
+
+        Parameters
+        ----------
+        size : float
+            The shift of the zero rates, e.g. 0.0001 for one basis point.
+        """
+        return self._cached(
+            f"key_rate_deltas_{size}",
+            lambda: self.discount_curve.key_rate_deltas(
+                self._payment_dates,
+                self._accruals * self.nominal * self.fixed_rate,
+                size,
+            ),
+        )
+
+    def dv01(self, size: float = 0.0001) -> float:
+        """
+        Returns the first order change of the NPV when every zero rate of the discount curve is shifted up by
+        size, the sum of the key rate deltas.
+        """
+        return float(self.key_rate_deltas(size).sum())
+
+    def _calculate_cashflows(self) -> pd.DataFrame:
+        discount_factors = self.discount_factors
+        amounts = self._accruals * self.nominal * self.fixed_rate
+        return pd.DataFrame(
+            {
                 "Notional": self.nominal,
                 "Rate": self.fixed_rate,
-                "Payment Date": coupon.payment_date,
-                "Start Accrual Date": coupon.start_accrual_date,
-                "End Accrual Date": coupon.end_accrual_date,
-                "Accrual": coupon.accrual,
-                "Discount Factor": coupon.discount_factor,
-                "Coupon": coupon.coupon,
-                "Amount": coupon.amount,
-                "Number of Days": coupon.num_days,
+                "Payment Date": [coupon.payment_date for coupon in self.coupons],
+                "Start Accrual Date": list(self._start_accrual_dates),
+                "End Accrual Date": list(self._end_accrual_dates),
+                "Accrual": self._accruals,
+                "Discount Factor": discount_factors,
+                "Coupon": amounts * discount_factors,
+                "Amount": amounts,
+                "Number of Days": self._end_accrual_dates.serial_number
+                - self._start_accrual_dates.serial_number,
             }
-        return pd.DataFrame.from_dict(_).T
+        )
 
     def _create_fixed_coupons(self) -> list:
         # Generate the first coupon
@@ -5,12 +5,15 @@ from supersnabb.time.daycounter import Daycounter
 from supersnabb.time.business_day_convention import BusinessDayConvention
 from supersnabb.time.calendar import Calendar
 from supersnabb.time.date import Tenor, Date
-from supersnabb.termstructure.curve import DiscountCurve
+from supersnabb.time.date_array import DateArray
+from supersnabb.termstructure.curve import DiscountCurve, _daycounter
 from supersnabb.indices.ibor_index import IborIndex
+from supersnabb.patterns.observable import LazyObject
 from typing import Optional
+import numpy as np
 
 
-class FloatRateCoupon(Coupon):
+class FloatRateCoupon(Coupon, LazyObject):
     def __init__(
         self,
         payment_date: Date,
@@ -32,30 +35,49 @@ class FloatRateCoupon(Coupon):
         self.daycount = daycount
         self.discount_curve = discount_curve
         self.ibor_index = ibor_index
+        # The results are kept until the curve or the index notifies a change
+        LazyObject.__init__(self)
+        self.register_with(discount_curve, ibor_index)
 
     @property
     def forward_rate(self) -> float:
-        return self.ibor_index.forecast_fixing_with_dates(
-            self.start_accrual_date, self.end_accrual_date
+        return self._cached(
+            "forward_rate",
+            lambda: self.ibor_index.forecast_fixing_with_dates(
+                self.start_accrual_date, self.end_accrual_date
+            ),
         )
 
     @property
     def discount_factor(self) -> float:
-        return self.discount_curve(self.payment_date)
+        return self._cached(
+            "discount_factor", lambda: self.discount_curve(self.payment_date)
+        )
 
     @property
     def coupon(self):
-        return self.nominal * self.forward_rate * self.discount_factor * self.accrual
+        return self._cached(
+            "coupon",
+            lambda: self.nominal
+            * self.forward_rate
+            * self.discount_factor
+            * self.accrual,
+        )
 
     @property
     def accrual(self):
-        return self.daycount().year_fraction(
-            self.start_accrual_date, self.end_accrual_date
+        return self._cached(
+            "accrual",
+            lambda: self.daycount().year_fraction(
+                self.start_accrual_date, self.end_accrual_date
+            ),
         )
 
     @property
     def amount(self):
-        return self.accrual * self.nominal * self.forward_rate
+        return self._cached(
+            "amount", lambda: self.accrual * self.nominal * self.forward_rate
+        )
 
     @property
     def num_days(self):
@@ -64,7 +86,12 @@ class FloatRateCoupon(Coupon):
         )
 
 
-class FloatRateLeg:
+class FloatRateLeg(LazyObject):
+    """
+    The discount factors, forward rates, cashflows and NPV are calculated once and kept until the discount curve
+    or the index notifies a change, e.g. when the handle the leg was built on is relinked to a new curve.
+    """
+
     def __init__(
         self,
         float_schedule: Schedule,
@@ -84,24 +111,135 @@ class FloatRateLeg:
         self.ibor_index = ibor_index
         self.calendar = self.ibor_index.fixing_calendar
         self.coupons = self._create_float_coupons()
+        LazyObject.__init__(self)
+        self.register_with(discount_curve, ibor_index)
+        # The dates and accruals do not depend on the market and are computed once
+        self._payment_dates = DateArray(
+            [coupon.payment_date for coupon in self.coupons]
+        )
+        self._start_accrual_dates = DateArray(
+            [coupon.start_accrual_date for coupon in self.coupons]
+        )
+        self._end_accrual_dates = DateArray(
+            [coupon.end_accrual_date for coupon in self.coupons]
+        )
+        self._accruals = self.float_daycount().year_fraction(
+            self._start_accrual_dates, self._end_accrual_dates
+        )
+
+    @property
+    def discount_factors(self) -> np.ndarray:
+        """
+        Returns the discount factor of the payment date of every coupon, looked up in one call to the curve.
+        """
+        return self._cached(
+            "discount_factors",
+            lambda: self.discount_curve.discount_factors(self._payment_dates),
+        )
+
+    @property
+    def forward_rates(self) -> np.ndarray:
+        """
+        Returns the forecast fixing of every coupon, forecast in one call to the index.
+        """
+        return self._cached(
+            "forward_rates",
+            lambda: self.ibor_index.forecast_fixings_with_dates(
+                self._start_accrual_dates, self._end_accrual_dates
+            ),
+        )
 
     @property
     def cashflows(self):
-        _ = {}
-        for idx, coupon in enumerate(self.coupons):
-            _[idx] = {
+        return self._cached("cashflows", self._calculate_cashflows)
+
+    @property
+    def npv(self) -> float:
+        """
+        Returns the sum of the discounted coupons, one per scenario if the curve is a ScenarioCurve.
+        """
+        return self._cached(
+            "npv",
+            lambda: (self._accruals * self.nominal)
+            @ (self.forward_rates * self.discount_factors),
+        )
+
+    def key_rate_deltas(self, size: float = 0.0001) -> np.ndarray:
+        """
+        Returns the first order change of the NPV when the zero rate of each pillar of the curve is shifted up by
+        size, aligned with the dates of the curve. The index must forecast on the discount curve, whose shift then
+        moves both the forward rates and the discount factors. Every discount factor depends on the two pillars
+        around its date, so all pillars come out of one pass over the coupons.
+
+        Parameters
+        ----------
+        size : float
+            The shift of the zero rates, e.g. 0.0001 for one basis point.
+        """
+        return self._cached(
+            f"key_rate_deltas_{size}", lambda: self._key_rate_deltas(size)
+        )
+
+    def dv01(self, size: float = 0.0001) -> float:
+        """
+        Returns the first order change of the NPV when every zero rate of the curve is shifted up by size, the
+        sum of the key rate deltas.
+        """
+        return float(self.key_rate_deltas(size).sum())
+
+    def _key_rate_deltas(self, size: float) -> np.ndarray:
+        if _linked(self.ibor_index.discount_curve) is not _linked(self.discount_curve):
+            raise ValueError(
+                "key rate deltas need the index to forecast on the discount curve"
+            )
+        start, end = self._start_accrual_dates, self._end_accrual_dates
+        start_discount, end_discount = np.split(
+            self.discount_curve.discount_factors(
+                np.concatenate((start.serial_number, end.serial_number))
+            ),
+            2,
+        )
+        fixing_accruals = np.asarray(
+            _daycounter(self.ibor_index.daycount).year_fraction(start, end),
+            dtype=np.float64,
+        )
+        # The NPV is the sum of c * F * D, with the forward F = (D_start / D_end - 1) / tau
+        c = self._accruals * self.nominal
+        discount_factors = self.discount_factors
+        gradient = np.concatenate(
+            (
+                c * self.forward_rates,
+                c * discount_factors / (fixing_accruals * end_discount),
+                -c
+                * discount_factors
+                * start_discount
+                / (fixing_accruals * end_discount**2),
+            )
+        )
+        dates = np.concatenate(
+            (self._payment_dates.serial_number, start.serial_number, end.serial_number)
+        )
+        return self.discount_curve.key_rate_deltas(dates, gradient, size)
+
+    def _calculate_cashflows(self) -> pd.DataFrame:
+        discount_factors = self.discount_factors
+        forward_rates = self.forward_rates
+        amounts = self._accruals * self.nominal * forward_rates
+        return pd.DataFrame(
+            {
                 "Notional": self.nominal,
-                "Payment Date": coupon.payment_date,
-                "Start Accrual Date": coupon.start_accrual_date,
-                "End Accrual Date": coupon.end_accrual_date,
-                "Accrual": coupon.accrual,
-                "Discount Factor": coupon.discount_factor,
-                "Coupon": coupon.coupon,
-                "Amount": coupon.amount,
-                "Number of Days": coupon.num_days,
-                "Forward Rate": coupon.forward_rate,
+                "Payment Date": [coupon.payment_date for coupon in self.coupons],
+                "Start Accrual Date": list(self._start_accrual_dates),
+                "End Accrual Date": list(self._end_accrual_dates),
+                "Accrual": self._accruals,
+                "Discount Factor": discount_factors,
+                "Coupon": amounts * discount_factors,
+                "Amount": amounts,
+                "Number of Days": self._end_accrual_dates.serial_number
+                - self._start_accrual_dates.serial_number,
+                "Forward Rate": forward_rates,
             }
-        return pd.DataFrame.from_dict(_).T
+        )
 
     def _create_float_coupons(self) -> list:
         # Generate the first coupon
@@ -186,3 +324,8 @@ class FloatRateLeg:
                 )
             )
         return coupons
+
+
+def _linked(curve: DiscountCurve) -> DiscountCurve:
+    # Handles are compared by the curve they link to
+    return getattr(curve, "current_link", curve)
@@ -1,12 +1,15 @@
 from supersnabb.indices.interest_rate_index import InterestRateIndex
 from supersnabb.time.date import Tenor, Date
+from supersnabb.time.date_array import DateArray
 from supersnabb.time.calendar import Calendar
 from supersnabb.time.business_day_convention import BusinessDayConvention
 from supersnabb.time.daycounter import Daycounter
 from supersnabb.termstructure.curve import DiscountCurve
+from supersnabb.patterns.observable import Observable, Observer
+import numpy as np
 
 
-class IborIndex(InterestRateIndex):
+class IborIndex(InterestRateIndex, Observable, Observer):
     def __init__(
         self,
         tenor: Tenor,
@@ -24,6 +27,13 @@ class IborIndex(InterestRateIndex):
         self.convention = convention
         self.daycount = daycount
         self.discount_curve = discount_curve
+        # Changes of the curve, e.g. relinking a handle, are passed on to whatever forecasts with the index
+        Observable.__init__(self)
+        Observer.__init__(self)
+        self.register_with(discount_curve)
+
+    def update(self):
+        self.notify_observers()
 
     def forecast_fixing_with_dates(self, d1: Date, d2: Date) -> float:
         t = self.daycount.year_fraction(d1, d2)
@@ -31,6 +41,14 @@ class IborIndex(InterestRateIndex):
         df2 = self.discount_curve(d2)
         return (df1 / df2 - 1) / t
 
+    def forecast_fixings_with_dates(
+        self, start_dates: DateArray, end_dates: DateArray
+    ) -> np.ndarray:
+        """
+        Forecasts the fixings of many periods at once, see forecast_fixing_with_dates.
+        """
+        return self.discount_curve.forward_rates(start_dates, end_dates, self.daycount)
+
     def maturity_date(self, date: Date) -> Date:
         return self.fixing_calendar.advance(date, self.tenor, self.convention)
 
@@ -0,0 +1,262 @@
+from __future__ import annotations
+from typing import Any, Optional, Sequence, Union
+import numpy as np
+
+
+class Dual:
+    """
+    A dual number for forward mode algorithmic differentiation. A dual holds a value, a float or an array, and
+    the derivatives of every element of the value with respect to a fixed set of inputs, so that one evaluation
+    of a formula on duals returns its value together with its exact gradient.
+
+    Arithmetic with floats, arrays and other duals, numpy.exp, numpy.log, numpy.sqrt, numpy.where and matrix
+    products are supported, which covers the interpolation kernels, the curves, the indices and the coupons.
+
+    Parameters
+    ----------
+    value : float or numpy.ndarray
+        The value.
+    gradient : numpy.ndarray
+        The derivatives of the value, with the shape of the value followed by the number of inputs.
+    """
+
+    __slots__ = ("value", "gradient")
+    __hash__ = None
+
+    def __init__(self, value: Union[float, np.ndarray], gradient: np.ndarray):
+        self.value = np.asarray(value, dtype=np.float64)
+        self.gradient = np.asarray(gradient, dtype=np.float64)
+        if self.gradient.shape[:-1] != self.value.shape:
+            raise ValueError(
+                f"gradient of shape {self.gradient.shape} does not match value of shape {self.value.shape}"
+            )
+
+    @classmethod
+    def variables(cls, values: Sequence[float]) -> Dual:
+        """
+        Returns the given values as the inputs to differentiate with respect to, each the derivative of itself.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        return cls(values, np.eye(len(values)))
+
+    def __repr__(self) -> str:
+        return f"Dual({self.value}, {self.gradient})"
+
+    @property
+    def shape(self) -> tuple:
+        return self.value.shape
+
+    @property
+    def ndim(self) -> int:
+        return self.value.ndim
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __getitem__(self, key) -> Dual:
+        return Dual(self.value[key], self.gradient[key])
+
+    def __neg__(self) -> Dual:
+        return Dual(-self.value, -self.gradient)
+
+    def __add__(self, other: Any) -> Dual:
+        return _add(self, other)
+
+    def __radd__(self, other: Any) -> Dual:
+        return _add(other, self)
+
+    def __sub__(self, other: Any) -> Dual:
+        return _add(self, -other)
+
+    def __rsub__(self, other: Any) -> Dual:
+        return _add(other, -self)
+
+    def __mul__(self, other: Any) -> Dual:
+        return _multiply(self, other)
+
+    def __rmul__(self, other: Any) -> Dual:
+        return _multiply(other, self)
+
+    def __truediv__(self, other: Any) -> Dual:
+        return _multiply(self, _reciprocal(other))
+
+    def __rtruediv__(self, other: Any) -> Dual:
+        return _multiply(other, _reciprocal(self))
+
+    def __pow__(self, exponent: Any) -> Dual:
+        return _power(self, exponent)
+
+    def __rpow__(self, base: Any) -> Dual:
+        return _exp(_multiply(_log(base), self))
+
+    def __matmul__(self, other: Any) -> Dual:
+        return _matmul(self, other)
+
+    def __rmatmul__(self, other: Any) -> Dual:
+        return _matmul(other, self)
+
+    # Comparisons are made on the values, e.g. to locate dates or choose branches
+    def __lt__(self, other: Any) -> np.ndarray:
+        return self.value < _value_of(other)
+
+    def __le__(self, other: Any) -> np.ndarray:
+        return self.value <= _value_of(other)
+
+    def __gt__(self, other: Any) -> np.ndarray:
+        return self.value > _value_of(other)
+
+    def __ge__(self, other: Any) -> np.ndarray:
+        return self.value >= _value_of(other)
+
+    def sum(self, axis: Optional[int] = None) -> Dual:
+        if axis is None:
+            return Dual(
+                self.value.sum(),
+                self.gradient.reshape(-1, self.gradient.shape[-1]).sum(axis=0),
+            )
+        axis = axis % self.value.ndim
+        return Dual(self.value.sum(axis=axis), self.gradient.sum(axis=axis))
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # Numpy hands mixed operations with arrays and its functions on duals over to the dual
+        if method != "__call__" or kwargs:
+            return NotImplemented
+        match ufunc:
+            case np.add:
+                return _add(*inputs)
+            case np.subtract:
+                return _add(inputs[0], -inputs[1])
+            case np.multiply:
+                return _multiply(*inputs)
+            case np.true_divide:
+                return _multiply(inputs[0], _reciprocal(inputs[1]))
+            case np.power:
+                return _power(*inputs)
+            case np.negative:
+                return -inputs[0]
+            case np.exp:
+                return _exp(inputs[0])
+            case np.log:
+                return _log(inputs[0])
+            case np.sqrt:
+                return _power(inputs[0], 0.5)
+            case np.matmul:
+                return _matmul(*inputs)
+        return NotImplemented
+
+    def __array_function__(self, func, types, args, kwargs):
+        if func is np.where:
+            return _where(*args, **kwargs)
+        if func is np.ndim:
+            return self.ndim
+        if func is np.shape:
+            return self.shape
+        if func is np.split:
+            return _split(*args, **kwargs)
+        return NotImplemented
+
+
+def _value_of(x: Any) -> np.ndarray:
+    return x.value if isinstance(x, Dual) else np.asarray(x, dtype=np.float64)
+
+
+def _constant_gradient(x: Any) -> np.ndarray:
+    # A constant broadcasts against the gradients with a trailing axis of length one
+    return np.asarray(x, dtype=np.float64)[..., None]
+
+
+def _broadcast(dual: Dual, shape: tuple) -> np.ndarray:
+    return np.broadcast_to(dual.gradient, shape + dual.gradient.shape[-1:])
+
+
+def _add(a: Any, b: Any) -> Dual:
+    value = _value_of(a) + _value_of(b)
+    if not isinstance(b, Dual):
+        return Dual(value, _broadcast(a, value.shape))
+    if not isinstance(a, Dual):
+        return Dual(value, _broadcast(b, value.shape))
+    return Dual(value, a.gradient + b.gradient)
+
+
+def _multiply(a: Any, b: Any) -> Dual:
+    value = _value_of(a) * _value_of(b)
+    if not isinstance(b, Dual):
+        return Dual(value, a.gradient * _constant_gradient(b))
+    if not isinstance(a, Dual):
+        return Dual(value, _constant_gradient(a) * b.gradient)
+    return Dual(
+        value,
+        a.gradient * _constant_gradient(b.value)
+        + _constant_gradient(a.value) * b.gradient,
+    )
+
+
+def _reciprocal(x: Any) -> Any:
+    if not isinstance(x, Dual):
+        return 1 / np.asarray(x, dtype=np.float64)
+    value = 1 / x.value
+    return Dual(value, -x.gradient * _constant_gradient(value * value))
+
+
+def _power(base: Any, exponent: Any) -> Dual:
+    if isinstance(exponent, Dual):
+        return _exp(_multiply(exponent, _log(base)))
+    exponent = np.asarray(exponent, dtype=np.float64)
+    value = base.value**exponent
+    return Dual(
+        value,
+        base.gradient * _constant_gradient(exponent * base.value ** (exponent - 1)),
+    )
+
+
+def _exp(x: Dual) -> Dual:
+    value = np.exp(x.value)
+    return Dual(value, x.gradient * _constant_gradient(value))
+
+
+def _log(x: Any) -> Any:
+    if not isinstance(x, Dual):
+        return np.log(np.asarray(x, dtype=np.float64))
+    return Dual(np.log(x.value), x.gradient * _constant_gradient(1 / x.value))
+
+
+def _where(condition: Any, a: Any, b: Any) -> Dual:
+    condition = np.asarray(condition)
+    n = (a if isinstance(a, Dual) else b).gradient.shape[-1]
+    value = np.where(condition, _value_of(a), _value_of(b))
+
+    def gradient(x):
+        if isinstance(x, Dual):
+            return x.gradient
+        return np.zeros(np.shape(x) + (n,))
+
+    return Dual(
+        value,
+        np.where(condition[..., None], gradient(a), gradient(b)),
+    )
+
+
+def _split(x: Dual, sections: Any, axis: int = 0) -> list:
+    axis = axis % x.ndim
+    return [
+        Dual(value, gradient)
+        for value, gradient in zip(
+            np.split(x.value, sections, axis), np.split(x.gradient, sections, axis)
+        )
+    ]
+
+
+def _matmul(a: Any, b: Any) -> Dual:
+    """
+    Matrix products of a vector or a matrix with a vector, the first axis of b is contracted.
+    """
+    value = _value_of(a) @ _value_of(b)
+    gradient = 0
+    if isinstance(a, Dual):
+        # Contracting the last value axis of a, which is the second to last axis of its gradient
+        gradient = gradient + np.moveaxis(
+            np.tensordot(a.gradient, _value_of(b), axes=([-2], [0])), a.ndim - 1, -1
+        )
+    if isinstance(b, Dual):
+        gradient = gradient + np.tensordot(_value_of(a), b.gradient, axes=([-1], [0]))
+    return Dual(value, gradient)
@@ -0,0 +1,62 @@
+from supersnabb.patterns.observable import Observable, Observer
+from typing import Any, Optional
+
+
+class RelinkableHandle(Observable, Observer):
+    """
+    A shared reference to a market object, e.g. a discount curve, that can be relinked to another object. Objects
+    built on the handle see the new link and are notified when it is relinked or when the linked object changes.
+
+    Attribute lookups and calls are forwarded to the linked object, so a handle can be passed wherever the object
+    itself is expected.
+
+    Parameters
+    ----------
+    link : Any, optional
+        The object to link to.
+    """
+
+    def __init__(self, link: Optional[Any] = None):
+        Observable.__init__(self)
+        Observer.__init__(self)
+        self._link = None
+        self.link_to(link)
+
+    def __repr__(self) -> str:
+        return f"RelinkableHandle({self._link!r})"
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes the handle does not have itself
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.current_link, name)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.current_link(*args, **kwargs)
+
+    @property
+    def empty(self) -> bool:
+        return self._link is None
+
+    @property
+    def current_link(self) -> Any:
+        """
+        Returns the linked object.
+        """
+        if self._link is None:
+            raise ValueError("empty handle cannot be dereferenced")
+        return self._link
+
+    def link_to(self, link: Optional[Any]):
+        """
+        Links the handle to another object and notifies the observers of the handle.
+        """
+        if link is self._link:
+            return
+        self.unregister_with(self._link)
+        self._link = link
+        self.register_with(link)
+        self.notify_observers()
+
+    def update(self):
+        self.notify_observers()
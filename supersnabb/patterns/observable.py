@@ -0,0 +1,85 @@
+from typing import Any, Callable, Dict
+import weakref
+
+
+class Observable:
+    """
+    An object that notifies its observers when it changes. Observers are held by weak references, so observing an
+    object does not keep the observer alive.
+    """
+
+    def __init__(self):
+        self._observers = weakref.WeakSet()
+
+    def register_observer(self, observer: "Observer"):
+        self._observers.add(observer)
+
+    def unregister_observer(self, observer: "Observer"):
+        self._observers.discard(observer)
+
+    def notify_observers(self):
+        """
+        Calls update on every observer.
+        """
+        for observer in list(self._observers):
+            observer.update()
+
+
+class Observer:
+    """
+    An object that is updated when any of the observables it is registered with changes.
+    """
+
+    def __init__(self):
+        self._observables = []
+
+    def register_with(self, *observables: Any):
+        """
+        Registers with the given observables. Objects that are not observable, e.g. None or a plain float, are
+        ignored, so market data can be passed either as observables or as fixed values.
+        """
+        for observable in observables:
+            if isinstance(observable, Observable) and not any(
+                observable is registered for registered in self._observables
+            ):
+                observable.register_observer(self)
+                self._observables.append(observable)
+
+    def unregister_with(self, observable: Any):
+        if isinstance(observable, Observable):
+            observable.unregister_observer(self)
+            self._observables = [
+                registered
+                for registered in self._observables
+                if registered is not observable
+            ]
+
+    def update(self):
+        pass
+
+
+class LazyObject(Observable, Observer):
+    """
+    An object whose results are calculated the first time they are requested and kept until one of the
+    observables it is registered with changes, at which point they are discarded and the change is passed on
+    to its own observers.
+    """
+
+    def __init__(self):
+        Observable.__init__(self)
+        Observer.__init__(self)
+        self._results: Dict[str, Any] = {}
+
+    def update(self):
+        self._results.clear()
+        self.notify_observers()
+
+    def _cached(self, name: str, calculate: Callable[[], Any]) -> Any:
+        """
+        Returns the result of the given name, calculating it if it has not been calculated since the last change.
+        """
+        try:
+            return self._results[name]
+        except KeyError:
+            result = self._results[name] = calculate()
+            return result
@@ -0,0 +1,38 @@
+from supersnabb.patterns.observable import Observable
+
+
+class SimpleQuote(Observable):
+    """
+    A market quote whose observers are notified when its value is set.
+
+    Parameters
+    ----------
+    value : float
+        The value of the quote.
+    """
+
+    def __init__(self, value: float):
+        super().__init__()
+        self._value = value
+
+    def __repr__(self) -> str:
+        return f"SimpleQuote({self._value})"
+
+    def __float__(self) -> float:
+        return float(self._value)
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    @value.setter
+    def value(self, value: float):
+        self.set_value(value)
+
+    def set_value(self, value: float):
+        """
+        Sets the value of the quote, notifying the observers if it changed.
+        """
+        if value != self._value:
+            self._value = value
+            self.notify_observers()
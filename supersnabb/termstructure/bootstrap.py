@@ -0,0 +1,186 @@
+from supersnabb.time.date import Date
+from supersnabb.time.calendar import Calendar
+from supersnabb.time.daycounter import Daycounter
+from supersnabb.termstructure.curve import DiscountCurve
+from supersnabb.termstructure.interpolation import InterpolationType
+from supersnabb.termstructure.rate_helpers import RateHelper
+from typing import List, Optional, Sequence
+import numpy as np
+import time
+
+# The guess of the first pillar is discounted with the quote of its helper over this many days a year
+_GUESS_DAYS_PER_YEAR = 365.0
+
+
+class Bootstrapper:
+    """
+    Bootstraps the discount factors of a curve from a set of rate helpers. The pillars are the reference date,
+    whose discount factor is one, and the pillar date of each helper. They are solved one at a time in order of
+    maturity with Newton iterations, each helper repricing off the pillars already solved and the one being
+    solved, whose derivative is known analytically.
+
+    The dates, year fractions and interpolation weights of every helper are computed once when the bootstrapper
+    is created, so that bootstrapping again after the quotes change only repeats the Newton iterations. A pillar
+    only depends on the quotes of its own helper and those maturing before it, so in incremental mode a bootstrap
+    keeps the solved pillars before the first helper whose quote changed and only re-solves the rest.
+
+    Parameters
+    ----------
+    reference_date : Date
+        The reference date of the curve.
+    helpers : Sequence[RateHelper]
+        The rate helpers, at most one per pillar date.
+    daycount : Daycounter
+        The daycounter of the curve.
+    calendar : Calendar
+        The calendar of the curve.
+    interpolation : InterpolationType
+        The interpolation of the discount factors, either linear or log-linear.
+    accuracy : float
+        The largest accepted difference between the quote and the quote implied by the curve.
+    max_iterations : int
+        The largest number of Newton iterations per pillar.
+    incremental : bool
+        Whether to only re-solve the pillars affected by the quotes that changed since the last bootstrap.
+    """
+
+    def __init__(
+        self,
+        reference_date: Date,
+        helpers: Sequence[RateHelper],
+        daycount: Daycounter,
+        calendar: Calendar,
+        interpolation: InterpolationType = InterpolationType.LOGLINEAR,
+        accuracy: float = 1e-12,
+        max_iterations: int = 100,
+        incremental: bool = False,
+    ):
+        self.interpolation = InterpolationType(interpolation)
+        if self.interpolation not in (
+            InterpolationType.LINEAR,
+            InterpolationType.LOGLINEAR,
+        ):
+            raise ValueError(
+                f"bootstrapping supports linear and log-linear interpolation, received: {interpolation}"
+            )
+        self.reference_date = reference_date
+        self.daycount = daycount
+        self.calendar = calendar
+        self.accuracy = accuracy
+        self.max_iterations = max_iterations
+        self.incremental = incremental
+        for helper in helpers:
+            helper.setup(reference_date)
+        self.helpers: List[RateHelper] = sorted(
+            helpers, key=lambda helper: helper.pillar_date
+        )
+        self.dates = [reference_date] + [helper.pillar_date for helper in self.helpers]
+        self.x = np.array([dt.serial_number for dt in self.dates], dtype=np.float64)
+        if np.any(np.diff(self.x) <= 0):
+            raise ValueError(
+                "the pillar dates of the helpers must be distinct and after the reference date"
+            )
+        for helper in self.helpers:
+            if helper.serial_numbers.min() < reference_date.serial_number:
+                raise ValueError(f"{helper} depends on dates before the reference date")
+        # The segment and the weight of every date of every helper, a helper only depends on the pillars up to
+        # and including its own, so its dates are located among those
+        self._segments = []
+        self._weights = []
+        for k, helper in enumerate(self.helpers, start=1):
+            x = self.x[: k + 1]
+            idx = np.clip(
+                np.searchsorted(x, helper.serial_numbers, side="right") - 1, 0, k - 1
+            )
+            self._segments.append(idx)
+            self._weights.append(
+                (helper.serial_numbers - x[idx]) / (x[idx + 1] - x[idx])
+            )
+        self.discount_factors = np.ones(len(self.dates))
+        self.iterations: List[int] = []
+        self.recomputed = 0
+        self.elapsed = 0.0
+        self.curve: Optional[DiscountCurve] = None
+        # The quotes the current curve was solved for
+        self._quotes: Optional[np.ndarray] = None
+
+    def bootstrap(self) -> DiscountCurve:
+        """
+        Solves the discount factor of every pillar and returns the bootstrapped curve. In incremental mode only
+        the pillars from the first helper whose quote changed since the last bootstrap are solved, starting from
+        their previous discount factors. The number of Newton iterations of each pillar, the number of pillars
+        solved by the last bootstrap and its wall time in seconds are kept in iterations, recomputed and elapsed.
+        """
+        started = time.perf_counter()
+        quotes = np.array([helper.quote for helper in self.helpers], dtype=np.float64)
+        warm = self.incremental and self._quotes is not None
+        first = 1
+        if warm:
+            changed = np.flatnonzero(quotes != self._quotes)
+            first = changed[0] + 1 if len(changed) else len(self.dates)
+        y = self.discount_factors
+        y[0] = 1.0
+        del self.iterations[first - 1 :]
+        for k in range(first, len(y)):
+            self._solve(k, warm)
+        self._quotes = quotes
+        self.recomputed = len(y) - first
+        if self.recomputed or self.curve is None:
+            self.curve = DiscountCurve(
+                self.dates, list(y), self.daycount, self.calendar, self.interpolation
+            )
+        self.elapsed = time.perf_counter() - started
+        return self.curve
+
+    def _solve(self, k: int, warm: bool = False):
+        """
+        Solves the discount factor of pillar k with Newton iterations, the pillars before it are already solved.
+        A warm solve starts from the current discount factor of the pillar instead of extending the curve.
+        """
+        helper = self.helpers[k - 1]
+        idx, w = self._segments[k - 1], self._weights[k - 1]
+        free = idx + 1 == k
+        y = self.discount_factors
+        if not warm:
+            y[k] = self._guess(k, helper)
+        for iteration in range(1, self.max_iterations + 1):
+            discount_factors, derivatives = self._discount(y, idx, w)
+            implied, gradient = helper.implied_quote(discount_factors)
+            residual = implied - helper.quote
+            if abs(residual) <= self.accuracy:
+                self.iterations.append(iteration - 1)
+                return
+            slope = gradient[free] @ derivatives[free]
+            if slope == 0:
+                break
+            step = residual / slope
+            # Keep the discount factor positive, halving the distance to zero when a step would cross it
+            y[k] = y[k] - step if y[k] - step > 0 else y[k] / 2
+        raise RuntimeError(
+            f"the bootstrap did not converge for {helper} at the pillar {self.dates[k]}"
+        )
+
+    def _guess(self, k: int, helper: RateHelper) -> float:
+        """
+        Extends the forward of the previous segment to pillar k, or discounts the first pillar with the quote.
+        """
+        x, y = self.x, self.discount_factors
+        if k == 1:
+            return float(np.exp(-helper.quote * (x[1] - x[0]) / _GUESS_DAYS_PER_YEAR))
+        return float(
+            y[k - 1]
+            * (y[k - 1] / y[k - 2]) ** ((x[k] - x[k - 1]) / (x[k - 1] - x[k - 2]))
+        )
+
+    def _discount(self, y: np.ndarray, idx: np.ndarray, w: np.ndarray) -> tuple:
+        """
+        Returns the interpolated discount factors at the given segments and weights, and their derivatives with
+        respect to the discount factor at the end of each segment.
+        """
+        y_begin, y_end = y[idx], y[idx + 1]
+        match self.interpolation:
+            case InterpolationType.LINEAR:
+                return y_begin + w * (y_end - y_begin), w
+            case InterpolationType.LOGLINEAR:
+                discount_factors = y_begin * (y_end / y_begin) ** w
+                return discount_factors, w * discount_factors / y_end
@@ -1,16 +1,23 @@
 from supersnabb.time.date import Date
+from supersnabb.time.date_array import DateArray
 from supersnabb.time.calendar import Calendar
 from supersnabb.time.daycounter import Daycounter
 from supersnabb.termstructure.interpolation import InterpolationType, Interpolation
-from typing import List
+from supersnabb.patterns.observable import Observable
+from supersnabb.math.dual import Dual
+from typing import List, Sequence, Union
+import numpy as np
 import pandas as pd
 
+# The time used for the zero rate at the reference date, as in QuantLib
+_ZERO_RATE_DT = 0.0001
+
 
 class ForwardCurve(Interpolation):
     pass
 
 
-class DiscountCurve(Interpolation):
+class DiscountCurve(Interpolation, Observable):
     def __init__(
         self,
         dates: List[Date],
@@ -18,18 +25,66 @@ class DiscountCurve(Interpolation):
         daycount: Daycounter,
         calendar: Calendar,
         interpolation: InterpolationType = InterpolationType.LINEAR,
+        dense: bool = False,
     ):
+        if dense and isinstance(rates, Dual):
+            # The daily grid is looked up as floats
+            raise ValueError("Dense curves are not supported for dual rates")
         super().__init__(
             dates=dates, rates=rates, daycount=daycount, interpolation=interpolation
         )
+        Observable.__init__(self)
         self.dates = dates
         self.rates = rates
         self.daycount = daycount
         self.calendar = calendar
+        # In dense mode the discount factor of every day from the reference date to the last pillar is
+        # interpolated once, so that looking up a whole day is a single index
+        self._grid = None
+        if dense:
+            self._grid = super().interpolate_many(
+                np.arange(self.x[0], self.x[-1] + 1, dtype=np.float64)
+            )
+
+    @property
+    def dense(self) -> bool:
+        """
+        Returns True if the curve looks up whole days in a daily grid of discount factors.
+        """
+        return self._grid is not None
 
     def interpolate(self, date: Date) -> float:
+        if self._grid is not None:
+            offset = date.serial_number - int(self.x[0])
+            if 0 <= offset < len(self._grid):
+                return float(self._grid[offset])
         return super().interpolate(date)
 
+    def interpolate_many(self, dates: Union[DateArray, np.ndarray]) -> np.ndarray:
+        """
+        Interpolates the values of many dates at once. In dense mode whole days within the grid are looked up
+        directly, other dates fall back to the interpolation.
+
+        Parameters
+        ----------
+        dates : DateArray or numpy.ndarray
+            The dates to interpolate, either as a DateArray or as serial numbers.
+        """
+        if self._grid is None:
+            return super().interpolate_many(dates)
+        x = np.asarray(dates)
+        offsets = x - int(self.x[0])
+        in_grid = (offsets >= 0) & (offsets < len(self._grid))
+        if not np.issubdtype(x.dtype, np.integer):
+            # Fractions of a day, e.g. the zero rate at the reference date, are interpolated
+            in_grid &= offsets == np.floor(offsets)
+        if np.all(in_grid):
+            return self._grid[offsets.astype(np.intp)]
+        values = np.empty(x.shape, dtype=np.float64)
+        values[in_grid] = self._grid[offsets[in_grid].astype(np.intp)]
+        values[~in_grid] = super().interpolate_many(x[~in_grid])
+        return values
+
     @property
     def curve(self):
         return pd.DataFrame({"dates": self.dates, "rates": self.rates}).set_index(
@@ -39,6 +94,140 @@ class DiscountCurve(Interpolation):
     def __call__(self, date: Date) -> float:
         return self.interpolate(date)
 
+    @property
+    def reference_date(self) -> Date:
+        """
+        Returns the reference date of the curve, the date of its first pillar.
+        """
+        return self.dates[0]
+
+    def pillar_times(self) -> np.ndarray:
+        """
+        Returns the time of every pillar from the reference date, measured by the daycounter of the curve.
+        """
+        return np.asarray(
+            _daycounter(self.daycount).year_fraction(
+                DateArray([self.reference_date] * len(self.dates)),
+                DateArray(self.dates),
+            ),
+            dtype=np.float64,
+        )
+
+    def key_rate_deltas(
+        self,
+        dates: Union[DateArray, np.ndarray, Sequence[Date]],
+        gradient: np.ndarray,
+        size: float = 0.0001,
+    ) -> np.ndarray:
+        """
+        Returns the first order change of a value when the continuously compounded zero rate of each pillar is
+        shifted up by size, given the derivatives of the value with respect to the discount factors of some dates.
+        The interpolation maps the derivatives onto the pillars, so every pillar comes out of one pass.
+
+        Parameters
+        ----------
+        dates : DateArray, numpy.ndarray or sequence of Date
+            The dates the value depends on, as dates or serial numbers.
+        gradient : numpy.ndarray
+            The derivative of the value with respect to the discount factor of each date.
+        size : float
+            The shift of the zero rates, e.g. 0.0001 for one basis point.
+
+        Returns
+        -------
+        The change of the value for each pillar, aligned with the dates of the curve.
+        """
+        pillar_gradient = gradient @ self.pillar_sensitivities(_serial_numbers(dates))
+        # A zero rate shift moves the discount factor of a pillar at time t by -t * size to first order
+        return pillar_gradient * self.y * -self.pillar_times() * size
+
+    def discount_factors(
+        self, dates: Union[DateArray, np.ndarray, Sequence[Date]]
+    ) -> np.ndarray:
+        """
+        Returns the discount factors of many dates in one vectorized pass.
+
+        Parameters
+        ----------
+        dates : DateArray, numpy.ndarray or sequence of Date
+            The dates to discount to, as dates or serial numbers.
+        """
+        return self.interpolate_many(_serial_numbers(dates))
+
+    def zero_rates(
+        self, dates: Union[DateArray, np.ndarray, Sequence[Date]]
+    ) -> np.ndarray:
+        """
+        Returns the continuously compounded zero rates of many dates, with time measured by the daycounter of the
+        curve from its reference date. Like QuantLib, the rate at the reference date is taken over a short time.
+
+        Parameters
+        ----------
+        dates : DateArray, numpy.ndarray or sequence of Date
+            The dates of the zero rates, as dates or serial numbers.
+        """
+        serials = _serial_numbers(dates)
+        reference = self.reference_date.serial_number
+        daycount = _daycounter(self.daycount)
+        t = daycount.year_fraction(
+            DateArray.from_serials(np.full_like(serials, reference)),
+            DateArray.from_serials(serials),
+        )
+        t = np.asarray(t, dtype=np.float64)
+        at_reference = t == 0
+        if np.any(at_reference):
+            day = daycount.year_fraction(self.reference_date, self.reference_date + 1)
+            t = np.where(at_reference, _ZERO_RATE_DT, t)
+            x = np.where(at_reference, reference + _ZERO_RATE_DT / day, serials)
+        else:
+            x = serials
+        discount_factors = self.interpolate_many(x)
+        return -np.log(discount_factors) / _per_date(t, discount_factors)
+
+    def forward_rates(
+        self,
+        start_dates: Union[DateArray, np.ndarray, Sequence[Date]],
+        end_dates: Union[DateArray, np.ndarray, Sequence[Date]],
+        daycounter: Daycounter,
+    ) -> np.ndarray:
+        """
+        Returns the simply compounded forward rates between many pairs of dates in one vectorized pass.
+
+        Parameters
+        ----------
+        start_dates : DateArray, numpy.ndarray or sequence of Date
+            The start date of each forward period, as dates or serial numbers.
+        end_dates : DateArray, numpy.ndarray or sequence of Date
+            The end date of each forward period, as dates or serial numbers.
+        daycounter : Daycounter
+            The daycounter of the forward rates.
+        """
+        start = DateArray.from_serials(_serial_numbers(start_dates))
+        end = DateArray.from_serials(_serial_numbers(end_dates))
+        t = _daycounter(daycounter).year_fraction(start, end)
+        discount_factors = self.interpolate_many(
+            np.concatenate((start.serial_number, end.serial_number))
+        )
+        start_discount, end_discount = np.split(discount_factors, 2)
+        return (start_discount / end_discount - 1) / _per_date(t, start_discount)
+
 
 class Curve:
     pass
+
+
+def _serial_numbers(dates: Union[DateArray, np.ndarray, Sequence[Date]]) -> np.ndarray:
+    if isinstance(dates, (DateArray, np.ndarray)):
+        return np.asarray(dates)
+    return DateArray(dates).serial_number
+
+
+def _per_date(t: np.ndarray, values: np.ndarray) -> np.ndarray:
+    # Values with a trailing scenario axis, see ScenarioCurve, take the same time for every scenario
+    t = np.asarray(t, dtype=np.float64)
+    return t.reshape(t.shape + (1,) * (np.ndim(values) - t.ndim))
+
+
+def _daycounter(daycount: Daycounter) -> Daycounter:
+    # Daycounters are passed both as classes and as instances
+    return daycount() if isinstance(daycount, type) else daycount
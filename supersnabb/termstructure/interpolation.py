@@ -1,15 +1,21 @@
-from typing import List
+from __future__ import annotations
+from typing import List, Union
 from supersnabb.time.date import Date
+from supersnabb.time.date_array import DateArray
 from supersnabb.time.calendar import Calendar
 from supersnabb.time.daycounter import Daycounter
+from supersnabb.math.dual import Dual
 from enum import StrEnum, auto
-from bisect import bisect_right
+import numpy as np
 
 
 class InterpolationType(StrEnum):
     LINEAR = auto()
     LOGLINEAR = auto()
     FLATFORWARD = auto()
+    NATURALCUBIC = auto()
+    MONOTONECUBIC = auto()
+    MONOTONECONVEX = auto()
 
 
 class Interpolation:
@@ -27,52 +33,139 @@ class Interpolation:
                 self.interpolation_method = self._log_linear_interpolation
             case InterpolationType.FLATFORWARD:
                 self.interpolation_method = self._flat_forward
+            case InterpolationType.NATURALCUBIC | InterpolationType.MONOTONECUBIC:
+                self.interpolation_method = self._cubic
+            case InterpolationType.MONOTONECONVEX:
+                self.interpolation_method = self._monotone_convex
             case _:
                 raise ValueError(
                     f"Interpolation type not supported received: {interpolation}"
                 )
+        if len(dates) != len(rates):
+            raise ValueError("dates and rates must have the same length")
+        if len(dates) < 2:
+            raise ValueError("at least two pillars are needed to interpolate")
         self.dates = dates
         self.rates = rates
         self.daycount = daycount
+        # The pillars as arrays, built once and shared by every interpolation
+        self.x = np.array([dt.serial_number for dt in dates], dtype=np.float64)
+        if isinstance(rates, Dual):
+            # Dual rates carry their derivatives through the kernels of the local interpolations
+            if interpolation not in (
+                InterpolationType.LINEAR,
+                InterpolationType.LOGLINEAR,
+                InterpolationType.FLATFORWARD,
+            ):
+                raise ValueError(
+                    f"Interpolation type not supported for dual rates received: {interpolation}"
+                )
+            self.y = rates
+        else:
+            self.y = np.array(rates, dtype=np.float64)
+        if np.any(np.diff(self.x) <= 0):
+            raise ValueError("dates must be strictly increasing")
+        self.interpolation = InterpolationType(interpolation)
+        # The coefficient tables of the spline types, solved once for all segments
+        match self.interpolation:
+            case InterpolationType.NATURALCUBIC:
+                self._coefficients = _hermite_coefficients(
+                    self.x, self.y, _natural_spline_slopes(self.x, self.y)
+                )
+            case InterpolationType.MONOTONECUBIC:
+                slopes = _hyman_filter(
+                    self.x, self.y, _natural_spline_slopes(self.x, self.y)
+                )
+                self._coefficients = _hermite_coefficients(self.x, self.y, slopes)
+            case InterpolationType.MONOTONECONVEX:
+                self._coefficients = _monotone_convex_coefficients(self.x, self.y)
 
-    def interpolate(self, date: Date) -> int:
-        right_node = self._locate(
-            date.serial_number, [dates.serial_number for dates in self.dates]
-        )
-        left_node = (
-            right_node
-            if (right_node == 0) | (right_node == len(self.dates))
-            else right_node - 1
-        )
+    def interpolate(self, date: Date) -> Union[float, Dual]:
+        value = self._evaluate(date.serial_number, self._locate(date.serial_number))
+        return value if isinstance(value, Dual) else float(value)
+
+    def interpolate_many(self, dates: Union[DateArray, np.ndarray]) -> np.ndarray:
+        """
+        Interpolates the values of many dates at once.
+
+        Parameters
+        ----------
+        dates : DateArray or numpy.ndarray
+            The dates to interpolate, either as a DateArray or as serial numbers.
+        """
+        x = np.asarray(dates, dtype=np.float64)
+        return self._evaluate(x, self._locate(x))
+
+    def pillar_sensitivities(self, dates: Union[DateArray, np.ndarray]) -> np.ndarray:
+        """
+        Returns the derivative of the interpolated value of each date with respect to the value of each pillar.
+        Every date depends on the two pillars of its segment only, for linear interpolation the derivatives are
+        the interpolation weights.
+
+        Parameters
+        ----------
+        dates : DateArray or numpy.ndarray
+            The dates to interpolate, either as a DateArray or as serial numbers.
+
+        Returns
+        -------
+        A (dates x pillars) array.
+        """
+        x = np.atleast_1d(np.asarray(dates, dtype=np.float64))
+        idx = self._locate(x)
+        x_begin, x_end = self.x[idx], self.x[idx + 1]
+        y_begin, y_end = self.y[idx], self.y[idx + 1]
+        w = (x - x_begin) / (x_end - x_begin)
+        match self.interpolation:
+            case InterpolationType.LINEAR:
+                d_begin, d_end = 1 - w, w
+            case InterpolationType.LOGLINEAR:
+                y = self._log_linear_interpolation(x, x_begin, x_end, y_begin, y_end)
+                d_begin, d_end = (1 - w) * y / y_begin, w * y / y_end
+            case InterpolationType.FLATFORWARD:
+                d_end = np.where(x < x_begin, 0.0, 1.0)
+                d_begin = 1 - d_end
+            case _:
+                raise ValueError(
+                    f"Pillar sensitivities not supported received: {self.interpolation}"
+                )
+        sensitivities = np.zeros((len(x), len(self.x)))
+        rows = np.arange(len(x))
+        sensitivities[rows, idx] = d_begin
+        sensitivities[rows, idx + 1] = d_end
+        return sensitivities
+
+    def _evaluate(
+        self, x: Union[float, np.ndarray], idx: Union[np.integer, np.ndarray]
+    ) -> Union[float, np.ndarray]:
+        match self.interpolation:
+            case (
+                InterpolationType.NATURALCUBIC
+                | InterpolationType.MONOTONECUBIC
+                | InterpolationType.MONOTONECONVEX
+            ):
+                # The precomputed coefficients are looked up by segment
+                return self.interpolation_method(x, idx)
         return self.interpolation_method(
-            date.serial_number,
-            self.dates[left_node].serial_number,
-            self.dates[right_node].serial_number,
-            self.rates[left_node],
-            self.rates[right_node],
+            x, self.x[idx], self.x[idx + 1], self.y[idx], self.y[idx + 1]
         )
 
-    def _locate(self, x: float, dates: List[Date]) -> int:
+    def _locate(self, x: Union[float, np.ndarray]) -> Union[np.integer, np.ndarray]:
         """
-        Finds the index of dates of which x is to the right.
+        Finds the index of the pillar starting the segment x is interpolated on. Like QuantLib, points before the
+        first pillar or after the last one are extrapolated from the first or last segment.
 
         Example
         -------
-        Assume dates = [1,2,3,4] and x is 2.5, then _locate will return 3.
+        Assume the pillars are [1,2,3,4], then _locate will return 1 for 2.5, 0 for 0.5 and 2 for 4.
 
         Parameters
         ----------
-        x : float
-            The pillar to find the interpolated value for.
+        x : float or numpy.ndarray
+            The points to find the segments of.
 
         """
-        if x < dates[0]:
-            return 0
-        elif x > dates[-1]:
-            return len(dates)
-        else:
-            return bisect_right(dates, x + 10e-7)
-        # 0.0000001 is to mimic c++ upper bound
+        return np.clip(np.searchsorted(self.x, x, side="right") - 1, 0, len(self.x) - 2)
 
     def _linear_interpolation(
         self, x: float, x_begin: float, x_end: float, y_begin: float, y_end: float
@@ -135,7 +228,220 @@ class Interpolation:
         y_end: float
             The end value of the curve.
         """
-        if x < x_begin:
-            return y_begin
+        return np.where(x < x_begin, y_begin, y_end)
+
+    def _cubic(
+        self, x: Union[float, np.ndarray], idx: Union[np.integer, np.ndarray]
+    ) -> Union[float, np.ndarray]:
+        """
+        Evaluates the cubic polynomial of the segment of x, extrapolating the first and last polynomial.
+
+        Parameters
+        ----------
+        x : float or numpy.ndarray
+            The pillars to find the interpolated values for.
+        idx: int or numpy.ndarray
+            The segments of the pillars, see _locate.
+        """
+        b, c, d = self._coefficients[:, idx]
+        dx = x - self.x[idx]
+        return self.y[idx] + dx * (b + dx * (c + dx * d))
+
+    def _monotone_convex(
+        self, x: Union[float, np.ndarray], idx: Union[np.integer, np.ndarray]
+    ) -> Union[float, np.ndarray]:
+        """
+        Monotone convex interpolation of Hagan and West. The values are treated as discount factors, whose
+        instantaneous forwards are interpolated such that they are continuous, positive for positive discrete
+        forwards and reproduce the value of every pillar. The forwards are flat outside of the pillars.
+
+        Parameters
+        ----------
+        x : float or numpy.ndarray
+            The pillars to find the interpolated values for.
+        idx: int or numpy.ndarray
+            The segments of the pillars, see _locate.
+        """
+        forward, g0, g1, regime, eta, node_forward = self._coefficients[:, idx]
+        x_begin, x_end = self.x[idx], self.x[idx + 1]
+        h = x_end - x_begin
+        u = np.clip((x - x_begin) / h, 0.0, 1.0)
+        # The integral of the forward over the segment up to x, relative to the discrete forward
+        with np.errstate(divide="ignore", invalid="ignore"):
+            eta_left = np.where(eta > 0, eta, 1.0)
+            eta_right = np.where(eta < 1, eta, 0.0)
+            left = np.where(
+                eta > 0,
+                (eta - np.maximum(eta - u, 0.0) ** 3 / eta_left**2) / 3,
+                0.0,
+            )
+            right = np.maximum(u - eta_right, 0.0) ** 3 / (3 * (1 - eta_right) ** 2)
+            right = np.where(eta < 1, right, 0.0)
+            level = np.where(
+                regime == 4, -g0 * g1 / np.where(g0 + g1 != 0, g0 + g1, 1), 0
+            )
+        integral = np.select(
+            [regime == 1, regime == 2, regime == 3, regime == 4],
+            [
+                g0 * (u - 2 * u**2 + u**3) + g1 * (u**3 - u**2),
+                g0 * u + (g1 - g0) * right,
+                g1 * u + (g0 - g1) * left,
+                level * u + (g0 - level) * left + (g1 - level) * right,
+            ],
+            0.0,
+        )
+        log_discount = np.log(self.y[idx]) - h * (forward * u + integral)
+        # Flat instantaneous forwards outside of the pillars
+        log_discount = log_discount - node_forward * (
+            np.minimum(x - self.x[0], 0.0) + np.maximum(x - self.x[-1], 0.0)
+        )
+        return np.exp(log_discount)
+
+
+def _solve_tridiagonal(
+    lower: np.ndarray, diagonal: np.ndarray, upper: np.ndarray, rhs: np.ndarray
+) -> np.ndarray:
+    """
+    Solves a tridiagonal system with the Thomas algorithm, lower[0] and upper[-1] are not used.
+    """
+    n = len(diagonal)
+    c = np.zeros(n)
+    d = np.zeros(n)
+    c[0] = upper[0] / diagonal[0]
+    d[0] = rhs[0] / diagonal[0]
+    for i in range(1, n):
+        denominator = diagonal[i] - lower[i] * c[i - 1]
+        c[i] = upper[i] / denominator if i < n - 1 else 0.0
+        d[i] = (rhs[i] - lower[i] * d[i - 1]) / denominator
+    solution = np.zeros(n)
+    solution[-1] = d[-1]
+    for i in range(n - 2, -1, -1):
+        solution[i] = d[i] - c[i] * solution[i + 1]
+    return solution
+
+
+def _natural_spline_slopes(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Returns the first derivatives at the pillars of the natural cubic spline through them, whose second
+    derivative vanishes at the first and last pillar.
+    """
+    h = np.diff(x)
+    secants = np.diff(y) / h
+    n = len(x)
+    lower = np.zeros(n)
+    diagonal = np.ones(n)
+    upper = np.zeros(n)
+    rhs = np.zeros(n)
+    # Continuity of the second derivative at the inner pillars, in terms of the second derivatives
+    lower[1:-1] = h[:-1]
+    diagonal[1:-1] = 2 * (h[:-1] + h[1:])
+    upper[1:-1] = h[1:]
+    rhs[1:-1] = 6 * np.diff(secants)
+    second = _solve_tridiagonal(lower, diagonal, upper, rhs)
+    slopes = np.empty(n)
+    slopes[:-1] = secants - h * (2 * second[:-1] + second[1:]) / 6
+    slopes[-1] = secants[-1] + h[-1] * (second[-2] + 2 * second[-1]) / 6
+    return slopes
+
+
+def _hyman_filter(x: np.ndarray, y: np.ndarray, slopes: np.ndarray) -> np.ndarray:
+    """
+    Limits the slopes at the pillars such that the cubic interpolation preserves the monotonicity of the pillars,
+    with the extended Hyman filter used by QuantLib.
+    """
+    h = np.diff(x)
+    s = np.diff(y) / h
+    n = len(x)
+    slopes = slopes.copy()
+    for i in range(n):
+        if i == 0 or i == n - 1:
+            secant = s[0] if i == 0 else s[-1]
+            if slopes[i] * secant > 0:
+                slopes[i] = np.sign(slopes[i]) * min(abs(slopes[i]), abs(3 * secant))
+            else:
+                slopes[i] = 0.0
+            continue
+        pm = (s[i - 1] * h[i] + s[i] * h[i - 1]) / (h[i - 1] + h[i])
+        limit = 3 * min(abs(s[i - 1]), abs(s[i]), abs(pm))
+        if i > 1 and (s[i - 1] - s[i - 2]) * (s[i] - s[i - 1]) > 0:
+            pd = (s[i - 1] * (2 * h[i - 1] + h[i - 2]) - s[i - 2] * h[i - 1]) / (
+                h[i - 2] + h[i - 1]
+            )
+            if pm * pd > 0 and pm * (s[i - 1] - s[i - 2]) > 0:
+                limit = max(limit, 1.5 * min(abs(pm), abs(pd)))
+        if i < n - 2 and (s[i] - s[i - 1]) * (s[i + 1] - s[i]) > 0:
+            pu = (s[i] * (2 * h[i] + h[i + 1]) - s[i + 1] * h[i]) / (h[i] + h[i + 1])
+            if pm * pu > 0 and -pm * (s[i] - s[i - 1]) > 0:
+                limit = max(limit, 1.5 * min(abs(pm), abs(pu)))
+        if slopes[i] * pm > 0:
+            slopes[i] = np.sign(slopes[i]) * min(abs(slopes[i]), limit)
         else:
-            return y_end
+            slopes[i] = 0.0
+    return slopes
+
+
+def _hermite_coefficients(
+    x: np.ndarray, y: np.ndarray, slopes: np.ndarray
+) -> np.ndarray:
+    """
+    Returns the coefficients b, c and d of the cubic y[i] + b dx + c dx^2 + d dx^3 of each segment, given the
+    slopes at the pillars.
+    """
+    h = np.diff(x)
+    secants = np.diff(y) / h
+    return np.stack(
+        (
+            slopes[:-1],
+            (3 * secants - slopes[1:] - 2 * slopes[:-1]) / h,
+            (slopes[1:] + slopes[:-1] - 2 * secants) / h**2,
+        )
+    )
+
+
+def _monotone_convex_coefficients(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Returns, for each segment, the discrete forward, the deviations g0 and g1 of the instantaneous forwards at its
+    ends from the discrete forward, the regime and breakpoint of the forward between them, and the forward used
+    to extrapolate from the segment, see Hagan and West, Interpolation Methods for Curve Construction.
+    """
+    h = np.diff(x)
+    forward = -np.diff(np.log(y)) / h
+    # Instantaneous forwards at the pillars, weighted averages of the neighbouring discrete forwards
+    node = np.empty(len(x))
+    node[1:-1] = (h[:-1] * forward[1:] + h[1:] * forward[:-1]) / (h[:-1] + h[1:])
+    if len(x) > 2:
+        node[0] = forward[0] - (node[1] - forward[0]) / 2
+        node[-1] = forward[-1] - (node[-2] - forward[-1]) / 2
+    else:
+        node[:] = forward[0]
+    # The positivity collar bounds every node forward to [0, 2 min(neighbouring discrete forwards)], which keeps
+    # the instantaneous forwards positive wherever the discrete forwards are
+    bound = 2 * np.minimum(
+        np.append(forward, forward[-1]), np.insert(forward, 0, forward[0])
+    )
+    node = np.where(bound >= 0, np.clip(node, 0.0, np.maximum(bound, 0.0)), node)
+    g0 = node[:-1] - forward
+    g1 = node[1:] - forward
+
+    regime = np.select(
+        [
+            (g0 == 0) & (g1 == 0),
+            ((g0 < 0) & (-g0 / 2 <= g1) & (g1 <= -2 * g0))
+            | ((g0 > 0) & (-g0 / 2 >= g1) & (g1 >= -2 * g0)),
+            ((g0 < 0) & (g1 > -2 * g0)) | ((g0 > 0) & (g1 < -2 * g0)),
+            ((g0 > 0) & (0 > g1) & (g1 > -g0 / 2))
+            | ((g0 < 0) & (0 < g1) & (g1 < -g0 / 2)),
+        ],
+        [0, 1, 2, 3],
+        4,
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        eta = np.select(
+            [regime == 2, regime == 3, regime == 4],
+            [(g1 + 2 * g0) / (g1 - g0), 3 * g1 / (g1 - g0), g1 / (g1 + g0)],
+            0.5,
+        )
+    # The first segment extrapolates with the forward at the first pillar, all others with the last one
+    extrapolation = np.full(len(forward), node[-1])
+    extrapolation[0] = node[0]
+    return np.stack((forward, g0, g1, regime, eta, extrapolation))
@@ -0,0 +1,254 @@
+from abc import ABCMeta, abstractmethod
+from supersnabb.time.date import Date, Tenor
+from supersnabb.time.date_array import DateArray
+from supersnabb.time.calendar import Calendar
+from supersnabb.time.daycounter import Daycounter
+from supersnabb.time.business_day_convention import BusinessDayConvention
+from supersnabb.time.schedule import Schedule
+from supersnabb.termstructure.curve import _daycounter
+from supersnabb.quotes.simple_quote import SimpleQuote
+from typing import Optional, Tuple, Union
+import numpy as np
+
+
+class RateHelper(metaclass=ABCMeta):
+    """
+    Base class for the quoted instruments a curve is bootstrapped from. A helper knows the dates whose discount
+    factors determine its quote, and returns the quote implied by the discount factors of those dates together
+    with its derivative with respect to each of them.
+
+    The dates and year fractions are computed once by setup, so that repricing the helper during the bootstrap
+    is a handful of array operations.
+
+    Parameters
+    ----------
+    quote : float or SimpleQuote
+        The market quote of the instrument, a SimpleQuote can be shared with other consumers of the market data.
+    """
+
+    def __init__(self, quote: Union[float, SimpleQuote]):
+        self._quote = quote
+        self.reference_date: Optional[Date] = None
+        self.serial_numbers: Optional[np.ndarray] = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.quote})"
+
+    @property
+    def quote(self) -> float:
+        if isinstance(self._quote, SimpleQuote):
+            return self._quote.value
+        return self._quote
+
+    @quote.setter
+    def quote(self, value: float):
+        if isinstance(self._quote, SimpleQuote):
+            self._quote.set_value(value)
+        else:
+            self._quote = value
+
+    @property
+    def pillar_date(self) -> Date:
+        """
+        Returns the last date the quote depends on, which is the pillar the helper is bootstrapped on.
+        """
+        if self.serial_numbers is None:
+            raise ValueError("the helper has not been set up with a reference date")
+        return Date.from_serial(int(self.serial_numbers.max()))
+
+    def setup(self, reference_date: Date):
+        """
+        Computes the dates and year fractions of the helper as seen from the reference date.
+        """
+        self.reference_date = reference_date
+        self.serial_numbers = self._setup(reference_date)
+
+    @abstractmethod
+    def _setup(self, reference_date: Date) -> np.ndarray:
+        """
+        Computes the year fractions of the helper and returns the serial numbers of its dates.
+        """
+        pass
+
+    @abstractmethod
+    def implied_quote(self, discount_factors: np.ndarray) -> Tuple[float, np.ndarray]:
+        """
+        Returns the quote implied by the discount factors of the dates of the helper, and its derivatives with
+        respect to each of those discount factors.
+
+        Parameters
+        ----------
+        discount_factors : numpy.ndarray
+            The discount factors of the serial numbers of the helper, in the same order.
+        """
+        pass
+
+
+class DepositRateHelper(RateHelper):
+    """
+    A deposit starting at the spot date, quoted as a simply compounded rate.
+
+    Parameters
+    ----------
+    quote : float or SimpleQuote
+        The deposit rate.
+    tenor : Tenor
+        The tenor of the deposit.
+    settlement_days : int
+        The number of business days from the reference date to the start of the deposit.
+    calendar : Calendar
+        The calendar used to find the start and the maturity of the deposit.
+    convention : BusinessDayConvention
+        The business day convention used to adjust the maturity.
+    daycount : Daycounter
+        The daycounter of the rate.
+    """
+
+    def __init__(
+        self,
+        quote: Union[float, SimpleQuote],
+        tenor: Tenor,
+        settlement_days: int,
+        calendar: Calendar,
+        convention: BusinessDayConvention,
+        daycount: Daycounter,
+    ):
+        super().__init__(quote)
+        self.tenor = Tenor(tenor) if isinstance(tenor, str) else tenor
+        self.settlement_days = settlement_days
+        self.calendar = calendar
+        self.convention = convention
+        self.daycount = daycount
+
+    def _start_date(self, reference_date: Date) -> Date:
+        return self.calendar.advance(
+            reference_date, Tenor(self.settlement_days, "D"), self.convention
+        )
+
+    def _setup(self, reference_date: Date) -> np.ndarray:
+        start = self._start_date(reference_date)
+        end = self.calendar.advance(start, self.tenor, self.convention)
+        self._year_fraction = _daycounter(self.daycount).year_fraction(start, end)
+        return np.array([start.serial_number, end.serial_number])
+
+    def implied_quote(self, discount_factors: np.ndarray) -> Tuple[float, np.ndarray]:
+        start, end = discount_factors
+        tau = self._year_fraction
+        rate = (start / end - 1) / tau
+        return rate, np.array([1 / (end * tau), -start / (end * end * tau)])
+
+
+class FraRateHelper(DepositRateHelper):
+    """
+    A forward rate agreement, quoted as the simply compounded rate of a period starting some time after spot.
+
+    Parameters
+    ----------
+    quote : float or SimpleQuote
+        The forward rate.
+    start : Tenor
+        The time from the spot date to the start of the period, e.g. Tenor("3M") for a 3x6 FRA.
+    tenor : Tenor
+        The length of the period, e.g. Tenor("3M") for a 3x6 FRA.
+    settlement_days : int
+        The number of business days from the reference date to the spot date.
+    calendar : Calendar
+        The calendar used to find the start and the end of the period.
+    convention : BusinessDayConvention
+        The business day convention used to adjust the start and the end of the period.
+    daycount : Daycounter
+        The daycounter of the rate.
+    """
+
+    def __init__(
+        self,
+        quote: Union[float, SimpleQuote],
+        start: Tenor,
+        tenor: Tenor,
+        settlement_days: int,
+        calendar: Calendar,
+        convention: BusinessDayConvention,
+        daycount: Daycounter,
+    ):
+        super().__init__(quote, tenor, settlement_days, calendar, convention, daycount)
+        self.start = Tenor(start) if isinstance(start, str) else start
+
+    def _start_date(self, reference_date: Date) -> Date:
+        spot = super()._start_date(reference_date)
+        return self.calendar.advance(spot, self.start, self.convention)
+
+
+class SwapRateHelper(RateHelper):
+    """
+    A vanilla swap starting at the spot date, quoted as its par fixed rate. The floating leg is forecast and
+    discounted on the curve being bootstrapped, so it is worth the difference of the discount factors of the
+    start and the end of the swap and only the fixed schedule is needed.
+
+    Parameters
+    ----------
+    quote : float or SimpleQuote
+        The par swap rate.
+    tenor : Tenor
+        The tenor of the swap.
+    settlement_days : int
+        The number of business days from the reference date to the start of the swap.
+    calendar : Calendar
+        The calendar of the fixed schedule.
+    fixed_frequency : Tenor
+        The tenor of the fixed coupons.
+    fixed_convention : BusinessDayConvention
+        The business day convention of the fixed schedule.
+    fixed_daycount : Daycounter
+        The daycounter of the fixed coupons.
+    """
+
+    def __init__(
+        self,
+        quote: Union[float, SimpleQuote],
+        tenor: Tenor,
+        settlement_days: int,
+        calendar: Calendar,
+        fixed_frequency: Tenor,
+        fixed_convention: BusinessDayConvention,
+        fixed_daycount: Daycounter,
+    ):
+        super().__init__(quote)
+        self.tenor = Tenor(tenor) if isinstance(tenor, str) else tenor
+        self.settlement_days = settlement_days
+        self.calendar = calendar
+        self.fixed_frequency = fixed_frequency
+        self.fixed_convention = fixed_convention
+        self.fixed_daycount = fixed_daycount
+
+    def _setup(self, reference_date: Date) -> np.ndarray:
+        start = self.calendar.advance(
+            reference_date, Tenor(self.settlement_days, "D"), self.fixed_convention
+        )
+        schedule = Schedule(
+            start,
+            start + self.tenor,
+            self.fixed_frequency,
+            self.calendar,
+            self.fixed_convention,
+            self.fixed_convention,
+            "backward",
+            False,
+        )
+        dates = DateArray(schedule.dates)
+        self._year_fractions = np.asarray(
+            _daycounter(self.fixed_daycount).year_fraction(dates[:-1], dates[1:]),
+            dtype=np.float64,
+        )
+        # The start and the end of the swap followed by the payment dates of the fixed coupons
+        return np.concatenate(
+            (dates.serial_number[[0, -1]], dates.serial_number[1:])
+        ).astype(np.int64)
+
+    def implied_quote(self, discount_factors: np.ndarray) -> Tuple[float, np.ndarray]:
+        start, end = discount_factors[:2]
+        annuity = self._year_fractions @ discount_factors[2:]
+        rate = (start - end) / annuity
+        gradient = np.concatenate(
+            ([1 / annuity, -1 / annuity], -rate * self._year_fractions / annuity)
+        )
+        return rate, gradient
@@ -0,0 +1,197 @@
+from supersnabb.time.date import Date
+from supersnabb.time.date_array import DateArray
+from supersnabb.time.calendar import Calendar
+from supersnabb.time.daycounter import Daycounter
+from supersnabb.termstructure.curve import DiscountCurve, _daycounter
+from supersnabb.termstructure.interpolation import InterpolationType
+from typing import List, Optional, Sequence, Union
+import numpy as np
+import pandas as pd
+
+
+class ScenarioCurve(DiscountCurve):
+    """
+    A discount curve under many scenarios at once, holding a matrix of discount factors with one row per pillar
+    and one column per scenario. Every query evaluates all scenarios in one vectorized pass, a single date
+    returns an array with one value per scenario and an array of dates returns a (dates x scenarios) array.
+
+    Since the queries have the same signatures as those of DiscountCurve, a scenario curve can be passed to
+    indices and legs, whose forward rates, discount factors and NPV then carry a trailing scenario axis.
+
+    Parameters
+    ----------
+    dates : List[Date]
+        The pillar dates of the curve.
+    discount_factors : numpy.ndarray
+        The discount factors of the pillars, a (pillars x scenarios) matrix.
+    daycount : Daycounter
+        The daycounter of the curve.
+    calendar : Calendar
+        The calendar of the curve.
+    interpolation : InterpolationType
+        The interpolation of the discount factors, only linear, log-linear and flat forward interpolation are
+        supported as their segments are independent of the other pillars.
+    """
+
+    def __init__(
+        self,
+        dates: List[Date],
+        discount_factors: np.ndarray,
+        daycount: Daycounter,
+        calendar: Calendar,
+        interpolation: InterpolationType = InterpolationType.LINEAR,
+    ):
+        if InterpolationType(interpolation) not in (
+            InterpolationType.LINEAR,
+            InterpolationType.LOGLINEAR,
+            InterpolationType.FLATFORWARD,
+        ):
+            raise ValueError(
+                f"Interpolation type not supported for scenarios received: {interpolation}"
+            )
+        discount_factors = np.asarray(discount_factors, dtype=np.float64)
+        if discount_factors.ndim != 2:
+            raise ValueError("discount factors must be a (pillars x scenarios) matrix")
+        super().__init__(dates, discount_factors, daycount, calendar, interpolation)
+
+    @property
+    def n_scenarios(self) -> int:
+        return self.y.shape[1]
+
+    @property
+    def curve(self) -> pd.DataFrame:
+        return pd.DataFrame(self.y, index=pd.Index(self.dates, name="dates"))
+
+    def scenario(self, i: int) -> DiscountCurve:
+        """
+        Returns the curve of a single scenario.
+        """
+        return DiscountCurve(
+            self.dates,
+            list(self.y[:, i]),
+            self.daycount,
+            self.calendar,
+            self.interpolation,
+        )
+
+    def interpolate(self, date: Date) -> np.ndarray:
+        return self.interpolate_many(date.serial_number)
+
+    def interpolate_many(self, dates: Union[DateArray, np.ndarray]) -> np.ndarray:
+        """
+        Interpolates the discount factors of many dates under every scenario.
+
+        Parameters
+        ----------
+        dates : DateArray or numpy.ndarray
+            The dates to interpolate, either as a DateArray or as serial numbers.
+
+        Returns
+        -------
+        A (dates x scenarios) array.
+        """
+        x = np.asarray(dates, dtype=np.float64)
+        idx = self._locate(x)
+        return self.interpolation_method(
+            x[..., None],
+            self.x[idx][..., None],
+            self.x[idx + 1][..., None],
+            self.y[idx],
+            self.y[idx + 1],
+        )
+
+    @classmethod
+    def from_zero_shifts(
+        cls, curve: DiscountCurve, shifts: np.ndarray
+    ) -> "ScenarioCurve":
+        """
+        Shifts the continuously compounded zero rates of the pillars of a curve, with time measured by the
+        daycounter of the curve from its reference date.
+
+        Parameters
+        ----------
+        curve : DiscountCurve
+            The base curve.
+        shifts : numpy.ndarray
+            The shifts of the zero rates, a (pillars x scenarios) matrix. The shift of the reference date has
+            no effect as its discount factor is one.
+        """
+        shifts = np.asarray(shifts, dtype=np.float64)
+        discount_factors = np.asarray(curve.rates, dtype=np.float64)[:, None] * np.exp(
+            -shifts * curve.pillar_times()[:, None]
+        )
+        return cls(
+            curve.dates,
+            discount_factors,
+            curve.daycount,
+            curve.calendar,
+            curve.interpolation,
+        )
+
+
+def parallel_shift(curve: DiscountCurve, shifts: Sequence[float]) -> ScenarioCurve:
+    """
+    Returns a scenario curve with every zero rate of the curve shifted by the same amount in each scenario.
+
+    Parameters
+    ----------
+    curve : DiscountCurve
+        The base curve.
+    shifts : Sequence[float]
+        The shift of each scenario, e.g. 0.0001 for one basis point.
+    """
+    shifts = np.asarray(shifts, dtype=np.float64)
+    return ScenarioCurve.from_zero_shifts(
+        curve, np.broadcast_to(shifts, (len(curve.dates), len(shifts)))
+    )
+
+
+def twist(
+    curve: DiscountCurve,
+    short_shifts: Sequence[float],
+    long_shifts: Sequence[float],
+    pivot: Optional[Date] = None,
+) -> ScenarioCurve:
+    """
+    Returns a scenario curve with the zero rates shifted linearly in time, from the short shift at the reference
+    date to the long shift at the last pillar.
+
+    Parameters
+    ----------
+    curve : DiscountCurve
+        The base curve.
+    short_shifts : Sequence[float]
+        The shift at the reference date of each scenario.
+    long_shifts : Sequence[float]
+        The shift at the last pillar of each scenario.
+    pivot : Date, optional
+        A date whose zero rate is left unchanged, the shifts are then moved by the same amount so that the
+        curve turns around it.
+    """
+    short_shifts = np.asarray(short_shifts, dtype=np.float64)
+    long_shifts = np.asarray(long_shifts, dtype=np.float64)
+    times = curve.pillar_times()
+    weights = (times / times[-1])[:, None]
+    shifts = short_shifts + weights * (long_shifts - short_shifts)
+    if pivot is not None:
+        pivot_time = _daycounter(curve.daycount).year_fraction(
+            curve.reference_date, pivot
+        )
+        shifts -= short_shifts + pivot_time / times[-1] * (long_shifts - short_shifts)
+    return ScenarioCurve.from_zero_shifts(curve, shifts)
+
+
+def key_rate_shifts(curve: DiscountCurve, size: float = 0.0001) -> ScenarioCurve:
+    """
+    Returns a scenario curve with one scenario per pillar after the reference date, shifting the zero rate of
+    only that pillar. Through the interpolation each scenario moves the curve between the neighbouring pillars.
+
+    Parameters
+    ----------
+    curve : DiscountCurve
+        The base curve.
+    size : float
+        The shift of the zero rate, e.g. 0.0001 for one basis point.
+    """
+    n = len(curve.dates)
+    return ScenarioCurve.from_zero_shifts(curve, size * np.eye(n, n - 1, k=-1))
@@ -0,0 +1,344 @@
+import mmap
+import struct
+import numpy as np
+from supersnabb.time.date import Date, _YEAR_OFFSET, _MIN_YEAR, _MAX_YEAR
+from supersnabb.time.date_array import _year_month_day
+from supersnabb.time.business_day_convention import BusinessDayConvention
+from typing import Callable
+
+# The tables cover every serial number from 1900-01-01 to 2200-12-31 and are indexed directly by serial number
+FIRST_SERIAL = _YEAR_OFFSET[0] + 1
+LAST_SERIAL = _YEAR_OFFSET[_MAX_YEAR - _MIN_YEAR] + 365
+
+_UNKNOWN = 0
+_HOLIDAY = 1
+_BUSINESS_DAY = 2
+
+# File layout: header, calendar name, then the flags, the cumulative count, the business days and one
+# adjustment map per business day convention, each section starting at a multiple of 8 bytes
+_FILE_MAGIC = b"SSBDTBL\0"
+_FILE_VERSION = 1
+_FILE_HEADER = struct.Struct("<8sIIIII")
+
+
+class BusinessDayTable:
+    """
+    A table of business days for a calendar over the supported serial range. The table is filled in one year
+    at a time the first time a date within that year is looked up, after which a lookup is a single index.
+
+    The cumulative business day count, the sorted business days and the adjustment map of each business day
+    convention are derived from the complete table the first time they are needed, and turn counting,
+    stepping and adjusting into lookups. They are only rebuilt when a business day is modified.
+
+    Parameters
+    ----------
+    rule : Callable
+        The rule of the calendar, returns True if the given date is a business day.
+    dependencies : frozenset
+        The keys of the tables this table is derived from, it is discarded when any of them is modified.
+    """
+
+    def __init__(
+        self, rule: Callable[[Date], bool], dependencies: frozenset = frozenset()
+    ):
+        self._rule = rule
+        self.dependencies = dependencies
+        self._flags = bytearray(LAST_SERIAL + 1)
+        self._cumulative = None
+        self._business_days = None
+        self._adjustments = {}
+
+    @property
+    def flags(self) -> np.ndarray:
+        """
+        Returns a view of the table, indexed by serial number. Years that have not been looked up yet are zero.
+        """
+        return np.frombuffer(self._flags, dtype=np.uint8)
+
+    @property
+    def cumulative(self) -> np.ndarray:
+        """
+        Returns the number of business days up to and including each serial number, indexed by serial number.
+        """
+        if self._cumulative is None:
+            self._build_all()
+            self._cumulative = np.cumsum(self.flags == _BUSINESS_DAY, dtype=np.int32)
+        return self._cumulative
+
+    @property
+    def business_days(self) -> np.ndarray:
+        """
+        Returns the serial numbers of all business days in ascending order, the business day with index i
+        is preceded by i business days.
+        """
+        if self._business_days is None:
+            self._build_all()
+            self._business_days = np.flatnonzero(self.flags == _BUSINESS_DAY).astype(
+                np.int32
+            )
+        return self._business_days
+
+    def is_business_day(self, serial_number: int) -> bool:
+        if not FIRST_SERIAL <= serial_number <= LAST_SERIAL:
+            return self._rule(Date.from_serial(serial_number))
+        flag = self._flags[serial_number]
+        if flag == _UNKNOWN:
+            self._build_year(Date.from_serial(serial_number).year())
+            flag = self._flags[serial_number]
+        return flag == _BUSINESS_DAY
+
+    def adjustment(self, convention: BusinessDayConvention) -> np.ndarray:
+        """
+        Returns the adjusted serial number of every serial number with respect to a business day convention,
+        indexed by serial number.
+        """
+        # BusinessDayConvention is a StrEnum, so plain strings find the same entries
+        adjustment = self._adjustments.get(convention)
+        if adjustment is None:
+            try:
+                convention = BusinessDayConvention(convention)
+            except ValueError:
+                raise ValueError("Unknown business-day convention")
+            adjustment = self._adjustments[convention] = self._build_adjustment(
+                convention
+            )
+        return adjustment
+
+    def adjust(self, serial_number: int, convention: BusinessDayConvention) -> int:
+        """
+        Returns the serial number adjusted with respect to a business day convention.
+        """
+        _check_range(serial_number)
+        return int(self.adjustment(convention)[serial_number])
+
+    def adjust_many(
+        self, serial_numbers: np.ndarray, convention: BusinessDayConvention
+    ) -> np.ndarray:
+        """
+        Returns the serial numbers adjusted with respect to a business day convention.
+        """
+        _check_range_many(serial_numbers)
+        return self.adjustment(convention)[serial_numbers]
+
+    def set_business_day(self, serial_number: int, is_business_day: bool):
+        """
+        Overrides the rule for a single date, discarding the tables derived from the modified table.
+        """
+        _check_range(serial_number)
+        self.is_business_day(serial_number)
+        if not isinstance(self._flags, bytearray):
+            # A mapped table is read-only, modifications are made to a private copy
+            self._flags = bytearray(self._flags)
+        self._flags[serial_number] = _BUSINESS_DAY if is_business_day else _HOLIDAY
+        self._cumulative = None
+        self._business_days = None
+        self._adjustments = {}
+
+    def count(self, first: int, last: int) -> int:
+        """
+        Returns the number of business days between the serial numbers first and last, both included.
+        """
+        _check_range(first)
+        _check_range(last)
+        cumulative = self.cumulative
+        return int(cumulative[last] - cumulative[first - 1])
+
+    def advance(self, serial_number: int, n: int) -> int:
+        """
+        Returns the serial number of the n:th business day after the given serial number, or before it if n is
+        negative. The given serial number itself is never counted.
+        """
+        _check_range(serial_number)
+        if n > 0:
+            index = self.cumulative[serial_number] + n - 1
+        else:
+            index = self.cumulative[serial_number - 1] + n
+        return self.business_day(index)
+
+    def advance_many(self, serial_numbers: np.ndarray, n: int) -> np.ndarray:
+        """
+        Returns the serial numbers of the n:th business day after each of the given serial numbers, or before
+        them if n is negative.
+        """
+        _check_range_many(serial_numbers)
+        if n > 0:
+            index = self.cumulative[serial_numbers] + n - 1
+        else:
+            index = self.cumulative[serial_numbers - 1] + n
+        business_days = self.business_days
+        if np.any((index < 0) | (index >= len(business_days))):
+            raise ValueError("the business day is outside of the supported date range")
+        return business_days[index]
+
+    def business_day(self, index: int) -> int:
+        """
+        Returns the serial number of the business day preceded by index business days in the table.
+        """
+        business_days = self.business_days
+        if not 0 <= index < len(business_days):
+            raise ValueError("the business day is outside of the supported date range")
+        return int(business_days[index])
+
+    def save(self, path: str, name: str):
+        """
+        Builds all tables and writes them to a file, which can be mapped into any number of processes with load.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+        name : str
+            The name of the calendar, checked when the file is loaded.
+        """
+        encoded_name = name.encode()
+        sections = [
+            self.flags,
+            self.cumulative,
+            self.business_days,
+            *(self.adjustment(convention) for convention in BusinessDayConvention),
+        ]
+        with open(path, "wb") as f:
+            f.write(
+                _FILE_HEADER.pack(
+                    _FILE_MAGIC,
+                    _FILE_VERSION,
+                    LAST_SERIAL,
+                    len(self.business_days),
+                    len(BusinessDayConvention),
+                    len(encoded_name),
+                )
+            )
+            f.write(encoded_name)
+            for section in sections:
+                f.write(bytes(-f.tell() % 8))
+                f.write(np.ascontiguousarray(section).tobytes())
+
+    def load(self, path: str, name: str):
+        """
+        Replaces the tables with those of a file written by save. The file is memory mapped read-only, so
+        processes loading the same file share its pages.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+        name : str
+            The name of the calendar, which must match the name the file was saved with.
+        """
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (
+            magic,
+            version,
+            last_serial,
+            business_days,
+            conventions,
+            name_length,
+        ) = _FILE_HEADER.unpack_from(buffer)
+        if magic != _FILE_MAGIC:
+            raise ValueError(f"{path} is not a business day table file")
+        if (
+            version != _FILE_VERSION
+            or last_serial != LAST_SERIAL
+            or conventions != len(BusinessDayConvention)
+        ):
+            raise ValueError(f"{path} was written by an incompatible version")
+        offset = _FILE_HEADER.size
+        saved_name = bytes(buffer[offset : offset + name_length]).decode()
+        if saved_name != name:
+            raise ValueError(f"{path} holds the tables of {saved_name}, not {name}")
+        offset += name_length
+
+        def section(dtype, count):
+            nonlocal offset
+            offset += -offset % 8
+            array = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+            offset += array.nbytes
+            return array
+
+        self._flags = memoryview(section(np.uint8, LAST_SERIAL + 1))
+        self._cumulative = section(np.int32, LAST_SERIAL + 1)
+        self._business_days = section(np.int32, business_days)
+        self._adjustments = {
+            convention: section(np.int32, LAST_SERIAL + 1)
+            for convention in BusinessDayConvention
+        }
+
+    def _build_adjustment(self, convention: BusinessDayConvention) -> np.ndarray:
+        serials = np.arange(LAST_SERIAL + 1, dtype=np.int32)
+        business_days = self.business_days
+        if len(business_days) == 0:
+            return serials
+        cumulative = self.cumulative
+        # The first business day on or after each date is preceded by as many business days as the date,
+        # dates after the last business day and before the first one are left unadjusted
+        before = np.concatenate(([0], cumulative[:-1]))
+        following = np.where(
+            before < len(business_days),
+            business_days[np.minimum(before, len(business_days) - 1)],
+            serials,
+        )
+        preceding = np.where(
+            cumulative > 0, business_days[np.maximum(cumulative - 1, 0)], serials
+        )
+        _, month, day = _year_month_day(serials)
+        match convention:
+            case BusinessDayConvention.FOLLOWING:
+                return following
+            case BusinessDayConvention.PRECEDING:
+                return preceding
+            case BusinessDayConvention.MODIFIEDFOLLOWING:
+                return np.where(month[following] != month, preceding, following)
+            case BusinessDayConvention.HALFMONTHMODIFIEDFOLLOWING:
+                return np.where(
+                    (month[following] != month) | ((day <= 15) & (day[following] > 15)),
+                    preceding,
+                    following,
+                )
+            case BusinessDayConvention.MODIFIEDPRECEDING:
+                return np.where(month[preceding] != month, following, preceding)
+            case BusinessDayConvention.NEAREST:
+                # Ties go to the following business day
+                return np.where(
+                    following - serials <= serials - preceding, following, preceding
+                )
+            case BusinessDayConvention.UNADJUSTED:
+                return serials
+
+    def _build_all(self):
+        for year in range(_MIN_YEAR, _MAX_YEAR + 1):
+            if self._flags[_YEAR_OFFSET[year - _MIN_YEAR] + 1] == _UNKNOWN:
+                self._build_year(year)
+
+    def _build_year(self, year: int):
+        """
+        Evaluates the rule for every date of the given year.
+        """
+        rule = self._rule
+        from_serial = Date.from_serial
+        first, last = year_range(year)
+        self._flags[first : last + 1] = bytes(
+            _BUSINESS_DAY if rule(from_serial(serial_number)) else _HOLIDAY
+            for serial_number in range(first, last + 1)
+        )
+
+
+def year_range(year: int) -> tuple:
+    """
+    Returns the first and last serial number of the given year.
+    """
+    first = _YEAR_OFFSET[year - _MIN_YEAR] + 1
+    last = LAST_SERIAL if year == _MAX_YEAR else _YEAR_OFFSET[year - _MIN_YEAR + 1]
+    return first, last
+
+
+def _check_range(serial_number: int):
+    if not FIRST_SERIAL <= serial_number <= LAST_SERIAL:
+        raise ValueError(
+            f"serial number {serial_number} is outside of the supported date range"
+        )
+
+
+def _check_range_many(serial_numbers: np.ndarray):
+    if np.any((serial_numbers < FIRST_SERIAL) | (serial_numbers > LAST_SERIAL)):
+        raise ValueError("serial numbers are outside of the supported date range")
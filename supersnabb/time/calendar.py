@@ -1,10 +1,24 @@
 from __future__ import annotations
 from abc import ABCMeta, abstractmethod
+import numpy as np
 from supersnabb.time.date import Date, Tenor
+from supersnabb.time.date_array import DateArray, add_tenor
 from supersnabb.time.business_day_convention import BusinessDayConvention
+from supersnabb.time.business_day_table import BusinessDayTable
+from typing import Union
+
+# Business day tables shared by all instances of a calendar, keyed by Calendar._table_key
+_business_day_tables = {}
+# Incremented whenever a business day table is modified, see table_generation
+_table_generation = 0
 
 
 class Calendar(metaclass=ABCMeta):
+    """
+    Base class for calendars. Subclasses implement the holiday rules in _is_business_day, which is evaluated
+    once per date and stored in a business day table shared by all instances of the calendar.
+    """
+
     def adjust(
         self,
         date: Date,
@@ -24,48 +38,9 @@ class Calendar(metaclass=ABCMeta):
         """
         if convention == BusinessDayConvention.UNADJUSTED:
             return date
-
-        date1 = date
-        if (
-            (convention == BusinessDayConvention.FOLLOWING)
-            or (convention == BusinessDayConvention.MODIFIEDFOLLOWING)
-            or (convention == BusinessDayConvention.HALFMONTHMODIFIEDFOLLOWING)
-        ):
-            while self.is_business_day(date1) is False:
-                date1 = date1 + 1
-            if (
-                convention == BusinessDayConvention.MODIFIEDFOLLOWING
-                or convention == BusinessDayConvention.HALFMONTHMODIFIEDFOLLOWING
-            ):
-                if date1.month() != date.month():
-                    return self.adjust(date, BusinessDayConvention.PRECEDING)
-                if convention == BusinessDayConvention.HALFMONTHMODIFIEDFOLLOWING:
-                    if date.day <= 15 and date1.day > 15:
-                        return self.adjust(date, BusinessDayConvention.PRECEDING)
-
-        elif (convention == BusinessDayConvention.PRECEDING) or (
-            convention == BusinessDayConvention.MODIFIEDPRECEDING
-        ):
-            while self.is_business_day(date1) is False:
-                date1 = date1 - 1
-            if convention == BusinessDayConvention.MODIFIEDPRECEDING and (
-                date1.month() != date.month()
-            ):
-                return self.adjust(date, BusinessDayConvention.FOLLOWING)
-        elif convention == BusinessDayConvention.NEAREST:
-            date2 = date
-            while (self.is_business_day(date1) is False) and (
-                self.is_business_day(date2) is False
-            ):
-                date1 = date1 + 1
-                date2 = date2 - 1
-            if self.is_business_day(date1) is False:
-                return date2
-            else:
-                return date1
-        else:
-            raise ValueError("Unknown business-day convention")
-        return date1
+        return Date.from_serial(
+            self._business_day_table().adjust(date.serial_number, convention)
+        )
 
     def advance(
         self,
@@ -94,20 +69,9 @@ class Calendar(metaclass=ABCMeta):
         if n == 0:
             return self.adjust(date, convention)
         elif advance_period.unit == "D":
-            d1 = date
-            if n > 0:
-                while n > 0:
-                    d1 = d1 + 1
-                    while self.is_business_day(d1) is False:
-                        d1 = d1 + 1
-                    n -= 1
-            else:
-                while n < 0:
-                    d1 = d1 - 1
-                    while self.is_business_day(d1) is False:
-                        d1 = d1 - 1
-                    n += 1
-            return d1
+            return Date.from_serial(
+                self._business_day_table().advance(date.serial_number, n)
+            )
         elif advance_period.unit == "W":
             d1 = advance_period + date
             return self.adjust(d1, convention)
@@ -115,6 +79,219 @@ class Calendar(metaclass=ABCMeta):
             d1 = advance_period + date
             return self.adjust(d1, convention)
 
+    def adjust_many(
+        self,
+        dates: Union[DateArray, np.ndarray],
+        convention: BusinessDayConvention,
+    ) -> Union[DateArray, np.ndarray]:
+        """
+        Adjusts an array of dates with respect to a convention, see adjust.
+
+        Parameters
+        ----------
+        dates : DateArray or numpy.ndarray
+            The dates to adjust, either as a DateArray or as an array of serial numbers.
+        convention : str
+            The business day convention, such as following, modified following and such.
+
+        Returns
+        -------
+        The adjusted dates, as a DateArray if dates is a DateArray and as serial numbers otherwise.
+        """
+        serials = np.asarray(dates)
+        if convention == BusinessDayConvention.UNADJUSTED:
+            adjusted = serials.copy()
+        else:
+            adjusted = self._business_day_table().adjust_many(serials, convention)
+        return DateArray(adjusted) if isinstance(dates, DateArray) else adjusted
+
+    def advance_many(
+        self,
+        dates: Union[DateArray, np.ndarray],
+        advance_period: Tenor,
+        convention: BusinessDayConvention,
+    ) -> Union[DateArray, np.ndarray]:
+        """
+        Advances an array of dates forth or back and adjusts them with respect to a convention, see advance.
+
+        Parameters
+        ----------
+        dates : DateArray or numpy.ndarray
+            The dates to advance, either as a DateArray or as an array of serial numbers.
+        advance_period : Tenor
+            The period to advance the dates with.
+        convention : str
+            The business day convention, such as following, modified following and such.
+
+        Returns
+        -------
+        The advanced dates, as a DateArray if dates is a DateArray and as serial numbers otherwise.
+        """
+        serials = np.asarray(dates)
+        n = advance_period.length
+        if n == 0:
+            return self.adjust_many(dates, convention)
+        elif advance_period.unit == "D":
+            advanced = self._business_day_table().advance_many(serials, n)
+        else:
+            advanced = self.adjust_many(add_tenor(serials, advance_period), convention)
+        return DateArray(advanced) if isinstance(dates, DateArray) else advanced
+
+    def business_days_between(
+        self,
+        from_date: Date,
+        to_date: Date,
+        include_first: bool = True,
+        include_last: bool = False,
+    ) -> int:
+        """
+        Returns the number of business days between two dates, negative if to_date is before from_date.
+
+        Parameters
+        ----------
+        from_date : Date
+            The first date of the period.
+        to_date : Date
+            The last date of the period.
+        include_first : bool
+            Whether from_date is counted if it is a business day.
+        include_last : bool
+            Whether to_date is counted if it is a business day.
+        """
+        if from_date == to_date:
+            return int(
+                include_first and include_last and self.is_business_day(from_date)
+            )
+        table = self._business_day_table()
+        first, last = sorted((from_date.serial_number, to_date.serial_number))
+        n = table.count(first, last)
+        if not include_first and self.is_business_day(from_date):
+            n -= 1
+        if not include_last and self.is_business_day(to_date):
+            n -= 1
+        return n if from_date < to_date else -n
+
+    def nth_business_day(self, date: Date, n: int) -> Date:
+        """
+        Returns the n:th business day of the month of the given date, counted from the end of the month if n
+        is negative, e.g. n = -1 returns the last business day of the month.
+        """
+        if n == 0:
+            raise ValueError("n must be a non-zero integer")
+        first = date.serial_number - date.day_of_month() + 1
+        last = first + date._month_length(date.month(), date.leap) - 1
+        if n > 0:
+            dt = Date.from_serial(self._business_day_table().advance(first - 1, n))
+            if dt.serial_number > last:
+                raise ValueError(f"the month of {date} has less than {n} business days")
+        else:
+            dt = Date.from_serial(self._business_day_table().advance(last + 1, n))
+            if dt.serial_number < first:
+                raise ValueError(
+                    f"the month of {date} has less than {-n} business days"
+                )
+        return dt
+
+    def add_holiday(self, dt: Date):
+        """
+        Adds a holiday to the calendar, shared by all instances of the calendar.
+        """
+        self._business_day_table().set_business_day(dt.serial_number, False)
+        self._table_modified()
+
+    def remove_holiday(self, dt: Date):
+        """
+        Makes a date a business day in the calendar, shared by all instances of the calendar.
+        """
+        self._business_day_table().set_business_day(dt.serial_number, True)
+        self._table_modified()
+
+    @property
+    def name(self) -> str:
+        """
+        Returns the name of the calendar.
+        """
+        return type(self).__name__
+
+    def save_tables(self, path: str):
+        """
+        Builds the business day table, cumulative business day count and adjustment maps of the calendar for the
+        whole supported date range and writes them to a file, see load_tables.
+        """
+        self._business_day_table().save(path, self.name)
+
+    def load_tables(self, path: str):
+        """
+        Loads tables written by save_tables for all instances of the calendar, replacing any tables built so
+        far. The file is memory mapped read-only, which makes loading a file map rather than a rebuild and lets
+        processes share the pages of the file.
+        """
+        table = self._new_business_day_table()
+        table.load(path, self.name)
+        _business_day_tables[self._table_key()] = table
+        self._table_modified()
+
+    def is_business_day(self, dt: Date) -> bool:
+        """
+        Returns True if the date is a business day, looked up in the business day table of the calendar.
+        """
+        if not isinstance(dt, Date):
+            raise TypeError(f"dt must be a Date object, received: {dt}")
+        return self._business_day_table().is_business_day(dt.serial_number)
+
+    def _business_day_table(self) -> BusinessDayTable:
+        key = self._table_key()
+        table = _business_day_tables.get(key)
+        if table is None:
+            table = _business_day_tables[key] = self._new_business_day_table()
+        return table
+
+    def _new_business_day_table(self) -> BusinessDayTable:
+        """
+        Creates the business day table of the calendar, filled in from the rule of the calendar.
+        """
+        return BusinessDayTable(self._is_business_day)
+
+    def __eq__(self, value: Calendar) -> bool:
+        if not isinstance(value, Calendar):
+            return NotImplemented
+        return self._table_key() == value._table_key()
+
+    def __hash__(self) -> int:
+        return hash(self._table_key())
+
+    def _table_modified(self):
+        """
+        Discards the tables derived from the table of this calendar and counts the modification.
+        """
+        global _table_generation
+        _table_generation += 1
+        self._discard_dependent_tables()
+
+    def _discard_dependent_tables(self):
+        """
+        Discards the tables derived from the table of this calendar, e.g. those of joint calendars.
+        """
+        key = self._table_key()
+        for dependent_key, table in list(_business_day_tables.items()):
+            if key in table.dependencies:
+                del _business_day_tables[dependent_key]
+
+    def _table_key(self):
+        """
+        Returns the key identifying the business day table of the calendar, instances of the same
+        calendar share their table.
+        """
+        return type(self)
+
     @abstractmethod
-    def is_business_day(self, dt: Date):
+    def _is_business_day(self, dt: Date) -> bool:
         pass
+
+
+def table_generation() -> int:
+    """
+    Returns a number that changes whenever a holiday is added or removed or tables are loaded in any calendar,
+    allowing results derived from business days to be cached.
+    """
+    return _table_generation
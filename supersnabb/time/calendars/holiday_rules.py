@@ -0,0 +1,196 @@
+from __future__ import annotations
+from abc import ABCMeta, abstractmethod
+from supersnabb.time.date import Date, _MIN_YEAR, _MAX_YEAR
+from enum import StrEnum, auto
+from typing import Optional
+
+
+class Observance(StrEnum):
+    """
+    How a holiday falling on a weekend is observed.
+
+    ACTUAL keeps the holiday on its date, NEARESTWEEKDAY moves Saturday to Friday and Sunday to Monday,
+    SUNDAYTOMONDAY only moves Sunday to Monday and NEXTWEEKDAY moves both Saturday and Sunday to Monday.
+    """
+
+    ACTUAL = auto()
+    NEARESTWEEKDAY = auto()
+    SUNDAYTOMONDAY = auto()
+    NEXTWEEKDAY = auto()
+
+
+class HolidayRule(metaclass=ABCMeta):
+    """
+    Base class for holiday rules. A rule yields at most one holiday per year, subclasses implement _serial_number.
+
+    Parameters
+    ----------
+    name : str
+        The name of the holiday.
+    valid_from : int, optional
+        The first year the holiday is observed.
+    valid_to : int, optional
+        The last year the holiday is observed.
+    observance : Observance
+        How the holiday is observed when it falls on a weekend.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        valid_from: Optional[int] = None,
+        valid_to: Optional[int] = None,
+        observance: Observance = Observance.ACTUAL,
+    ):
+        self.name = name
+        self.valid_from = _MIN_YEAR if valid_from is None else valid_from
+        self.valid_to = _MAX_YEAR if valid_to is None else valid_to
+        self.observance = Observance(observance)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name})"
+
+    def serial_number(self, year: int) -> Optional[int]:
+        """
+        Returns the serial number of the observed holiday in the given year, or None if it is not a holiday
+        that year.
+        """
+        if not self.valid_from <= year <= self.valid_to:
+            return None
+        serial_number = self._serial_number(year)
+        if serial_number is None:
+            return None
+        weekday = (serial_number + 5) % 7
+        match self.observance:
+            case Observance.NEARESTWEEKDAY if weekday == 5:
+                return serial_number - 1
+            case Observance.NEARESTWEEKDAY | Observance.SUNDAYTOMONDAY if weekday == 6:
+                return serial_number + 1
+            case Observance.NEXTWEEKDAY if weekday > 4:
+                return serial_number + 7 - weekday
+        return serial_number
+
+    @abstractmethod
+    def _serial_number(self, year: int) -> Optional[int]:
+        pass
+
+
+class FixedDate(HolidayRule):
+    """
+    A holiday on the same date every year, e.g. Christmas Day.
+
+    Parameters
+    ----------
+    name : str
+        The name of the holiday.
+    month : int
+        The month of the holiday.
+    day : int
+        The day of the month of the holiday.
+    """
+
+    def __init__(self, name: str, month: int, day: int, **kwargs):
+        super().__init__(name, **kwargs)
+        self.month = month
+        self.day = day
+
+    def _serial_number(self, year: int) -> int:
+        return Date(year, self.month, self.day).serial_number
+
+
+class NthWeekday(HolidayRule):
+    """
+    A holiday on the n:th given weekday of a month, counted from the end of the month if n is negative.
+
+    Parameters
+    ----------
+    name : str
+        The name of the holiday.
+    month : int
+        The month of the holiday.
+    weekday : int
+        The weekday of the holiday, where Monday is 0 and Sunday is 6.
+    n : int
+        Which of the weekdays in the month is the holiday, e.g. -1 for the last one.
+    """
+
+    def __init__(self, name: str, month: int, weekday: int, n: int, **kwargs):
+        super().__init__(name, **kwargs)
+        if n == 0:
+            raise ValueError("n must be a non-zero integer")
+        self.month = month
+        self.weekday = weekday
+        self.n = n
+
+    def _serial_number(self, year: int) -> int:
+        first = Date(year, self.month, 1)
+        if self.n > 0:
+            first_weekday = first.serial_number + (self.weekday - first.weekday()) % 7
+            return first_weekday + 7 * (self.n - 1)
+        last = first + first._month_length(self.month, first.leap) - 1
+        last_weekday = last.serial_number - (last.weekday() - self.weekday) % 7
+        return last_weekday + 7 * (self.n + 1)
+
+
+class EasterOffset(HolidayRule):
+    """
+    A holiday a number of days from Easter Sunday, e.g. -2 for Good Friday and 1 for Easter Monday.
+
+    Parameters
+    ----------
+    name : str
+        The name of the holiday.
+    offset : int
+        The number of days from Easter Sunday.
+    """
+
+    def __init__(self, name: str, offset: int, **kwargs):
+        super().__init__(name, **kwargs)
+        self.offset = offset
+
+    def _serial_number(self, year: int) -> int:
+        first = Date(year, 1, 1)
+        # Easter Monday is given as a day of the year
+        return first.serial_number + first.easter_monday() - 2 + self.offset
+
+
+class WeekdayInRange(HolidayRule):
+    """
+    A holiday on the given weekday within a range of days of a month, e.g. Midsummer Eve on the Friday
+    between June 19 and June 25.
+
+    Parameters
+    ----------
+    name : str
+        The name of the holiday.
+    month : int
+        The month of the holiday.
+    weekday : int
+        The weekday of the holiday, where Monday is 0 and Sunday is 6.
+    first_day : int
+        The first day of the month the holiday can fall on.
+    last_day : int
+        The last day of the month the holiday can fall on, there is no holiday if the weekday is not in the range.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        month: int,
+        weekday: int,
+        first_day: int,
+        last_day: int,
+        **kwargs,
+    ):
+        super().__init__(name, **kwargs)
+        self.month = month
+        self.weekday = weekday
+        self.first_day = first_day
+        self.last_day = last_day
+
+    def _serial_number(self, year: int) -> Optional[int]:
+        first = Date(year, self.month, self.first_day)
+        days = (self.weekday - first.weekday()) % 7
+        if self.first_day + days > self.last_day:
+            return None
+        return first.serial_number + days
@@ -0,0 +1,94 @@
+from supersnabb.time.calendar import Calendar
+from supersnabb.time.business_day_table import (
+    BusinessDayTable,
+    year_range,
+    _BUSINESS_DAY,
+    _HOLIDAY,
+)
+from supersnabb.time.date import Date
+from enum import StrEnum, auto
+import numpy as np
+
+
+class JointCalendarRule(StrEnum):
+    JOINHOLIDAYS = auto()
+    JOINBUSINESSDAYS = auto()
+
+
+class JointCalendar(Calendar):
+    """
+    A calendar combining several calendars. With JOINHOLIDAYS a date is a business day if it is a business day
+    in all calendars, with JOINBUSINESSDAYS if it is a business day in any of them.
+
+    The business day table of a joint calendar is merged from the tables of its calendars and shared by all
+    joint calendars with the same calendars and rule, regardless of their order.
+
+    Parameters
+    ----------
+    calendars : Calendar
+        The calendars to combine.
+    rule : JointCalendarRule
+        The rule used to combine the calendars.
+    """
+
+    def __init__(
+        self,
+        *calendars: Calendar,
+        rule: JointCalendarRule = JointCalendarRule.JOINHOLIDAYS,
+    ):
+        if len(calendars) == 0:
+            raise ValueError("JointCalendar needs at least one calendar")
+        self.calendars = calendars
+        self.rule = JointCalendarRule(rule)
+
+    @property
+    def name(self) -> str:
+        names = sorted(calendar.name for calendar in self.calendars)
+        return f"{self.rule}({', '.join(names)})"
+
+    def _table_key(self):
+        return (
+            JointCalendar,
+            self.rule,
+            frozenset(calendar._table_key() for calendar in self.calendars),
+        )
+
+    def _new_business_day_table(self) -> BusinessDayTable:
+        return _JointBusinessDayTable(self)
+
+    def _is_business_day(self, dt: Date) -> bool:
+        match self.rule:
+            case JointCalendarRule.JOINHOLIDAYS:
+                return all(calendar.is_business_day(dt) for calendar in self.calendars)
+            case JointCalendarRule.JOINBUSINESSDAYS:
+                return any(calendar.is_business_day(dt) for calendar in self.calendars)
+
+
+class _JointBusinessDayTable(BusinessDayTable):
+    """
+    A business day table filled in by merging the tables of the calendars of a joint calendar one year at a time.
+    """
+
+    def __init__(self, calendar: JointCalendar):
+        tables = [member._business_day_table() for member in calendar.calendars]
+        dependencies = set()
+        for member, table in zip(calendar.calendars, tables):
+            dependencies |= {member._table_key()} | table.dependencies
+        super().__init__(calendar._is_business_day, frozenset(dependencies))
+        self._tables = tables
+        self._join = (
+            np.logical_and
+            if calendar.rule == JointCalendarRule.JOINHOLIDAYS
+            else np.logical_or
+        )
+
+    def _build_year(self, year: int):
+        first, last = year_range(year)
+        business_days = []
+        for table in self._tables:
+            # Looking up the first date fills in the whole year of the table
+            table.is_business_day(first)
+            business_days.append(table.flags[first : last + 1] == _BUSINESS_DAY)
+        self.flags[first : last + 1] = np.where(
+            self._join.reduce(business_days), _BUSINESS_DAY, _HOLIDAY
+        )
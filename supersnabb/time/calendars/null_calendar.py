@@ -6,7 +6,7 @@ class NullCalendar(Calendar):
     def __init__(self):
         pass
 
-    def is_business_day(self, dt: Date):
+    def _is_business_day(self, dt: Date) -> bool:
         """
         A null calendar to calculate dates for schedule. Contains no holidays but check for weekends.
         Thus, if it is a business day it should return True else False
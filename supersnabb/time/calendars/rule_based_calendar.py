@@ -0,0 +1,93 @@
+from supersnabb.time.calendar import Calendar
+from supersnabb.time.calendars.holiday_rules import HolidayRule
+from supersnabb.time.business_day_table import (
+    BusinessDayTable,
+    year_range,
+    _BUSINESS_DAY,
+    _HOLIDAY,
+)
+from supersnabb.time.date import Date
+from functools import lru_cache
+from typing import List, Tuple
+import numpy as np
+
+
+class RuleBasedCalendar(Calendar):
+    """
+    Base class for calendars defined by a set of holiday rules on top of a weekend. Subclasses only declare
+    the rules, which are compiled once per year into a sorted tuple of holidays.
+
+    Attributes
+    ----------
+    rules : tuple of HolidayRule
+        The holiday rules of the calendar.
+    weekend : tuple of int
+        The weekdays of the weekend, where Monday is 0 and Sunday is 6.
+    """
+
+    rules: Tuple[HolidayRule, ...] = ()
+    weekend: Tuple[int, ...] = (5, 6)
+
+    def holidays(self, year: int) -> List[Date]:
+        """
+        Returns the holidays given by the rules of the calendar that fall within the given year.
+        """
+        first, last = year_range(year)
+        return [
+            Date.from_serial(serial_number)
+            for serial_number in _holidays_around(self.rules, year)
+            if first <= serial_number <= last
+        ]
+
+    def _new_business_day_table(self) -> BusinessDayTable:
+        return _RuleBasedBusinessDayTable(self)
+
+    def _is_business_day(self, dt: Date) -> bool:
+        return (
+            dt.weekday() not in self.weekend
+            and dt.serial_number not in _holidays_around(self.rules, dt.year())
+        )
+
+
+@lru_cache(maxsize=4096)
+def compile_holidays(rules: Tuple[HolidayRule, ...], year: int) -> Tuple[int, ...]:
+    """
+    Returns the sorted serial numbers of the holidays given by the rules for the given year. Observed holidays
+    may fall outside of the year, e.g. when New Year's Day is moved to the preceding Friday.
+    """
+    holidays = (rule.serial_number(year) for rule in rules)
+    return tuple(sorted({holiday for holiday in holidays if holiday is not None}))
+
+
+def _holidays_around(rules: Tuple[HolidayRule, ...], year: int) -> Tuple[int, ...]:
+    """
+    Returns the holidays of the given year and its neighbours, covering holidays observed across a year end.
+    """
+    return (
+        compile_holidays(rules, year - 1)
+        + compile_holidays(rules, year)
+        + compile_holidays(rules, year + 1)
+    )
+
+
+class _RuleBasedBusinessDayTable(BusinessDayTable):
+    """
+    A business day table filled in one year at a time from the weekend and the compiled holidays of a
+    rule based calendar.
+    """
+
+    def __init__(self, calendar: RuleBasedCalendar):
+        super().__init__(calendar._is_business_day)
+        self._rules = calendar.rules
+        self._weekend = list(calendar.weekend)
+
+    def _build_year(self, year: int):
+        first, last = year_range(year)
+        serial_numbers = np.arange(first, last + 1)
+        flags = np.where(
+            np.isin((serial_numbers + 5) % 7, self._weekend), _HOLIDAY, _BUSINESS_DAY
+        )
+        holidays = np.array(_holidays_around(self._rules, year), dtype=np.int64)
+        holidays = holidays[(holidays >= first) & (holidays <= last)]
+        flags[holidays - first] = _HOLIDAY
+        self.flags[first : last + 1] = flags
@@ -1,54 +1,33 @@
-from supersnabb.time.calendar import Calendar
-from supersnabb.time.date import Date
+from supersnabb.time.calendars.rule_based_calendar import RuleBasedCalendar
+from supersnabb.time.calendars.holiday_rules import (
+    EasterOffset,
+    FixedDate,
+    WeekdayInRange,
+)
 
 
-class Sweden(Calendar):
+class Sweden(RuleBasedCalendar):
     """
     Returns true if input is a business day in Sweden else false.
     """
 
+    rules = (
+        EasterOffset("Good Friday", -2),
+        EasterOffset("Easter Monday", 1),
+        EasterOffset("Ascension Thursday", 39),
+        EasterOffset("Whit Monday", 50, valid_to=2004),
+        FixedDate("New Year's Day", 1, 1),
+        FixedDate("Epiphany", 1, 6),
+        FixedDate("May Day", 5, 1),
+        # Only a holiday since 2005
+        FixedDate("National Day", 6, 6, valid_from=2005),
+        # Friday between June 19-25
+        WeekdayInRange("Midsummer Eve", 6, 4, 19, 25),
+        FixedDate("Christmas Eve", 12, 24),
+        FixedDate("Christmas Day", 12, 25),
+        FixedDate("Boxing Day", 12, 26),
+        FixedDate("New Year's Eve", 12, 31),
+    )
+
     def __init__(self):
         pass
-
-    def is_business_day(self, dt: Date):
-        if not isinstance(dt, Date):
-            raise TypeError(f"dt must be a Date object, received: {dt}")
-        w = dt.weekday()
-        d = dt.day_of_month()  # dayOfMonth
-        dd = dt.day_of_year()
-        m = dt.month()
-        y = dt.year()
-        easter_monday = dt.easter_monday()
-        if (
-            dt.is_week()
-            # Good Friday
-            | (dd == (easter_monday - 3))
-            # Easter Monday
-            | (dd == easter_monday)
-            # Ascension Thursday
-            | (dd == easter_monday + 38)
-            # Whit Monday (till 2004)
-            | ((dd == (easter_monday + 49)) & (y < 2005))
-            # New Year's Day
-            | ((d == 1) & (m == 1))
-            # Epiphany
-            | ((d == 6) & (m == 1))
-            # May Day
-            | ((d == 1) & (m == 5))
-            # National Day
-            # Only a holiday since 2005
-            | ((d == 6) & (m == 6) & (y >= 2005))
-            # Midsummer Eve (Friday between June 19-25)
-            | ((w == 4) & (d >= 19) & (d <= 25) & (m == 6))
-            # Christmas Eve
-            | ((d == 24) & (m == 12))
-            # Christmas Day
-            | ((d == 25) & (m == 12))
-            # Boxing Day
-            | ((d == 26) & (m == 12))
-            # New Year's Eve
-            | ((d == 31) & (m == 12))
-        ):
-            return False
-        else:
-            return True
@@ -1,119 +1,1202 @@
 from __future__ import annotations
 import datetime
-from dateutil.relativedelta import relativedelta
-from dateutil import easter  # Only needed for Easter Monday
-from typing import Optional
+from typing import Optional, Union
+
+_MIN_YEAR = 1900
+_MAX_YEAR = 2200
+
+# Serial numbers count the days since this date, following Excel and QuantLib
+_EPOCH = datetime.date(1899, 12, 30)
+
+_MONTH_LENGTH = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+_MONTH_LENGTH_LEAP = [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+
+_MONTH_OFFSET = [
+    0,
+    31,
+    59,
+    90,
+    120,
+    151,  # Jan - Jun
+    181,
+    212,
+    243,
+    273,
+    304,
+    334,  # Jun - Dec
+    365,  # used in dayOfMonth to bracket day
+]
+
+_MONTH_OFFSET_LEAP = [
+    0,
+    31,
+    60,
+    91,
+    121,
+    152,  # Jan - Jun
+    182,
+    213,
+    244,
+    274,
+    305,
+    335,  # Jun - Dec
+    366,  # used in dayOfMonth to bracket day
+]
+
+_YEAR_OFFSET = [
+    # 1900-1909
+    0,
+    366,
+    731,
+    1096,
+    1461,
+    1827,
+    2192,
+    2557,
+    2922,
+    3288,
+    # 1910-1919
+    3653,
+    4018,
+    4383,
+    4749,
+    5114,
+    5479,
+    5844,
+    6210,
+    6575,
+    6940,
+    # 1920-1929
+    7305,
+    7671,
+    8036,
+    8401,
+    8766,
+    9132,
+    9497,
+    9862,
+    10227,
+    10593,
+    # 1930-1939
+    10958,
+    11323,
+    11688,
+    12054,
+    12419,
+    12784,
+    13149,
+    13515,
+    13880,
+    14245,
+    # 1940-1949
+    14610,
+    14976,
+    15341,
+    15706,
+    16071,
+    16437,
+    16802,
+    17167,
+    17532,
+    17898,
+    # 1950-1959
+    18263,
+    18628,
+    18993,
+    19359,
+    19724,
+    20089,
+    20454,
+    20820,
+    21185,
+    21550,
+    # 1960-1969
+    21915,
+    22281,
+    22646,
+    23011,
+    23376,
+    23742,
+    24107,
+    24472,
+    24837,
+    25203,
+    # 1970-1979
+    25568,
+    25933,
+    26298,
+    26664,
+    27029,
+    27394,
+    27759,
+    28125,
+    28490,
+    28855,
+    # 1980-1989
+    29220,
+    29586,
+    29951,
+    30316,
+    30681,
+    31047,
+    31412,
+    31777,
+    32142,
+    32508,
+    # 1990-1999
+    32873,
+    33238,
+    33603,
+    33969,
+    34334,
+    34699,
+    35064,
+    35430,
+    35795,
+    36160,
+    # 2000-2009
+    36525,
+    36891,
+    37256,
+    37621,
+    37986,
+    38352,
+    38717,
+    39082,
+    39447,
+    39813,
+    # 2010-2019
+    40178,
+    40543,
+    40908,
+    41274,
+    41639,
+    42004,
+    42369,
+    42735,
+    43100,
+    43465,
+    # 2020-2029
+    43830,
+    44196,
+    44561,
+    44926,
+    45291,
+    45657,
+    46022,
+    46387,
+    46752,
+    47118,
+    # 2030-2039
+    47483,
+    47848,
+    48213,
+    48579,
+    48944,
+    49309,
+    49674,
+    50040,
+    50405,
+    50770,
+    # 2040-2049
+    51135,
+    51501,
+    51866,
+    52231,
+    52596,
+    52962,
+    53327,
+    53692,
+    54057,
+    54423,
+    # 2050-2059
+    54788,
+    55153,
+    55518,
+    55884,
+    56249,
+    56614,
+    56979,
+    57345,
+    57710,
+    58075,
+    # 2060-2069
+    58440,
+    58806,
+    59171,
+    59536,
+    59901,
+    60267,
+    60632,
+    60997,
+    61362,
+    61728,
+    # 2070-2079
+    62093,
+    62458,
+    62823,
+    63189,
+    63554,
+    63919,
+    64284,
+    64650,
+    65015,
+    65380,
+    # 2080-2089
+    65745,
+    66111,
+    66476,
+    66841,
+    67206,
+    67572,
+    67937,
+    68302,
+    68667,
+    69033,
+    # 2090-2099
+    69398,
+    69763,
+    70128,
+    70494,
+    70859,
+    71224,
+    71589,
+    71955,
+    72320,
+    72685,
+    # 2100-2109
+    73050,
+    73415,
+    73780,
+    74145,
+    74510,
+    74876,
+    75241,
+    75606,
+    75971,
+    76337,
+    # 2110-2119
+    76702,
+    77067,
+    77432,
+    77798,
+    78163,
+    78528,
+    78893,
+    79259,
+    79624,
+    79989,
+    # 2120-2129
+    80354,
+    80720,
+    81085,
+    81450,
+    81815,
+    82181,
+    82546,
+    82911,
+    83276,
+    83642,
+    # 2130-2139
+    84007,
+    84372,
+    84737,
+    85103,
+    85468,
+    85833,
+    86198,
+    86564,
+    86929,
+    87294,
+    # 2140-2149
+    87659,
+    88025,
+    88390,
+    88755,
+    89120,
+    89486,
+    89851,
+    90216,
+    90581,
+    90947,
+    # 2150-2159
+    91312,
+    91677,
+    92042,
+    92408,
+    92773,
+    93138,
+    93503,
+    93869,
+    94234,
+    94599,
+    # 2160-2169
+    94964,
+    95330,
+    95695,
+    96060,
+    96425,
+    96791,
+    97156,
+    97521,
+    97886,
+    98252,
+    # 2170-2179
+    98617,
+    98982,
+    99347,
+    99713,
+    100078,
+    100443,
+    100808,
+    101174,
+    101539,
+    101904,
+    # 2180-2189
+    102269,
+    102635,
+    103000,
+    103365,
+    103730,
+    104096,
+    104461,
+    104826,
+    105191,
+    105557,
+    # 2190-2199
+    105922,
+    106287,
+    106652,
+    107018,
+    107383,
+    107748,
+    108113,
+    108479,
+    108844,
+    109209,
+    # 2200
+    109574,
+]
+
+_YEAR_IS_LEAP = [
+    # 1900 is leap in agreement with Excel's bug
+    # 1900 is out of valid date range anyway
+    # 1900-1909
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    # 1910-1919
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    # 1920-1929
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    # 1930-1939
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    # 1940-1949
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    # 1950-1959
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    # 1960-1969
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    # 1970-1979
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    # 1980-1989
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    # 1990-1999
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    # 2000-2009
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    # 2010-2019
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    # 2020-2029
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    # 2030-2039
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    # 2040-2049
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    # 2050-2059
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    # 2060-2069
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    # 2070-2079
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    # 2080-2089
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    # 2090-2099
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    # 2100-2109
+    False,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    # 2110-2119
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    # 2120-2129
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    # 2130-2139
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    # 2140-2149
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    # 2150-2159
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    # 2160-2169
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    # 2170-2179
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    # 2180-2189
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    # 2190-2199
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    True,
+    False,
+    False,
+    False,
+    # 2200
+    False,
+]
+
+
+# Day of the year of Easter Monday, for 1900 counted with Excel's 29 February 1900 like Date.day_of_year
+_EASTER_MONDAY = [
+    # 1900-1909
+    107,
+    98,
+    90,
+    103,
+    95,
+    114,
+    106,
+    91,
+    111,
+    102,
+    # 1910-1919
+    87,
+    107,
+    99,
+    83,
+    103,
+    95,
+    115,
+    99,
+    91,
+    111,
+    # 1920-1929
+    96,
+    87,
+    107,
+    92,
+    112,
+    103,
+    95,
+    108,
+    100,
+    91,
+    # 1930-1939
+    111,
+    96,
+    88,
+    107,
+    92,
+    112,
+    104,
+    88,
+    108,
+    100,
+    # 1940-1949
+    85,
+    104,
+    96,
+    116,
+    101,
+    92,
+    112,
+    97,
+    89,
+    108,
+    # 1950-1959
+    100,
+    85,
+    105,
+    96,
+    109,
+    101,
+    93,
+    112,
+    97,
+    89,
+    # 1960-1969
+    109,
+    93,
+    113,
+    105,
+    90,
+    109,
+    101,
+    86,
+    106,
+    97,
+    # 1970-1979
+    89,
+    102,
+    94,
+    113,
+    105,
+    90,
+    110,
+    101,
+    86,
+    106,
+    # 1980-1989
+    98,
+    110,
+    102,
+    94,
+    114,
+    98,
+    90,
+    110,
+    95,
+    86,
+    # 1990-1999
+    106,
+    91,
+    111,
+    102,
+    94,
+    107,
+    99,
+    90,
+    103,
+    95,
+    # 2000-2009
+    115,
+    106,
+    91,
+    111,
+    103,
+    87,
+    107,
+    99,
+    84,
+    103,
+    # 2010-2019
+    95,
+    115,
+    100,
+    91,
+    111,
+    96,
+    88,
+    107,
+    92,
+    112,
+    # 2020-2029
+    104,
+    95,
+    108,
+    100,
+    92,
+    111,
+    96,
+    88,
+    108,
+    92,
+    # 2030-2039
+    112,
+    104,
+    89,
+    108,
+    100,
+    85,
+    105,
+    96,
+    116,
+    101,
+    # 2040-2049
+    93,
+    112,
+    97,
+    89,
+    109,
+    100,
+    85,
+    105,
+    97,
+    109,
+    # 2050-2059
+    101,
+    93,
+    113,
+    97,
+    89,
+    109,
+    94,
+    113,
+    105,
+    90,
+    # 2060-2069
+    110,
+    101,
+    86,
+    106,
+    98,
+    89,
+    102,
+    94,
+    114,
+    105,
+    # 2070-2079
+    90,
+    110,
+    102,
+    86,
+    106,
+    98,
+    111,
+    102,
+    94,
+    114,
+    # 2080-2089
+    99,
+    90,
+    110,
+    95,
+    87,
+    106,
+    91,
+    111,
+    103,
+    94,
+    # 2090-2099
+    107,
+    99,
+    91,
+    103,
+    95,
+    115,
+    107,
+    91,
+    111,
+    103,
+    # 2100-2109
+    88,
+    108,
+    100,
+    85,
+    105,
+    96,
+    109,
+    101,
+    93,
+    112,
+    # 2110-2119
+    97,
+    89,
+    109,
+    93,
+    113,
+    105,
+    90,
+    109,
+    101,
+    86,
+    # 2120-2129
+    106,
+    97,
+    89,
+    102,
+    94,
+    113,
+    105,
+    90,
+    110,
+    101,
+    # 2130-2139
+    86,
+    106,
+    98,
+    110,
+    102,
+    94,
+    114,
+    98,
+    90,
+    110,
+    # 2140-2149
+    95,
+    86,
+    106,
+    91,
+    111,
+    102,
+    94,
+    107,
+    99,
+    90,
+    # 2150-2159
+    103,
+    95,
+    115,
+    106,
+    91,
+    111,
+    103,
+    87,
+    107,
+    99,
+    # 2160-2169
+    84,
+    103,
+    95,
+    115,
+    100,
+    91,
+    111,
+    96,
+    88,
+    107,
+    # 2170-2179
+    92,
+    112,
+    104,
+    95,
+    108,
+    100,
+    92,
+    111,
+    96,
+    88,
+    # 2180-2189
+    108,
+    92,
+    112,
+    104,
+    89,
+    108,
+    100,
+    85,
+    105,
+    96,
+    # 2190-2199
+    116,
+    101,
+    93,
+    112,
+    97,
+    89,
+    109,
+    100,
+    85,
+    105,
+    # 2200
+    97,
+]
 
 
 class Tenor:
     """
     Represents a custom type for tenors.
 
+    Tenors are immutable values of a length and a unit. Tenors are interned, so parsing the same tenor twice
+    returns the same object, and adding a tenor to a date is integer arithmetic on the serial number of the date.
+
     Parameters
     ----------
-    tenor : str
-        The tenor string, e.g. "1D", "1W", "1M", "1Y".
+    tenor : str or int
+        The tenor string, e.g. "1D", "1W", "1M", "1Y", or the length of the tenor if unit is given.
+    unit : str, optional
+        The unit of the tenor, can be "D", "W", "M" or "Y".
     """
 
-    def __init__(self, tenor: str):
-        # Check that tenor is a string and fulfills the format
-        if not isinstance(tenor, str):
-            raise ValueError("tenor must be a string")
-        if tenor[-1].upper() not in ["D", "W", "M", "Y"]:
-            raise ValueError("tenor must end with D, W, M or Y")
-        if tenor[0] == "-":
-            self.length = int(tenor[:-1])
-            if tenor[1:-1].isdigit() is not True:
-                raise ValueError("tenor must start with a number")
-
-        elif not tenor[:-1].isdigit():
-            raise ValueError("tenor must start with a number")
+    __slots__ = ("length", "unit")
+
+    def __new__(cls, tenor: Union[str, int], unit: Optional[str] = None) -> Tenor:
+        key = tenor if unit is None else (tenor, unit)
+        interned = _tenors.get(key)
+        if interned is not None:
+            return interned
+
+        if unit is None:
+            length, unit = _parse_tenor(tenor)
         else:
-            self.length = int(tenor[:-1])
+            if not isinstance(tenor, int):
+                raise ValueError("tenor length must be an integer")
+            if not isinstance(unit, str) or unit.upper() not in ["D", "W", "M", "Y"]:
+                raise ValueError("tenor must end with D, W, M or Y")
+            length, unit = tenor, unit.upper()
 
-        self._tenor = tenor.upper()
-        self.unit = self._tenor[-1]
+        self = object.__new__(cls)
+        object.__setattr__(self, "length", length)
+        object.__setattr__(self, "unit", unit)
+        if len(_tenors) < _MAX_INTERNED_TENORS:
+            _tenors[key] = self
+        return self
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Tenor is immutable")
+
+    def __reduce__(self):
+        return (Tenor, (self.length, self.unit))
 
     def __repr__(self):
-        return self._tenor
+        return f"{self.length}{self.unit}"
+
+    def __eq__(self, value: Tenor) -> bool:
+        if not isinstance(value, Tenor):
+            return NotImplemented
+        return self.length == value.length and self.unit == value.unit
+
+    def __hash__(self) -> int:
+        return hash((self.length, self.unit))
 
     def __add__(self, value) -> Tenor:
         if isinstance(value, Date):
-            return self._add_tenor_to_date(value, self.length, self.unit, "add")
+            return _from_serial(_add_tenor(value.serial_number, self.length, self.unit))
         elif isinstance(value, Tenor):
             if self.unit != value.unit:
                 raise ValueError("cannot add tenors of different units")
-            return Tenor(str(self.length + value.length) + self.unit)
-        else:
-            value = Tenor(value)
-            return self + value
+            return Tenor(self.length + value.length, self.unit)
+        elif isinstance(value, str):
+            return self + Tenor(value)
+        return NotImplemented
 
-    def _radd__(self, value) -> Tenor:
+    def __radd__(self, value) -> Tenor:
         return self.__add__(value)
 
     def __sub__(self, value) -> Tenor:
         if isinstance(value, Date):
-            return self._add_tenor_to_date(value, self.length, self.unit, "sub")
+            return _from_serial(
+                _add_tenor(value.serial_number, -self.length, self.unit)
+            )
         elif isinstance(value, Tenor):
             if self.unit != value.unit:
                 raise ValueError("cannot add tenors of different units")
-            return Tenor(str(self.length - value.length) + self.unit)
-        else:
-            value = Tenor(value)
-            return self - value
+            return Tenor(self.length - value.length, self.unit)
+        elif isinstance(value, str):
+            return self - Tenor(value)
+        return NotImplemented
 
     def __rsub__(self, value) -> Tenor:
         return self.__sub__(value)
 
-    def _add_tenor_to_date(
-        self, dt: Date, length: int, unit: str, func: str
-    ) -> datetime.date:
-        """
-        Returns d + n*unit. Meaning that datetime.date(2023,1,1) + Tenor("1D") would return datetime.date(2023,1,2).
-        Note that if the unit is negative then the date will be subtracted instead of added.
-
-        Parameters
-        ----------
-        date : Date
-            The date to add the tenor to.
-        fixing : int
-            The number of units to add to the date.
-        time_unit : str
-            The unit of the tenor, can be "D", "W", "M" or "Y".
-        """
-
-        def create_date(dt: datetime.date) -> Date:
-            return Date(dt.year, dt.month, dt.day)
-
-        if func == "sub":
-            if unit == "D":
-                return create_date(dt.date() - relativedelta(days=length))
-            elif unit == "W":
-                return create_date(dt.date() - relativedelta(weeks=length))
-            elif unit == "M":
-                return create_date(dt.date() - relativedelta(months=length))
-            elif unit == "Y":
-                return create_date(dt.date() - relativedelta(years=length))
-        else:
-            if unit == "D":
-                return create_date(dt.date() + relativedelta(days=length))
-            elif unit == "W":
-                return create_date(dt.date() + relativedelta(weeks=length))
-            elif unit == "M":
-                return create_date(dt.date() + relativedelta(months=length))
-            elif unit == "Y":
-                return create_date(dt.date() + relativedelta(years=length))
+    def __neg__(self) -> Tenor:
+        return self * -1
 
     def __mul__(self, value: int) -> Tenor:
         if not isinstance(value, int):
             raise ValueError("Tenor needs to be multiplied with an integer")
-        return Tenor(str(self.length * value) + self.unit)
+        return Tenor(self.length * value, self.unit)
+
+    def __rmul__(self, value: int) -> Tenor:
+        return self.__mul__(value)
+
+
+# Parsed tenors, keyed by the arguments they were created with
+_tenors = {}
+_MAX_INTERNED_TENORS = 4096
+
+
+def _parse_tenor(tenor: str) -> tuple:
+    # Check that tenor is a string and fulfills the format
+    if not isinstance(tenor, str):
+        raise ValueError("tenor must be a string")
+    if tenor[-1].upper() not in ["D", "W", "M", "Y"]:
+        raise ValueError("tenor must end with D, W, M or Y")
+    digits = tenor[1:-1] if tenor[0] == "-" else tenor[:-1]
+    if not digits.isdigit():
+        raise ValueError("tenor must start with a number")
+    return int(tenor[:-1]), tenor[-1].upper()
+
+
+def _add_tenor(serial_number: int, length: int, unit: str) -> int:
+    """
+    Returns the serial number plus length units, where months and years are clamped to the end of the month,
+    e.g. 2023-01-31 plus 1M is 2023-02-28.
+    """
+    if unit == "D":
+        return serial_number + length
+    elif unit == "W":
+        return serial_number + 7 * length
+    months = length if unit == "M" else 12 * length
+    y, m, d = _from_serial(serial_number)._year_month_day()
+    y, m = divmod(y * 12 + m - 1 + months, 12)
+    m += 1
+    if not _MIN_YEAR <= y <= _MAX_YEAR:
+        raise ValueError("year must be between 1900 and 2200")
+    leap = _YEAR_IS_LEAP[y - 1900]
+    return (
+        min(d, _month_length(m, leap)) + _month_offset(m, leap) + _YEAR_OFFSET[y - 1900]
+    )
 
 
 class Date:
     """
     Represents a custom type for dates.
 
+    The only state of a date is its serial number, i.e. the number of days since 1899-12-30, which makes
+    arithmetic, comparisons and hashing plain integer operations. Year, month and day are derived from the
+    serial number through the offset tables above instead of going through datetime.
+
     Parameters
     ----------
     year: int
@@ -125,833 +1208,198 @@ class Date:
 
     """
 
+    __slots__ = ("serial_number",)
+
     def __init__(self, y: int, m: int, d: int):
         if not all(isinstance(date_args, int) for date_args in [y, m, d]):
             raise ValueError("year, month and day must be integers")
-        if y < 1900:
+        if y < _MIN_YEAR:
             raise ValueError("year must be greater than 1900")
+        if y > _MAX_YEAR:
+            raise ValueError("year must be less than or equal to 2200")
         if m < 1 or m > 12:
             raise ValueError("month must be between 1 and 12")
         if d < 1 or d > 31:
             raise ValueError("day must be between 1 and 31")
-        try:
-            datetime.date(y, m, d)
-        except ValueError:
+        # The leap table follows Excel in treating 1900 as a leap year, validate against the real calendar
+        if d > _month_length(m, y % 4 == 0 and (y % 100 != 0 or y % 400 == 0)):
             raise ValueError("The given input for date are not valid")
-        self.leap = self._is_leap(y)
-        # day_length = self._month_length(month, leap)
-        self.month_offset = self._month_offset(m, self.leap)
-        year_offset = self._year_offset(y)
 
-        self.serial_number = d + self.month_offset + year_offset
+        self.serial_number = (
+            d + _month_offset(m, _YEAR_IS_LEAP[y - 1900]) + _YEAR_OFFSET[y - 1900]
+        )
+
+    @classmethod
+    def from_serial(cls, serial_number: int) -> Date:
+        """
+        Creates a date directly from a serial number without any validation.
+
+        Parameters
+        ----------
+        serial_number : int
+            The number of days since 1899-12-30.
+        """
+        dt = object.__new__(cls)
+        dt.serial_number = serial_number
+        return dt
 
     def ISO(self) -> str:
         """
         Returns the date in ISO format, e.g. 2023-01-01.
         """
-        return self.date().isoformat()
+        return "{:04d}-{:02d}-{:02d}".format(*self._year_month_day())
 
     def __rsub__(self, days: int) -> Date:
         return self.__add__(days)
 
     def __sub__(self, days: int) -> Date:
-        serial_number = self.serial_number - days
-        new_date = self.date(serial_number)
-        return Date(new_date.year, new_date.month, new_date.day)
+        if isinstance(days, Tenor):
+            # Tenors are subtracted by Tenor.__rsub__
+            return NotImplemented
+        return _from_serial(self.serial_number - days)
 
     def __radd__(self, days: int) -> Date:
         return self.__add__(days)
 
     def __add__(self, days: int) -> Date:
-        serial_number = self.serial_number + days
-        new_date = self.date(serial_number)
-        return Date(new_date.year, new_date.month, new_date.day)
+        if isinstance(days, Tenor):
+            # Tenors are added by Tenor.__radd__
+            return NotImplemented
+        return _from_serial(self.serial_number + days)
 
     def __eq__(self, value: Date) -> bool:
-        return True if self.ISO() == value.ISO() else False
+        if not isinstance(value, Date):
+            return NotImplemented
+        return self.serial_number == value.serial_number
+
+    def __hash__(self) -> int:
+        return hash(self.serial_number)
 
     def __repr__(self) -> str:
         return self.ISO()
 
     def __lt__(self, value: Date) -> bool:
-        return self.date() < value.date()
+        if not isinstance(value, Date):
+            return NotImplemented
+        return self.serial_number < value.serial_number
 
     def __le__(self, value: Date) -> bool:
-        return self.date() <= value.date()
+        if not isinstance(value, Date):
+            return NotImplemented
+        return self.serial_number <= value.serial_number
 
     def __ge__(self, value: Date) -> bool:
-        return self.date() >= value.date()
+        if not isinstance(value, Date):
+            return NotImplemented
+        return self.serial_number >= value.serial_number
 
     def __gt__(self, value: Date) -> bool:
-        return self.date() > value.date()
+        if not isinstance(value, Date):
+            return NotImplemented
+        return self.serial_number > value.serial_number
+
+    @property
+    def leap(self) -> bool:
+        """
+        Returns True if the year of the date is a leap year.
+        """
+        return _YEAR_IS_LEAP[self.year() - 1900]
+
+    @property
+    def month_offset(self) -> int:
+        """
+        Returns the number of days in the year before the first day of the month of the date.
+        """
+        return _month_offset(self.month(), self.leap)
 
     def day_of_month(self) -> int:
         """
         Returns the day of the month for the date.
         """
-        return self.date().day
+        return self._year_month_day()[2]
 
     def date(self, serial_number: Optional[int] = None) -> datetime.date:
         """
         Calculates the date from the serial number. Can also be used to calculate the date from a given serial number.
         """
-        start_date = datetime.date(1899, 12, 30)
         if serial_number is not None:
-            return start_date + datetime.timedelta(days=serial_number)
+            return _EPOCH + datetime.timedelta(days=serial_number)
         else:
-            return start_date + datetime.timedelta(days=self.serial_number)
+            return _EPOCH + datetime.timedelta(days=self.serial_number)
 
     def is_week(self) -> bool:
         """
         Returns True if the date is a weekend.
         """
-        return self.date().weekday() > 4
+        return (self.serial_number + 5) % 7 > 4
 
     def weekday(self) -> int:
         """
-        Returns the day of the week for the date.
+        Returns the day of the week for the date, where Monday is 0 and Sunday is 6.
         """
-        return self.date().weekday()
+        # Serial number 0 (1899-12-30) is a Saturday
+        return (self.serial_number + 5) % 7
 
-    def easter_monday(self) -> datetime.date:
+    def easter_monday(self) -> int:
         """
-        Calculates eastern monday for the year of the date.
+        Returns the day of the year of Easter Monday for the year of the date.
         """
-        em_date = easter.easter(self.date().year) + datetime.timedelta(days=1)
-        em_day_of_year = em_date.timetuple().tm_yday
-        return em_day_of_year
+        return _EASTER_MONDAY[self.year() - 1900]
 
     def day_of_year(self) -> int:
-        return self.month_offset + self.day_of_month()
+        return self.serial_number - _YEAR_OFFSET[self.year() - 1900]
 
     def month(self) -> int:
-        # Is this class needed?
-        d = self.day_of_year()
-        m = int(self.day_of_month() / 30) + 1
-
-        while d <= self._month_offset(m, self.leap):
-            m -= 1
-        while d > self._month_offset(m + 1, self.leap):
-            m += 1
-        return m
+        y = self.year()
+        return _month_from_day_of_year(
+            self.serial_number - _YEAR_OFFSET[y - 1900], _YEAR_IS_LEAP[y - 1900]
+        )
 
     def year(self) -> int:
-        y = int(self.serial_number / 365) + 1900
-        if self.serial_number <= self._year_offset(y):
+        y = min(self.serial_number // 365 + 1900, _MAX_YEAR)
+        if self.serial_number <= _YEAR_OFFSET[y - 1900]:
             y -= 1
         return y
 
-    def _month_length(self, month: int, leap: bool) -> int:
-        month_length = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-        month_length_leap = [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+    def _year_month_day(self) -> tuple:
+        y = self.year()
+        leap = _YEAR_IS_LEAP[y - 1900]
+        d = self.serial_number - _YEAR_OFFSET[y - 1900]
+        m = _month_from_day_of_year(d, leap)
+        return y, m, d - _month_offset(m, leap)
 
-        return month_length_leap[month - 1] if leap else month_length[month - 1]
+    def _month_length(self, month: int, leap: bool) -> int:
+        return _month_length(month, leap)
 
     def _month_offset(self, month: int, leap: bool) -> int:
-        month_offset = [
-            0,
-            31,
-            59,
-            90,
-            120,
-            151,  # Jan - Jun
-            181,
-            212,
-            243,
-            273,
-            304,
-            334,  # Jun - Dec
-            365,  # used in dayOfMonth to bracket day
-        ]
-        month_offset_leap = [
-            0,
-            31,
-            60,
-            91,
-            121,
-            152,  # Jan - Jun
-            182,
-            213,
-            244,
-            274,
-            305,
-            335,  # Jun - Dec
-            366,  # used in dayOfMonth to bracket day
-        ]
-        return month_offset_leap[month - 1] if leap else month_offset[month - 1]
+        return _month_offset(month, leap)
 
     def _year_offset(self, year: int) -> int:
-        year_offset = [
-            # 1900-1909
-            0,
-            366,
-            731,
-            1096,
-            1461,
-            1827,
-            2192,
-            2557,
-            2922,
-            3288,
-            # 1910-1919
-            3653,
-            4018,
-            4383,
-            4749,
-            5114,
-            5479,
-            5844,
-            6210,
-            6575,
-            6940,
-            # 1920-1929
-            7305,
-            7671,
-            8036,
-            8401,
-            8766,
-            9132,
-            9497,
-            9862,
-            10227,
-            10593,
-            # 1930-1939
-            10958,
-            11323,
-            11688,
-            12054,
-            12419,
-            12784,
-            13149,
-            13515,
-            13880,
-            14245,
-            # 1940-1949
-            14610,
-            14976,
-            15341,
-            15706,
-            16071,
-            16437,
-            16802,
-            17167,
-            17532,
-            17898,
-            # 1950-1959
-            18263,
-            18628,
-            18993,
-            19359,
-            19724,
-            20089,
-            20454,
-            20820,
-            21185,
-            21550,
-            # 1960-1969
-            21915,
-            22281,
-            22646,
-            23011,
-            23376,
-            23742,
-            24107,
-            24472,
-            24837,
-            25203,
-            # 1970-1979
-            25568,
-            25933,
-            26298,
-            26664,
-            27029,
-            27394,
-            27759,
-            28125,
-            28490,
-            28855,
-            # 1980-1989
-            29220,
-            29586,
-            29951,
-            30316,
-            30681,
-            31047,
-            31412,
-            31777,
-            32142,
-            32508,
-            # 1990-1999
-            32873,
-            33238,
-            33603,
-            33969,
-            34334,
-            34699,
-            35064,
-            35430,
-            35795,
-            36160,
-            # 2000-2009
-            36525,
-            36891,
-            37256,
-            37621,
-            37986,
-            38352,
-            38717,
-            39082,
-            39447,
-            39813,
-            # 2010-2019
-            40178,
-            40543,
-            40908,
-            41274,
-            41639,
-            42004,
-            42369,
-            42735,
-            43100,
-            43465,
-            # 2020-2029
-            43830,
-            44196,
-            44561,
-            44926,
-            45291,
-            45657,
-            46022,
-            46387,
-            46752,
-            47118,
-            # 2030-2039
-            47483,
-            47848,
-            48213,
-            48579,
-            48944,
-            49309,
-            49674,
-            50040,
-            50405,
-            50770,
-            # 2040-2049
-            51135,
-            51501,
-            51866,
-            52231,
-            52596,
-            52962,
-            53327,
-            53692,
-            54057,
-            54423,
-            # 2050-2059
-            54788,
-            55153,
-            55518,
-            55884,
-            56249,
-            56614,
-            56979,
-            57345,
-            57710,
-            58075,
-            # 2060-2069
-            58440,
-            58806,
-            59171,
-            59536,
-            59901,
-            60267,
-            60632,
-            60997,
-            61362,
-            61728,
-            # 2070-2079
-            62093,
-            62458,
-            62823,
-            63189,
-            63554,
-            63919,
-            64284,
-            64650,
-            65015,
-            65380,
-            # 2080-2089
-            65745,
-            66111,
-            66476,
-            66841,
-            67206,
-            67572,
-            67937,
-            68302,
-            68667,
-            69033,
-            # 2090-2099
-            69398,
-            69763,
-            70128,
-            70494,
-            70859,
-            71224,
-            71589,
-            71955,
-            72320,
-            72685,
-            # 2100-2109
-            73050,
-            73415,
-            73780,
-            74145,
-            74510,
-            74876,
-            75241,
-            75606,
-            75971,
-            76337,
-            # 2110-2119
-            76702,
-            77067,
-            77432,
-            77798,
-            78163,
-            78528,
-            78893,
-            79259,
-            79624,
-            79989,
-            # 2120-2129
-            80354,
-            80720,
-            81085,
-            81450,
-            81815,
-            82181,
-            82546,
-            82911,
-            83276,
-            83642,
-            # 2130-2139
-            84007,
-            84372,
-            84737,
-            85103,
-            85468,
-            85833,
-            86198,
-            86564,
-            86929,
-            87294,
-            # 2140-2149
-            87659,
-            88025,
-            88390,
-            88755,
-            89120,
-            89486,
-            89851,
-            90216,
-            90581,
-            90947,
-            # 2150-2159
-            91312,
-            91677,
-            92042,
-            92408,
-            92773,
-            93138,
-            93503,
-            93869,
-            94234,
-            94599,
-            # 2160-2169
-            94964,
-            95330,
-            95695,
-            96060,
-            96425,
-            96791,
-            97156,
-            97521,
-            97886,
-            98252,
-            # 2170-2179
-            98617,
-            98982,
-            99347,
-            99713,
-            100078,
-            100443,
-            100808,
-            101174,
-            101539,
-            101904,
-            # 2180-2189
-            102269,
-            102635,
-            103000,
-            103365,
-            103730,
-            104096,
-            104461,
-            104826,
-            105191,
-            105557,
-            # 2190-2199
-            105922,
-            106287,
-            106652,
-            107018,
-            107383,
-            107748,
-            108113,
-            108479,
-            108844,
-            109209,
-            # 2200
-            109574,
-        ]
-        return year_offset[year - 1900]
+        return _YEAR_OFFSET[year - 1900]
 
     def _is_leap(self, year: int) -> bool:
-        year_is_leap = [
-            # 1900 is leap in agreement with Excel's bug
-            # 1900 is out of valid date range anyway
-            # 1900-1909
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            # 1910-1919
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            # 1920-1929
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            # 1930-1939
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            # 1940-1949
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            # 1950-1959
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            # 1960-1969
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            # 1970-1979
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            # 1980-1989
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            # 1990-1999
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            # 2000-2009
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            # 2010-2019
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            # 2020-2029
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            # 2030-2039
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            # 2040-2049
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            # 2050-2059
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            # 2060-2069
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            # 2070-2079
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            # 2080-2089
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            # 2090-2099
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            # 2100-2109
-            False,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            # 2110-2119
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            # 2120-2129
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            # 2130-2139
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            # 2140-2149
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            # 2150-2159
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            # 2160-2169
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            # 2170-2179
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            # 2180-2189
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            # 2190-2199
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            True,
-            False,
-            False,
-            False,
-            # 2200
-            False,
-        ]
-        return year_is_leap[year - 1900]
+        return _YEAR_IS_LEAP[year - 1900]
+
+
+_from_serial = Date.from_serial
+
+
+def _month_length(month: int, leap: bool) -> int:
+    return _MONTH_LENGTH_LEAP[month - 1] if leap else _MONTH_LENGTH[month - 1]
+
+
+def _month_offset(month: int, leap: bool) -> int:
+    return _MONTH_OFFSET_LEAP[month - 1] if leap else _MONTH_OFFSET[month - 1]
+
+
+def _month_from_day_of_year(day_of_year: int, leap: bool) -> int:
+    """
+    Returns the month containing the given day of the year.
+    """
+    offsets = _MONTH_OFFSET_LEAP if leap else _MONTH_OFFSET
+    m = day_of_year // 30 + 1
+    while day_of_year <= offsets[m - 1]:
+        m -= 1
+    while day_of_year > offsets[m]:
+        m += 1
+    return m
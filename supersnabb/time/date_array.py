@@ -0,0 +1,281 @@
+from __future__ import annotations
+import numpy as np
+import pandas as pd
+from supersnabb.time.date import (
+    Date,
+    Tenor,
+    _MIN_YEAR,
+    _MAX_YEAR,
+    _EASTER_MONDAY,
+    _MONTH_OFFSET,
+    _MONTH_OFFSET_LEAP,
+    _YEAR_IS_LEAP,
+    _YEAR_OFFSET,
+)
+from typing import Iterable, Union
+
+_YEAR_OFFSET_ARRAY = np.array(_YEAR_OFFSET, dtype=np.int32)
+_YEAR_IS_LEAP_ARRAY = np.array(_YEAR_IS_LEAP, dtype=np.int32)
+_EASTER_MONDAY_ARRAY = np.array(_EASTER_MONDAY, dtype=np.int32)
+# Indexed by [leap, month - 1], the last column brackets the end of the year
+_MONTH_OFFSET_ARRAY = np.array([_MONTH_OFFSET, _MONTH_OFFSET_LEAP], dtype=np.int32)
+# Indexed by [leap, day of year], the month of each day of the year
+_MONTH_OF_DAY_ARRAY = (
+    np.arange(367)[None, :, None] > _MONTH_OFFSET_ARRAY[:, None, :12]
+).sum(axis=-1, dtype=np.int32)
+
+# Serial number of 1970-01-01, the epoch of numpy.datetime64
+_DATETIME64_EPOCH = 25569
+
+
+class DateArray:
+    """
+    Represents an array of dates stored as serial numbers in a contiguous int32 NumPy buffer.
+
+    Elementwise arithmetic, comparisons and the field accessors of Date are evaluated as vector operations
+    over the whole array. Indexing with an integer returns a Date, while slices and masks return a new DateArray.
+
+    Parameters
+    ----------
+    dates : Iterable[Date] or numpy.ndarray
+        The dates of the array, either as Date objects or as serial numbers.
+    """
+
+    __slots__ = ("_serials",)
+    __hash__ = None
+
+    def __init__(self, dates: Union[Iterable[Date], np.ndarray]):
+        if isinstance(dates, DateArray):
+            serials = dates._serials
+        elif isinstance(dates, np.ndarray):
+            if not np.issubdtype(dates.dtype, np.integer):
+                raise ValueError(
+                    f"serial numbers must be integers, received: {dates.dtype}"
+                )
+            serials = dates
+        else:
+            serials = [dt.serial_number for dt in dates]
+        self._serials = np.ascontiguousarray(serials, dtype=np.int32)
+
+    @classmethod
+    def from_serials(cls, serials: np.ndarray) -> DateArray:
+        """
+        Creates a date array from serial numbers, without copying if they already are a contiguous int32 array.
+        """
+        return cls(np.asarray(serials))
+
+    @classmethod
+    def from_datetime64(cls, values: np.ndarray) -> DateArray:
+        """
+        Creates a date array from a numpy.datetime64 array, any time of day is truncated.
+        """
+        days = np.asarray(values, dtype="datetime64[D]").view(np.int64)
+        return cls(days + _DATETIME64_EPOCH)
+
+    @classmethod
+    def from_pandas(cls, index: pd.DatetimeIndex) -> DateArray:
+        """
+        Creates a date array from a pandas DatetimeIndex.
+        """
+        return cls.from_datetime64(index.to_numpy(dtype="datetime64[D]"))
+
+    @property
+    def serial_number(self) -> np.ndarray:
+        """
+        Returns the serial numbers of the dates, allowing daycounters to consume a DateArray like a Date.
+        """
+        return self._serials
+
+    def to_datetime64(self) -> np.ndarray:
+        """
+        Returns the dates as a numpy.datetime64[D] array.
+        """
+        return (self._serials.astype(np.int64) - _DATETIME64_EPOCH).view(
+            "datetime64[D]"
+        )
+
+    def to_pandas(self) -> pd.DatetimeIndex:
+        """
+        Returns the dates as a pandas DatetimeIndex.
+        """
+        return pd.DatetimeIndex(self.to_datetime64())
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        if dtype is None:
+            return self._serials
+        return self._serials.astype(dtype)
+
+    def __len__(self) -> int:
+        return len(self._serials)
+
+    def __getitem__(self, key) -> Union[Date, DateArray]:
+        if isinstance(key, (int, np.integer)):
+            return Date.from_serial(int(self._serials[key]))
+        return DateArray(self._serials[key])
+
+    def __iter__(self):
+        from_serial = Date.from_serial
+        for serial_number in self._serials.tolist():
+            yield from_serial(serial_number)
+
+    def __repr__(self) -> str:
+        return f"DateArray({[dt.ISO() for dt in self]})"
+
+    def __add__(self, days: Union[int, np.ndarray, Tenor]) -> DateArray:
+        if isinstance(days, Tenor):
+            return DateArray(add_tenor(self._serials, days))
+        return DateArray(self._serials + np.asarray(days, dtype=np.int32))
+
+    def __radd__(self, days: Union[int, np.ndarray, Tenor]) -> DateArray:
+        return self.__add__(days)
+
+    def __sub__(self, days: Union[int, np.ndarray, Tenor]) -> DateArray:
+        if isinstance(days, Tenor):
+            return DateArray(add_tenor(self._serials, days, -1))
+        return DateArray(self._serials - np.asarray(days, dtype=np.int32))
+
+    def __rsub__(self, tenor: Tenor) -> DateArray:
+        # Mirrors Tenor - Date, which moves the date back by the tenor
+        if isinstance(tenor, Tenor):
+            return self.__sub__(tenor)
+        return NotImplemented
+
+    def __eq__(self, value: Union[Date, DateArray]) -> np.ndarray:
+        return self._serials == _serials_of(value)
+
+    def __ne__(self, value: Union[Date, DateArray]) -> np.ndarray:
+        return self._serials != _serials_of(value)
+
+    def __lt__(self, value: Union[Date, DateArray]) -> np.ndarray:
+        return self._serials < _serials_of(value)
+
+    def __le__(self, value: Union[Date, DateArray]) -> np.ndarray:
+        return self._serials <= _serials_of(value)
+
+    def __ge__(self, value: Union[Date, DateArray]) -> np.ndarray:
+        return self._serials >= _serials_of(value)
+
+    def __gt__(self, value: Union[Date, DateArray]) -> np.ndarray:
+        return self._serials > _serials_of(value)
+
+    def weekday(self) -> np.ndarray:
+        """
+        Returns the day of the week for each date, where Monday is 0 and Sunday is 6.
+        """
+        return (self._serials + 5) % 7
+
+    def is_week(self) -> np.ndarray:
+        """
+        Returns True for each date that is a weekend.
+        """
+        return self.weekday() > 4
+
+    def year(self) -> np.ndarray:
+        return _year(self._serials)
+
+    def month(self) -> np.ndarray:
+        return _year_month_day(self._serials)[1]
+
+    def day_of_month(self) -> np.ndarray:
+        return _year_month_day(self._serials)[2]
+
+    def day_of_year(self) -> np.ndarray:
+        return self._serials - _YEAR_OFFSET_ARRAY[_year(self._serials) - 1900]
+
+    def easter_monday(self) -> np.ndarray:
+        """
+        Returns the day of the year of Easter Monday for the year of each date.
+        """
+        return easter_monday(self.year())
+
+
+def easter_monday(years: np.ndarray) -> np.ndarray:
+    """
+    Returns the day of the year of Easter Monday for each of the given years between 1900 and 2200.
+    """
+    return _EASTER_MONDAY_ARRAY[np.asarray(years) - 1900]
+
+
+def add_tenor(
+    serials: np.ndarray, tenor: Tenor, multiples: Union[int, np.ndarray] = 1
+) -> np.ndarray:
+    """
+    Adds a tenor to each serial number, months and years are clamped to the end of the resulting month.
+
+    Parameters
+    ----------
+    serials : numpy.ndarray
+        The serial numbers of the dates.
+    tenor : Tenor
+        The tenor to add.
+    multiples : int or numpy.ndarray
+        The number of times to add the tenor, broadcast against the serial numbers, e.g. numpy.arange(n)
+        for the dates of a schedule.
+
+    Returns
+    -------
+    The serial numbers as an int32 array.
+    """
+    serials = np.asarray(serials, dtype=np.int32)
+    length = tenor.length * np.asarray(multiples)
+    match tenor.unit:
+        case "D":
+            shifted = serials + length
+        case "W":
+            shifted = serials + 7 * length
+        case "M":
+            shifted = _add_months(serials, length)
+        case "Y":
+            shifted = _add_months(serials, 12 * length)
+    return np.asarray(shifted, dtype=np.int32)
+
+
+def _serials_of(value: Union[Date, DateArray]) -> Union[int, np.ndarray]:
+    if isinstance(value, (Date, DateArray)):
+        return value.serial_number
+    raise TypeError(f"cannot compare DateArray with {type(value)}")
+
+
+def _year(serials: np.ndarray) -> np.ndarray:
+    """
+    Returns the year of each serial number, a year y contains the serials in (offset[y], offset[y + 1]].
+    """
+    return np.searchsorted(_YEAR_OFFSET_ARRAY, serials, side="left") + 1899
+
+
+def _year_month_day(serials: np.ndarray) -> tuple:
+    """
+    Returns the year, month and day of month of each serial number as three arrays.
+    """
+    y = _year(serials)
+    leap = _YEAR_IS_LEAP_ARRAY[y - 1900]
+    day_of_year = serials - _YEAR_OFFSET_ARRAY[y - 1900]
+    # Serial numbers outside of the supported range give meaningless dates rather than an error
+    m = _MONTH_OF_DAY_ARRAY[leap, np.clip(day_of_year, 0, 366)]
+    d = day_of_year - _MONTH_OFFSET_ARRAY[leap, m - 1]
+    return y, m, d
+
+
+def _serial_from_ymd(y: np.ndarray, m: np.ndarray, d: np.ndarray) -> np.ndarray:
+    """
+    Returns the serial numbers of the given years, months and days of month without validation.
+    """
+    y = np.asarray(y)
+    leap = _YEAR_IS_LEAP_ARRAY[y - 1900]
+    return (
+        d + _MONTH_OFFSET_ARRAY[leap, np.asarray(m) - 1] + _YEAR_OFFSET_ARRAY[y - 1900]
+    )
+
+
+def _add_months(serials: np.ndarray, months: Union[int, np.ndarray]) -> np.ndarray:
+    """
+    Adds a number of months to each serial number, clamping the day to the end of the resulting month.
+    """
+    y, m, d = _year_month_day(serials)
+    total = y * 12 + m - 1 + months
+    y, m = total // 12, total % 12 + 1
+    if np.any((y < _MIN_YEAR) | (y > _MAX_YEAR)):
+        raise ValueError("year must be between 1900 and 2200")
+    leap = _YEAR_IS_LEAP_ARRAY[y - 1900]
+    month_length = _MONTH_OFFSET_ARRAY[leap, m] - _MONTH_OFFSET_ARRAY[leap, m - 1]
+    return _serial_from_ymd(y, m, np.minimum(d, month_length))
@@ -7,7 +7,6 @@ class ACT365(Daycounter):
         super().__init__()
 
     def year_fraction(self, start_date: Date, end_date: Date) -> float:
-        print(f"{(end_date.serial_number - start_date.serial_number) = }")
         return (end_date.serial_number - start_date.serial_number) / 365
 
     def day_count(self, start_date: Date, end_date: Date) -> int:
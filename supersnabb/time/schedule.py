@@ -1,8 +1,13 @@
 from __future__ import annotations
-from supersnabb.time.date import Date, Tenor
-from supersnabb.time.calendar import Calendar
-from supersnabb.time.calendars.null_calendar import NullCalendar
-from typing import Union, Optional
+from supersnabb.time.date import Date, Tenor, _add_tenor
+from supersnabb.time.calendar import Calendar, table_generation
+from supersnabb.time.date_array import DateArray, add_tenor, _year_month_day
+from supersnabb.time.business_day_convention import BusinessDayConvention
+from functools import lru_cache
+from typing import Callable, Iterator, Optional, Sequence, Union
+import bisect
+import itertools
+import numpy as np
 
 
 class Schedule:
@@ -43,8 +48,15 @@ class Schedule:
 
     next_to_last : datetime.datetime
         The next to last date of the schedule. Impacts the regularity of the schedule, occurs when the schedule is customized.
+
+    lazy : bool
+        Whether to generate the dates only when they are first accessed. Dates can be iterated over and looked up
+        with next_date and previous_date without generating the whole schedule.
     """
 
+    # The cache of generated schedules, None unless enabled with enable_cache
+    _cache = None
+
     def __init__(
         self,
         effective_date: Date,
@@ -57,10 +69,11 @@ class Schedule:
         end_of_month: Optional[bool] = None,
         first_date: Optional[Date] = None,
         next_to_last: Optional[Date] = None,
+        lazy: bool = False,
     ):
         self.effective_date = effective_date
         self.termination_date = termination_date
-        if isinstance(type(tenor), type(Tenor)):
+        if isinstance(tenor, Tenor):
             self.tenor = tenor
         elif isinstance(tenor, str):
             self.tenor = Tenor(tenor)
@@ -80,22 +93,28 @@ class Schedule:
         self.end_of_month = end_of_month
         self.first_date = first_date
         self.next_to_last = next_to_last
-        self._dates = []
-        self._is_regular = []
-        self._schedule = self._create_schedule()
+        if lazy:
+            self._validate()
+            self._dates = None
+            self._is_regular = None
+            self._schedule = None
+        else:
+            self._dates = []
+            self._is_regular = []
+            self._schedule = self._create_schedule()
 
     def __repr__(self):
-        return self._schedule.__repr__()
+        return self.dates.__repr__()
 
     def __len__(self):
-        return len(self._dates)
+        return len(self.dates)
 
     @property
     def has_is_regular(self):
         """
         Returns a boolean indicating whether the schedule has is_regular or not.
         """
-        return len(self._is_regular) != 0
+        return len(self.is_regular) != 0
 
     @property
     def is_regular(self):
@@ -103,6 +122,8 @@ class Schedule:
         Returns a list of booleans indicating whether the schedule is regular or not. It is related
         to whether first_date or next_to_last is used.
         """
+        if self._is_regular is None:
+            self._schedule = self._create_schedule()
         return self._is_regular
 
     @property
@@ -110,9 +131,191 @@ class Schedule:
         """
         Returns the dates of the schedule.
         """
+        if self._dates is None:
+            self._schedule = self._create_schedule()
         return self._dates
 
-    def _create_schedule(self):
+    def iter_dates(self, reverse: bool = False) -> Iterator[Date]:
+        """
+        Yields the dates of the schedule one at a time, from the effective date or from the termination date if
+        reverse is True. Only the dates yielded so far are rolled and adjusted.
+        """
+        for serial_number, _ in self._iter_kept(reverse):
+            yield Date.from_serial(serial_number)
+
+    def iter_periods(self, reverse: bool = False) -> Iterator[tuple]:
+        """
+        Yields the periods of the schedule one at a time as tuples of start date, end date and whether the period
+        is regular, from the first period or from the last period if reverse is True.
+        """
+        previous = None
+        for current in self._iter_kept(reverse):
+            if previous is not None:
+                start, end = (current, previous) if reverse else (previous, current)
+                # The regularity of a period is held by the date furthest from the seed
+                regular = end[1] if self.rule == "forward" else start[1]
+                yield Date.from_serial(start[0]), Date.from_serial(end[0]), regular
+            previous = current
+
+    def next_date(self, after: Date) -> Optional[Date]:
+        """
+        Returns the first date of the schedule after the given date, or None if there is none. Unless the schedule
+        has been generated, only the roll dates around the given date are computed.
+        """
+        if self._dates is not None:
+            idx = bisect.bisect_right(self._dates, after)
+            return self._dates[idx] if idx < len(self._dates) else None
+        return self._find(after.serial_number + 1, 1)
+
+    def previous_date(self, before: Date) -> Optional[Date]:
+        """
+        Returns the last date of the schedule before the given date, or None if there is none. Unless the schedule
+        has been generated, only the roll dates around the given date are computed.
+        """
+        if self._dates is not None:
+            idx = bisect.bisect_left(self._dates, before)
+            return self._dates[idx - 1] if idx > 0 else None
+        return self._find(before.serial_number - 1, -1)
+
+    @classmethod
+    def enable_cache(cls, maxsize: int = 1024):
+        """
+        Caches the dates of generated schedules, keyed on all the parameters of the schedule. Schedules with the
+        same parameters share their dates and is_regular, which are returned as tuples when the cache is enabled.
+        Enabling an enabled cache resizes it, dropping the cached schedules.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of schedules in the cache, the least recently used schedule is dropped first.
+        """
+        cls._cache = lru_cache(maxsize=maxsize)(_generate_shared)
+
+    @classmethod
+    def disable_cache(cls):
+        """
+        Disables the cache of generated schedules and drops the cached schedules.
+        """
+        cls._cache = None
+
+    @classmethod
+    def cache_info(cls):
+        """
+        Returns the hits, misses, maximum size and current size of the cache, or None if it is disabled.
+        """
+        return None if cls._cache is None else cls._cache.cache_info()
+
+    @classmethod
+    def cache_clear(cls):
+        """
+        Drops the cached schedules and resets the hit and miss counters.
+        """
+        if cls._cache is not None:
+            cls._cache.cache_clear()
+
+    @classmethod
+    def generate_many(
+        cls,
+        effective_dates: Union[DateArray, np.ndarray, Sequence[Date]],
+        termination_dates: Union[DateArray, np.ndarray, Sequence[Date]],
+        tenors: Union[str, Tenor, Sequence[Union[str, Tenor]]],
+        calendars: Union[Calendar, Sequence[Calendar]],
+        conventions: Union[str, Sequence[str]],
+        rules: Union[str, Sequence[str]],
+    ) -> ScheduleBatch:
+        """
+        Generates the schedules of many trades at once, without creating a Schedule or a Date per trade.
+
+        Trades sharing tenor, calendar, convention and rule are generated together with vector operations, so the
+        cost is driven by the number of distinct combinations rather than the number of trades. The schedules are
+        the same as those of Schedule without first_date and next_to_last.
+
+        Parameters
+        ----------
+        effective_dates : DateArray, numpy.ndarray or sequence of Date
+            The effective date of each trade, as dates or serial numbers.
+        termination_dates : DateArray, numpy.ndarray or sequence of Date
+            The termination date of each trade, as dates or serial numbers.
+        tenors : str, Tenor or sequence
+            The tenor of each trade, or one tenor for all trades.
+        calendars : Calendar or sequence of Calendar
+            The calendar of each trade, or one calendar for all trades.
+        conventions : str or sequence of str
+            The business day convention of each trade, or one convention for all trades.
+        rules : str or sequence of str
+            The rule of each trade, backward or forward, or one rule for all trades.
+
+        Returns
+        -------
+        ScheduleBatch
+            The schedules of the trades in the order they were given.
+        """
+        effective = DateArray(effective_dates).serial_number
+        termination = DateArray(termination_dates).serial_number
+        n = len(effective)
+        if len(termination) != n:
+            raise ValueError(
+                "effective_dates and termination_dates must have the same length"
+            )
+        unique_tenors, tenor_codes = _factorize(
+            tenors, n, lambda tenor: tenor if isinstance(tenor, Tenor) else Tenor(tenor)
+        )
+        unique_calendars, calendar_codes = _factorize(
+            calendars,
+            n,
+            lambda calendar: calendar,
+            lambda calendar: calendar._table_key(),
+        )
+        unique_conventions, convention_codes = _factorize(
+            conventions, n, BusinessDayConvention
+        )
+        unique_rules, rule_codes = _factorize(rules, n, str.lower)
+        for rule in unique_rules:
+            if rule not in ["backward", "forward"]:
+                raise ValueError(
+                    "rule must be backward or forward received: {}".format(rule)
+                )
+
+        # Trades are grouped by their combination of tenor, calendar, convention and rule
+        codes = tenor_codes
+        for column_codes, column in [
+            (calendar_codes, unique_calendars),
+            (convention_codes, unique_conventions),
+            (rule_codes, unique_rules),
+        ]:
+            codes = codes * len(column) + column_codes
+        order = np.argsort(codes, kind="stable")
+        group_starts = np.flatnonzero(np.diff(codes[order], prepend=-1))
+        groups = np.split(order, group_starts[1:])
+
+        results = []
+        counts = np.zeros(n, dtype=np.int64)
+        for trades in groups:
+            trade = trades[0]
+            group_counts, serials, is_regular = _generate_many(
+                effective[trades],
+                termination[trades],
+                unique_tenors[tenor_codes[trade]],
+                unique_calendars[calendar_codes[trade]],
+                unique_conventions[convention_codes[trade]],
+                unique_rules[rule_codes[trade]],
+            )
+            counts[trades] = group_counts
+            results.append((trades, group_counts, serials, is_regular))
+
+        # Scatter the schedules of each group into the order of the trades
+        offsets = np.concatenate(([0], np.cumsum(counts)))
+        period_offsets = offsets - np.arange(n + 1)
+        all_serials = np.empty(offsets[-1], dtype=np.int32)
+        all_is_regular = np.empty(period_offsets[-1], dtype=bool)
+        for trades, group_counts, serials, is_regular in results:
+            all_serials[_segment_positions(offsets[trades], group_counts)] = serials
+            all_is_regular[
+                _segment_positions(period_offsets[trades], group_counts - 1)
+            ] = is_regular
+        return ScheduleBatch(offsets, all_serials, all_is_regular)
+
+    def _validate(self):
         # Checks for forward generation and IMM generation
         if self.first_date is not None:
             match self.rule:
@@ -128,128 +331,457 @@ class Schedule:
         if self.next_to_last is not None:
             match self.rule:
                 case "forward":
-                    if not (self.next_to_last >= self.effective_date is True) or (
-                        self.next_to_last < self.termination_date is True
+                    if not (
+                        self.effective_date <= self.next_to_last < self.termination_date
                     ):
                         raise ValueError(
                             f"next_to_last must be after effective_date: {self.effective_date} and before termination_date: {self.termination_date}, received: {self.next_to_last}."
                         )
-        periods = 1
-
-        match self.rule:
-            case "backward":
-                self._dates.append(self.termination_date)
-                seed = self.termination_date
-
-                # Checks if next_to_last is regular or not
-                if self.next_to_last is not None:
-                    self._dates.insert(0, self.next_to_last)
-                    temp = NullCalendar.advance(seed, self.tenor * -1, self.convention)
-                    if temp != self.next_to_last:
-                        self._is_regular.insert(0, False)
-                    else:
-                        self._is_regular.insert(0, True)
-                    seed = self.next_to_last
-
-                exit_date = self.effective_date
-                if self.first_date is not None:
-                    exit_date = self.first_date
-
-                while True:
-                    # temp moves back in time using -periods * tenor
-                    temp = NullCalendar.advance(
-                        seed, self.tenor * -periods, self.convention
-                    )
-                    if temp < exit_date:
-                        # Checks if first_date is regular or not
-                        if self.first_date is not None:
-                            adjusted_front_date = self.calendar.adjust(
-                                self._dates[0], self.convention
-                            )
-                            adjusted_first_date = self.calendar.adjust(
-                                self.first_date, self.convention
-                            )
-                            if adjusted_front_date != adjusted_first_date:
-                                self._dates.insert(0, self.first_date)
-                                self._is_regular.insert(0, False)
-                        break
-                    else:
-                        # Appends all other dates not related to first_date or next_to_last
-                        adjusted_front_date = self.calendar.adjust(
-                            self._dates[0], self.convention
-                        )
-                        adjusted_temp = self.calendar.adjust(temp, self.convention)
-                        if adjusted_front_date != adjusted_temp:
-                            self._dates.insert(0, temp)
-                            self._is_regular.insert(0, True)
-                        periods += 1
-                # Checks if effective_date is regular or not
-                adjusted_front_date = self.calendar.adjust(
-                    self._dates[0], self.convention
-                )
-                adjusted_effective_date = self.calendar.adjust(
-                    self.effective_date, self.convention
-                )
-                if adjusted_front_date != adjusted_effective_date:
-                    self._dates.insert(0, self.effective_date)
-                    self._is_regular.insert(0, False)
-
-            case "forward":
-                self._dates.append(self.effective_date)
-                seed = self.effective_date
-                # Checks if first_date is regular or not
-                if self.first_date is not None:
-                    self._dates.append(self.first_date)
-                    temp = NullCalendar.advance(
-                        seed, self.tenor * periods, self.convention
-                    )
-                    if temp != self.first_date:
-                        self._is_regular.append(False)
-                    else:
-                        self._is_regular.append(True)
-                    seed = self.first_date
-                exit_date = self.termination_date
-                if self.next_to_last is not None:
-                    exit_date = self.next_to_last
-                while True:
-                    temp = NullCalendar().advance(
-                        seed, self.tenor * periods, self.convention
-                    )
-                    if temp > exit_date:
-                        # Checks if next_to_last is regular or not
-                        if self.next_to_last is not None:
-                            adjusted_back_date = self.calendar.adjust(
-                                self._dates[-1], self.convention
-                            )
-                            adjusted_next_to_last = self.calendar.adjust(
-                                self.next_to_last, self.convention
-                            )
-                            if adjusted_back_date != adjusted_next_to_last:
-                                self._dates.append(self.next_to_last)
-                                self._is_regular.append(False)
-                        break
-                    else:
-                        # Appends all other dates not related to first_date or next_to_last
-                        adjusted_back_date = self.calendar.adjust(
-                            self._dates[-1], self.convention
-                        )
-                        adjusted_temp = self.calendar.adjust(temp, self.convention)
-                        if adjusted_back_date != adjusted_temp:
-                            self._dates.append(temp)
-                            self._is_regular.append(True)
-                        periods += 1
-                    # Checks if termination_date is regular or not
-                adjusted_back_date = self.calendar.adjust(
-                    self._dates[-1], self.convention
-                )
-                adjusted_termination_date = self.calendar.adjust(
-                    self.termination_date, self.convention
-                )
-                if adjusted_back_date != adjusted_termination_date:
-                    self._dates.append(self.termination_date)
-                    self._is_regular.append(False)
-        # At last adjust the resulting dates
-        for idx, date in enumerate(self._dates):
-            self._dates[idx] = self.calendar.adjust(date, self.convention)
 
+    def _create_schedule(self):
+        self._validate()
+        if Schedule._cache is not None:
+            # Modified calendars change the key, leaving stale schedules to be dropped from the cache
+            self._dates, self._is_regular = Schedule._cache(
+                self.effective_date,
+                self.termination_date,
+                self.tenor,
+                self.calendar,
+                self.convention,
+                self.termination_date_convention,
+                self.rule,
+                self.end_of_month,
+                self.first_date,
+                self.next_to_last,
+                table_generation(),
+            )
+            return self._dates
+        serials, is_regular = _generate(
+            self.effective_date,
+            self.termination_date,
+            self.tenor,
+            self.calendar,
+            self.convention,
+            self.rule,
+            self.first_date,
+            self.next_to_last,
+        )
+        self._dates = [
+            Date.from_serial(serial_number) for serial_number in serials.tolist()
+        ]
+        self._is_regular = is_regular.tolist()
         return self._dates
+
+    def _adjust(self, serial_number: int) -> int:
+        return self.calendar.adjust(
+            Date.from_serial(serial_number), self.convention
+        ).serial_number
+
+    def _find(self, threshold: int, direction: int) -> Optional[Date]:
+        """
+        Returns the first date of the schedule on or after the threshold if direction is 1, or the last date on or
+        before it if direction is -1. The roll dates around the threshold are found from their unadjusted dates,
+        which adjust by at most a few days, and then stepped through.
+        """
+        head, tail, seed, exit_date, roll_direction = _layout(
+            self.effective_date,
+            self.termination_date,
+            self.tenor,
+            self.rule,
+            self.first_date,
+            self.next_to_last,
+        )
+        candidates = [
+            self._adjust(serial_number) for serial_number, _, _ in head + tail
+        ]
+
+        count = _roll_count(seed, exit_date, self.tenor, roll_direction)
+        if count > 0:
+            roll = self._roll(seed, count, roll_direction)
+            # The index of the first roll date adjusted on or after bound, in chronological order
+            bound = threshold if direction > 0 else threshold + 1
+            if roll_direction > 0:
+                idx = _roll_count(seed, bound - 1, self.tenor, 1)
+            else:
+                idx = count - _roll_count(seed, bound, self.tenor, -1)
+            idx = min(max(idx, 0), count)
+            while idx > 0 and self._adjust(roll(idx - 1)) >= bound:
+                idx -= 1
+            while idx < count and self._adjust(roll(idx)) < bound:
+                idx += 1
+            if direction < 0:
+                idx -= 1
+            if 0 <= idx < count:
+                candidates.append(self._adjust(roll(idx)))
+
+        if direction > 0:
+            found = [
+                serial_number
+                for serial_number in candidates
+                if serial_number >= threshold
+            ]
+            return Date.from_serial(min(found)) if found else None
+        found = [
+            serial_number for serial_number in candidates if serial_number <= threshold
+        ]
+        return Date.from_serial(max(found)) if found else None
+
+    def _roll(self, seed: int, count: int, direction: int) -> Callable[[int], int]:
+        """
+        Returns a function of the index of a roll date in chronological order returning its unadjusted serial number.
+        """
+        length, unit = self.tenor.length, self.tenor.unit
+        if direction > 0:
+            return lambda idx: _add_tenor(seed, (idx + 1) * length, unit)
+        return lambda idx: _add_tenor(seed, (idx - count) * length, unit)
+
+    def _iter_kept(self, reverse: bool) -> Iterator[tuple]:
+        """
+        Yields the adjusted serial number of each date of the schedule and whether the period it ends, or starts for
+        the backward rule, is regular, in chronological order or in reverse.
+        """
+        head, tail, seed, exit_date, direction = _layout(
+            self.effective_date,
+            self.termination_date,
+            self.tenor,
+            self.rule,
+            self.first_date,
+            self.next_to_last,
+        )
+        count = _roll_count(seed, exit_date, self.tenor, direction)
+        roll = self._roll(seed, count, direction)
+        if reverse:
+            candidates = itertools.chain(
+                reversed(tail),
+                ((roll(idx), False, True) for idx in reversed(range(count))),
+                reversed(head),
+            )
+        else:
+            candidates = itertools.chain(
+                head, ((roll(idx), False, True) for idx in range(count)), tail
+            )
+        candidates = (
+            (self._adjust(serial_number), forced, regular)
+            for serial_number, forced, regular in candidates
+        )
+
+        # A candidate is dropped when it adjusts onto its neighbour towards the seed, see _generate
+        if (direction > 0) != reverse:
+            previous = None
+            for serial_number, forced, regular in candidates:
+                if forced or serial_number != previous:
+                    yield serial_number, regular
+                previous = serial_number
+        else:
+            current = next(candidates)
+            for following in candidates:
+                if current[1] or current[0] != following[0]:
+                    yield current[0], current[2]
+                current = following
+            yield current[0], current[2]
+
+
+class ScheduleBatch:
+    """
+    The schedules of many trades stored as a ragged array, see Schedule.generate_many.
+
+    The dates of schedule i are serial_numbers[offsets[i] : offsets[i + 1]]. A schedule of k dates has k - 1
+    periods, and whether the periods of schedule i are regular is given by
+    is_regular[period_offsets[i] : period_offsets[i + 1]].
+
+    Parameters
+    ----------
+    offsets : numpy.ndarray
+        The offset of the first date of each schedule, followed by the total number of dates.
+    serial_numbers : numpy.ndarray
+        The adjusted dates of all schedules as serial numbers.
+    is_regular : numpy.ndarray
+        Whether each period of all schedules is regular.
+    """
+
+    def __init__(
+        self, offsets: np.ndarray, serial_numbers: np.ndarray, is_regular: np.ndarray
+    ):
+        self.offsets = offsets
+        self.serial_numbers = serial_numbers
+        self.is_regular = is_regular
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __repr__(self) -> str:
+        return f"ScheduleBatch({len(self)} schedules, {len(self.serial_numbers)} dates)"
+
+    @property
+    def period_offsets(self) -> np.ndarray:
+        """
+        Returns the offset of the first period of each schedule in is_regular, followed by the number of periods.
+        """
+        return self.offsets - np.arange(len(self.offsets))
+
+    def dates(self, index: int) -> DateArray:
+        """
+        Returns the dates of the schedule with the given index.
+        """
+        return DateArray(
+            self.serial_numbers[self.offsets[index] : self.offsets[index + 1]]
+        )
+
+    def regular(self, index: int) -> np.ndarray:
+        """
+        Returns whether each period of the schedule with the given index is regular.
+        """
+        period_offsets = self.period_offsets
+        return self.is_regular[period_offsets[index] : period_offsets[index + 1]]
+
+
+def _generate_shared(
+    effective_date: Date,
+    termination_date: Date,
+    tenor: Tenor,
+    calendar: Calendar,
+    convention: str,
+    termination_date_convention: str,
+    rule: str,
+    end_of_month: Optional[bool],
+    first_date: Optional[Date],
+    next_to_last: Optional[Date],
+    table_generation: int,
+) -> tuple:
+    """
+    Returns the dates and is_regular of a schedule as tuples that can be shared, the function cached by
+    Schedule.enable_cache.
+    """
+    serials, is_regular = _generate(
+        effective_date,
+        termination_date,
+        tenor,
+        calendar,
+        convention,
+        rule,
+        first_date,
+        next_to_last,
+    )
+    dates = tuple(Date.from_serial(serial_number) for serial_number in serials.tolist())
+    return dates, tuple(is_regular.tolist())
+
+
+def _roll_count(seed: int, exit_date: int, tenor: Tenor, direction: int) -> int:
+    """
+    Returns the number of roll dates from the seed before passing the exit date, see _roll_dates.
+    """
+    count = int(_roll_counts(np.array(seed), np.array(exit_date), tenor, direction))
+    # Only the last roll date of the bound can pass the exit date
+    if count > 0:
+        last = _add_tenor(seed, direction * count * tenor.length, tenor.unit)
+        if direction * (last - exit_date) > 0:
+            count -= 1
+    return count
+
+
+def _roll_dates(seed: int, exit_date: int, tenor: Tenor, direction: int) -> np.ndarray:
+    """
+    Returns the unadjusted serial numbers of seed plus k tenors for k = 1, 2, ..., moving forward if direction is 1
+    and backward if it is -1, for as long as the dates do not pass the exit date.
+    """
+    count = _roll_count(seed, exit_date, tenor, direction)
+    return add_tenor(seed, tenor, direction * np.arange(1, count + 1))
+
+
+def _layout(
+    effective_date: Date,
+    termination_date: Date,
+    tenor: Tenor,
+    rule: str,
+    first_date: Optional[Date],
+    next_to_last: Optional[Date],
+) -> tuple:
+    """
+    Returns the candidate dates before and after the roll dates of a schedule, the seed and exit date of the
+    roll dates and the direction they are rolled in.
+
+    The candidates are tuples of a serial number, whether it is always kept and whether the period it ends, or
+    starts for the backward rule, is regular. All other candidates are regular roll dates.
+    """
+    match rule:
+        case "backward":
+            seed = termination_date
+            head = [(effective_date.serial_number, False, False)]
+            tail = [(termination_date.serial_number, True, False)]
+            if next_to_last is not None:
+                regular = termination_date - tenor == next_to_last
+                tail.insert(0, (next_to_last.serial_number, True, regular))
+                seed = next_to_last
+            if first_date is not None:
+                head.append((first_date.serial_number, False, False))
+            exit_date = effective_date if first_date is None else first_date
+            return head, tail, seed.serial_number, exit_date.serial_number, -1
+        case "forward":
+            seed = effective_date
+            head = [(effective_date.serial_number, True, False)]
+            tail = [(termination_date.serial_number, False, False)]
+            if first_date is not None:
+                regular = effective_date + tenor == first_date
+                head.append((first_date.serial_number, True, regular))
+                seed = first_date
+            if next_to_last is not None:
+                tail.insert(0, (next_to_last.serial_number, False, False))
+            exit_date = termination_date if next_to_last is None else next_to_last
+            return head, tail, seed.serial_number, exit_date.serial_number, 1
+
+
+def _generate(
+    effective_date: Date,
+    termination_date: Date,
+    tenor: Tenor,
+    calendar: Calendar,
+    convention: str,
+    rule: str,
+    first_date: Optional[Date],
+    next_to_last: Optional[Date],
+) -> tuple:
+    """
+    Returns the adjusted serial numbers of a schedule and whether each of its periods is regular.
+
+    All candidate dates are laid out in chronological order and adjusted in one call. A candidate is dropped when
+    it adjusts to the same date as its neighbour towards the seed, unless it is the seed or a stub date that is
+    always kept.
+    """
+    head, tail, seed, exit_date, direction = _layout(
+        effective_date, termination_date, tenor, rule, first_date, next_to_last
+    )
+    rolls = _roll_dates(seed, exit_date, tenor, direction)[::direction]
+    serials, forced, is_regular = (
+        np.array(column, dtype=dtype)
+        for column, dtype in zip(zip(*(head + tail)), (np.int32, bool, bool))
+    )
+    serials = np.concatenate((serials[: len(head)], rolls, serials[len(head) :]))
+    forced = np.concatenate(
+        (forced[: len(head)], np.zeros(len(rolls), dtype=bool), forced[len(head) :])
+    )
+    is_regular = np.concatenate(
+        (
+            is_regular[: len(head)],
+            np.ones(len(rolls), dtype=bool),
+            is_regular[len(head) :],
+        )
+    )
+    adjusted = calendar.adjust_many(serials, convention)
+    keep = forced.copy()
+    if direction > 0:
+        keep[1:] |= adjusted[1:] != adjusted[:-1]
+        return adjusted[keep], is_regular[1:][keep[1:]]
+    keep[:-1] |= adjusted[:-1] != adjusted[1:]
+    return adjusted[keep], is_regular[:-1][keep[:-1]]
+
+
+def _roll_counts(
+    seeds: np.ndarray, exit_dates: np.ndarray, tenor: Tenor, direction: int
+) -> np.ndarray:
+    """
+    Returns an upper bound of the number of roll dates from each seed before passing its exit date, see _roll_dates.
+    """
+    if tenor.length <= 0:
+        raise ValueError(f"tenor must be positive, received: {tenor}")
+    match tenor.unit:
+        case "D" | "W":
+            step = tenor.length * (7 if tenor.unit == "W" else 1)
+            count = direction * (exit_dates - seeds) // step
+        case "M" | "Y":
+            step = tenor.length * (12 if tenor.unit == "Y" else 1)
+            seed_year, seed_month, _ = _year_month_day(seeds)
+            exit_year, exit_month, _ = _year_month_day(exit_dates)
+            months = (exit_year - seed_year) * 12 + exit_month - seed_month
+            count = direction * months // step
+    return np.maximum(count, 0)
+
+
+def _generate_many(
+    effective: np.ndarray,
+    termination: np.ndarray,
+    tenor: Tenor,
+    calendar: Calendar,
+    convention: str,
+    rule: str,
+) -> tuple:
+    """
+    Returns the number of dates of each schedule, the adjusted dates of all schedules and whether each of their
+    periods is regular, for trades sharing tenor, calendar, convention and rule. See _generate.
+    """
+    forward = rule == "forward"
+    direction = 1 if forward else -1
+    seeds = effective if forward else termination
+    exit_dates = termination if forward else effective
+
+    # The roll dates of all trades, in chronological order within each trade
+    roll_counts = _roll_counts(seeds, exit_dates, tenor, direction)
+    trade = np.repeat(np.arange(len(seeds)), roll_counts)
+    k = np.arange(len(trade)) - np.repeat(
+        np.cumsum(roll_counts) - roll_counts, roll_counts
+    )
+    multiples = k + 1 if forward else k - roll_counts[trade]
+    rolls = add_tenor(seeds[trade], tenor, multiples)
+    valid = rolls <= exit_dates[trade] if forward else rolls >= exit_dates[trade]
+    rolls, trade = rolls[valid], trade[valid]
+    roll_counts = np.bincount(trade, minlength=len(seeds))
+
+    # Every trade is laid out as effective date, roll dates and termination date
+    counts = roll_counts + 2
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+    first, last = offsets[:-1], offsets[1:] - 1
+    serials = np.empty(offsets[-1], dtype=np.int32)
+    serials[first] = effective
+    serials[last] = termination
+    serials[_segment_positions(first + 1, roll_counts)] = rolls
+    is_regular = np.ones(len(serials), dtype=bool)
+    is_regular[first] = False
+    is_regular[last] = False
+
+    # Dates adjusting onto their neighbour towards the seed are dropped, the seed is always kept
+    adjusted = calendar.adjust_many(serials, convention)
+    keep = np.zeros(len(serials), dtype=bool)
+    if forward:
+        keep[1:] = adjusted[1:] != adjusted[:-1]
+        keep[first] = True
+        periods = keep.copy()
+        periods[first] = False
+    else:
+        keep[:-1] = adjusted[:-1] != adjusted[1:]
+        keep[last] = True
+        periods = keep.copy()
+        periods[last] = False
+    counts = np.add.reduceat(keep.astype(np.int64), first)
+    return counts, adjusted[keep], is_regular[periods]
+
+
+def _segment_positions(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    Returns the positions starts[i], starts[i] + 1, ..., starts[i] + lengths[i] - 1 of all segments i.
+    """
+    segment_starts = np.cumsum(lengths) - lengths
+    return np.repeat(starts - segment_starts, lengths) + np.arange(np.sum(lengths))
+
+
+def _factorize(
+    values, n: int, parse: Callable, key: Optional[Callable] = None
+) -> tuple:
+    """
+    Returns the distinct parsed values of a column and the index of the value of each row, a single value is
+    shared by all n rows.
+    """
+    if not isinstance(values, (list, tuple, np.ndarray)):
+        return [parse(values)], np.zeros(n, dtype=np.int64)
+    if len(values) != n:
+        raise ValueError(f"expected {n} values, received: {len(values)}")
+    key = parse if key is None else key
+    codes = {}
+    uniques = []
+    indices = np.empty(n, dtype=np.int64)
+    for idx, value in enumerate(values):
+        value_key = key(value)
+        code = codes.get(value_key)
+        if code is None:
+            code = codes[value_key] = len(uniques)
+            uniques.append(parse(value))
+        indices[idx] = code
+    return uniques, indices
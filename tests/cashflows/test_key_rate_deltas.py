@@ -0,0 +1,38 @@
+import supersnabb as ss
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize(
+    "interpolation", [ss.InterpolationType.LINEAR, ss.InterpolationType.LOGLINEAR]
+)
+def test_key_rate_deltas_with_bumped_curves(
+    interpolation, pillar_dates, discount_factors, make_legs
+):
+    curve = ss.DiscountCurve(
+        pillar_dates, discount_factors, ss.ACT365, ss.Sweden, interpolation
+    )
+    size = 1e-6
+    # Each key rate scenario bumps one pillar, the NPV differences are the bucketed deltas
+    bumped = make_legs(ss.key_rate_shifts(curve, size))
+    parallel = make_legs(ss.parallel_shift(curve, [size]))
+    for leg, bumped_leg, parallel_leg in zip(make_legs(curve), bumped, parallel):
+        deltas = leg.key_rate_deltas(size)
+        assert deltas.shape == (len(pillar_dates),)
+        assert deltas[0] == 0
+        assert np.allclose(deltas[1:], bumped_leg.npv - leg.npv, rtol=1e-4, atol=1e-6)
+        assert leg.dv01(size) == pytest.approx(parallel_leg.npv[0] - leg.npv, rel=1e-4)
+    fixed_leg, _ = make_legs(curve)
+    # Receiving fixed loses value when rates rise
+    assert fixed_leg.dv01() < 0
+
+
+def test_key_rate_deltas_need_a_single_curve(pillar_dates, discount_factors, make_legs):
+    curve = ss.DiscountCurve(pillar_dates, discount_factors, ss.ACT365, ss.Sweden)
+    other = ss.DiscountCurve(pillar_dates, discount_factors, ss.ACT365, ss.Sweden)
+    handle = ss.RelinkableHandle(curve)
+    _, float_leg = make_legs(handle, curve)
+    assert float_leg.dv01() == pytest.approx(make_legs(curve)[1].dv01())
+    _, float_leg = make_legs(curve, other)
+    with pytest.raises(ValueError, match="forecast on the discount curve"):
+        float_leg.key_rate_deltas()
@@ -0,0 +1,70 @@
+import supersnabb as ss
+from supersnabb.cashflows.fixed_rate_coupon import FixedRateLeg
+from supersnabb.cashflows.float_rate_coupon import FloatRateLeg
+from supersnabb.indices.ibor_index import IborIndex
+import pytest
+
+
+@pytest.fixture
+def pillar_dates():
+    return [
+        ss.Date(2018, 1, 1),
+        ss.Date(2019, 1, 1),
+        ss.Date(2020, 1, 1),
+        ss.Date(2021, 1, 1),
+        ss.Date(2022, 1, 1),
+        ss.Date(2024, 1, 1),
+    ]
+
+
+@pytest.fixture
+def discount_factors():
+    return [1, 0.99, 0.98, 0.97, 0.96, 0.95]
+
+
+@pytest.fixture
+def make_legs():
+    """
+    Returns a function building a 5Y fixed leg and a float leg on a 3M SEK index, discounted on the given
+    curve and forecast on it unless another forecast curve is given.
+    """
+
+    def legs(discount_curve, forecast_curve=None, tenor="3M", daycount=ss.ACT365):
+        schedule = ss.Schedule(
+            ss.Date(2018, 1, 1),
+            ss.Date(2023, 1, 2),
+            ss.Tenor(tenor),
+            ss.Sweden(),
+            ss.BusinessDayConvention.MODIFIEDFOLLOWING,
+            ss.BusinessDayConvention.MODIFIEDFOLLOWING,
+            "forward",
+        )
+        ibor_index = IborIndex(
+            ss.Tenor("3M"),
+            ss.Tenor("2D"),
+            "SEK",
+            ss.Sweden,
+            ss.BusinessDayConvention.MODIFIEDFOLLOWING,
+            ss.ACT360(),
+            discount_curve if forecast_curve is None else forecast_curve,
+        )
+        fixed_leg = FixedRateLeg(
+            schedule,
+            10e6,
+            0.032,
+            daycount,
+            ss.BusinessDayConvention.FOLLOWING,
+            ss.Sweden,
+            discount_curve,
+        )
+        float_leg = FloatRateLeg(
+            schedule,
+            10e6,
+            ibor_index,
+            daycount,
+            ss.BusinessDayConvention.FOLLOWING,
+            discount_curve,
+        )
+        return fixed_leg, float_leg
+
+    return legs
@@ -0,0 +1,101 @@
+import supersnabb as ss
+import numpy as np
+import pytest
+
+
+def test_dual_arithmetic():
+    x = ss.Dual.variables([0.5, 2.0])
+    a, b = x[0], x[1]
+    f = np.exp(a * b) / (1 + a) - np.log(b) ** 2 + np.sqrt(b) * 3 - a**b
+    value, gradient = f.value, f.gradient
+
+    def g(a, b):
+        return np.exp(a * b) / (1 + a) - np.log(b) ** 2 + np.sqrt(b) * 3 - a**b
+
+    h = 1e-6
+    assert value == pytest.approx(g(0.5, 2.0))
+    assert gradient[0] == pytest.approx((g(0.5 + h, 2.0) - g(0.5 - h, 2.0)) / (2 * h))
+    assert gradient[1] == pytest.approx((g(0.5, 2.0 + h) - g(0.5, 2.0 - h)) / (2 * h))
+    # Arrays on either side of a dual keep the gradient
+    y = np.array([1.0, 2.0]) * x + x @ np.array([3.0, 4.0])
+    assert np.allclose(y.value, [10.0, 13.5])
+    assert np.allclose(y.gradient, [[4.0, 4.0], [3.0, 6.0]])
+    assert np.allclose(np.where(x > 1, x, 0.0).gradient, [[0, 0], [0, 1]])
+
+
+@pytest.mark.parametrize(
+    "interpolation",
+    [
+        ss.InterpolationType.LINEAR,
+        ss.InterpolationType.LOGLINEAR,
+        ss.InterpolationType.FLATFORWARD,
+    ],
+)
+def test_leg_npv_gradient(interpolation, pillar_dates, discount_factors, make_legs):
+    curve = ss.DiscountCurve(
+        pillar_dates,
+        ss.Dual.variables(discount_factors),
+        ss.ACT365,
+        ss.Sweden,
+        interpolation,
+    )
+    h = 1e-6
+    for k, leg in enumerate(make_legs(curve)):
+        npv = leg.npv
+        base = make_legs(
+            ss.DiscountCurve(
+                pillar_dates, discount_factors, ss.ACT365, ss.Sweden, interpolation
+            )
+        )[k].npv
+        assert npv.value == pytest.approx(base, rel=1e-12)
+        for j in range(len(pillar_dates)):
+            up, down = list(discount_factors), list(discount_factors)
+            up[j] += h
+            down[j] -= h
+            bumped = [
+                make_legs(
+                    ss.DiscountCurve(
+                        pillar_dates, dfs, ss.ACT365, ss.Sweden, interpolation
+                    )
+                )[k].npv
+                for dfs in (up, down)
+            ]
+            assert npv.gradient[j] == pytest.approx(
+                (bumped[0] - bumped[1]) / (2 * h), rel=1e-6, abs=1e-2
+            )
+
+
+def test_dual_gradient_matches_key_rate_deltas(
+    pillar_dates, discount_factors, make_legs
+):
+    curve = ss.DiscountCurve(pillar_dates, discount_factors, ss.ACT365, ss.Sweden)
+    dual_curve = ss.DiscountCurve(
+        pillar_dates, ss.Dual.variables(discount_factors), ss.ACT365, ss.Sweden
+    )
+    # Chain rule from discount factors to zero rates, dP/dr = -t P
+    to_zero_rates = -curve.pillar_times() * np.asarray(discount_factors) * 0.0001
+    for leg, dual_leg in zip(make_legs(curve), make_legs(dual_curve)):
+        assert np.allclose(
+            dual_leg.npv.gradient * to_zero_rates, leg.key_rate_deltas(), atol=1e-8
+        )
+    coupon = make_legs(dual_curve)[1].coupons[4]
+    assert isinstance(coupon.amount, ss.Dual)
+
+
+def test_dual_rates_need_a_local_interpolation(pillar_dates, discount_factors):
+    with pytest.raises(ValueError, match="not supported for dual rates"):
+        ss.DiscountCurve(
+            pillar_dates,
+            ss.Dual.variables(discount_factors),
+            ss.ACT365,
+            ss.Sweden,
+            ss.InterpolationType.NATURALCUBIC,
+        )
+    with pytest.raises(ValueError, match="not supported for dual rates"):
+        ss.DiscountCurve(
+            pillar_dates,
+            ss.Dual.variables(discount_factors),
+            ss.ACT365,
+            ss.Sweden,
+            dense=True,
+        )
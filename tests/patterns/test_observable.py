@@ -0,0 +1,70 @@
+import supersnabb as ss
+from supersnabb.patterns.handle import RelinkableHandle
+from supersnabb.patterns.observable import LazyObject, Observer
+from supersnabb.quotes.simple_quote import SimpleQuote
+import pytest
+
+
+class _Counter(Observer):
+    def __init__(self):
+        super().__init__()
+        self.updates = 0
+
+    def update(self):
+        self.updates += 1
+
+
+def _curve(dates, discount_factors):
+    return ss.DiscountCurve(
+        dates, discount_factors, ss.ACT360, ss.Sweden, ss.InterpolationType.LOGLINEAR
+    )
+
+
+def test_quote_and_handle_notifications(pillar_dates, discount_factors):
+    quote = SimpleQuote(0.03)
+    counter = _Counter()
+    counter.register_with(quote, 0.03, None)
+    quote.value = 0.03
+    assert counter.updates == 0
+    quote.set_value(0.031)
+    assert counter.updates == 1 and float(quote) == 0.031
+
+    curve = _curve(pillar_dates, discount_factors)
+    handle = RelinkableHandle()
+    assert handle.empty
+    with pytest.raises(ValueError, match="empty handle"):
+        handle(pillar_dates[1])
+    counter.register_with(handle)
+    handle.link_to(curve)
+    assert counter.updates == 2
+    assert handle(pillar_dates[1]) == curve(pillar_dates[1])
+    assert handle.reference_date == pillar_dates[0]
+    # The handle passes on the notifications of the linked object
+    curve.notify_observers()
+    assert counter.updates == 3
+    counter.unregister_with(handle)
+    handle.link_to(_curve(pillar_dates, [1, 0.98, 0.96, 0.94, 0.92, 0.9]))
+    assert counter.updates == 3
+
+
+def test_lazy_legs_are_invalidated_by_relinking(
+    pillar_dates, discount_factors, make_legs
+):
+    handle = RelinkableHandle(_curve(pillar_dates, discount_factors))
+    fixed_leg, float_leg = make_legs(handle, tenor="1Y", daycount=ss.ACT360)
+    coupon = float_leg.coupons[2]
+    legs = [fixed_leg, float_leg]
+    npvs = [leg.npv for leg in legs]
+    forward_rate = coupon.forward_rate
+    # Unchanged market, the cached results are returned
+    assert [leg.cashflows is leg.cashflows for leg in legs] == [True, True]
+    assert npvs == pytest.approx([leg.cashflows["Coupon"].sum() for leg in legs])
+    assert [leg.npv is npv for leg, npv in zip(legs, npvs)] == [True, True]
+    assert coupon.coupon == pytest.approx(float_leg.cashflows["Coupon"][2])
+
+    handle.link_to(_curve(pillar_dates, [1, 0.98, 0.96, 0.94, 0.92, 0.9]))
+    assert fixed_leg.npv < npvs[0]
+    assert float_leg.npv != npvs[1]
+    assert coupon.forward_rate > forward_rate
+    assert coupon.forward_rate == pytest.approx(float_leg.forward_rates[2])
+    assert isinstance(coupon, LazyObject)
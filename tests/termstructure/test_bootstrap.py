@@ -0,0 +1,159 @@
+import QuantLib as ql
+from supersnabb.time.date import Date, Tenor
+from supersnabb.time.daycounters.act360 import ACT360
+from supersnabb.time.daycounters.act365 import ACT365
+from supersnabb.time.calendars.sweden import Sweden
+from supersnabb.time.business_day_convention import BusinessDayConvention
+from supersnabb.termstructure.interpolation import InterpolationType
+from supersnabb.termstructure.rate_helpers import (
+    DepositRateHelper,
+    FraRateHelper,
+    SwapRateHelper,
+)
+from supersnabb.termstructure.bootstrap import Bootstrapper
+import numpy as np
+import pytest
+
+REFERENCE_DATE = Date(2023, 3, 15)
+DEPOSIT = ("3M", 0.031)
+FRAS = [(3, 0.033), (6, 0.034)]
+SWAPS = [(2, 0.035), (3, 0.034), (5, 0.033), (10, 0.032), (30, 0.03)]
+MF = BusinessDayConvention.MODIFIEDFOLLOWING
+
+
+def _helpers():
+    calendar = Sweden()
+    helpers = [
+        DepositRateHelper(DEPOSIT[1], Tenor(DEPOSIT[0]), 2, calendar, MF, ACT360())
+    ]
+    helpers += [
+        FraRateHelper(rate, Tenor(start, "M"), Tenor("3M"), 2, calendar, MF, ACT360())
+        for start, rate in FRAS
+    ]
+    helpers += [
+        SwapRateHelper(rate, Tenor(years, "Y"), 2, calendar, Tenor("1Y"), MF, ACT360())
+        for years, rate in SWAPS
+    ]
+    # The bootstrapper sorts the helpers by maturity
+    return helpers[::-1]
+
+
+def _ql_curve():
+    ql.Settings.instance().evaluationDate = ql.Date(15, 3, 2023)
+    calendar = ql.Sweden()
+    helpers = [
+        ql.DepositRateHelper(
+            DEPOSIT[1],
+            ql.Period(DEPOSIT[0]),
+            2,
+            calendar,
+            ql.ModifiedFollowing,
+            False,
+            ql.Actual360(),
+        )
+    ]
+    helpers += [
+        ql.FraRateHelper(
+            rate,
+            start,
+            start + 3,
+            2,
+            calendar,
+            ql.ModifiedFollowing,
+            False,
+            ql.Actual360(),
+        )
+        for start, rate in FRAS
+    ]
+    index = ql.IborIndex(
+        "STIBOR",
+        ql.Period("3M"),
+        2,
+        ql.SEKCurrency(),
+        calendar,
+        ql.ModifiedFollowing,
+        False,
+        ql.Actual360(),
+    )
+    helpers += [
+        ql.SwapRateHelper(
+            rate,
+            ql.Period(years, ql.Years),
+            calendar,
+            ql.Annual,
+            ql.ModifiedFollowing,
+            ql.Actual360(),
+            index,
+        )
+        for years, rate in SWAPS
+    ]
+    return ql.PiecewiseLogLinearDiscount(
+        ql.Date(15, 3, 2023), helpers, ql.Actual365Fixed()
+    )
+
+
+def test_bootstrap_with_ql():
+    bootstrapper = Bootstrapper(REFERENCE_DATE, _helpers(), ACT365(), Sweden())
+    curve = bootstrapper.bootstrap()
+    ql_curve = _ql_curve()
+
+    nodes = ql_curve.nodes()
+    assert [dt.ISO() for dt in curve.dates] == [dt.ISO() for dt, _ in nodes]
+    assert np.allclose(curve.rates, [value for _, value in nodes], atol=1e-10)
+    assert len(bootstrapper.iterations) == len(curve.dates) - 1
+    assert max(bootstrapper.iterations) <= 5
+    assert bootstrapper.elapsed > 0
+
+
+@pytest.mark.parametrize(
+    "interpolation", [InterpolationType.LINEAR, InterpolationType.LOGLINEAR]
+)
+def test_bootstrap_reprices_helpers(interpolation):
+    helpers = _helpers()
+    bootstrapper = Bootstrapper(
+        REFERENCE_DATE, helpers, ACT365(), Sweden(), interpolation
+    )
+    curve = bootstrapper.bootstrap()
+    for helper in helpers:
+        implied, _ = helper.implied_quote(curve.discount_factors(helper.serial_numbers))
+        assert implied == pytest.approx(helper.quote, abs=1e-12)
+
+    # Bootstrapping again after a quote changes moves the curve from that pillar on
+    helpers[0].quote += 0.001
+    moved = bootstrapper.bootstrap()
+    assert moved.rates[:-1] == pytest.approx(curve.rates[:-1], abs=1e-15)
+    assert moved.rates[-1] < curve.rates[-1]
+
+
+def test_bootstrap_validation():
+    with pytest.raises(ValueError, match="linear and log-linear"):
+        Bootstrapper(
+            REFERENCE_DATE,
+            _helpers(),
+            ACT365(),
+            Sweden(),
+            InterpolationType.NATURALCUBIC,
+        )
+    with pytest.raises(ValueError, match="distinct"):
+        Bootstrapper(REFERENCE_DATE, _helpers() * 2, ACT365(), Sweden())
+
+
+def test_incremental_bootstrap():
+    helpers = _helpers()[::-1]
+    bootstrapper = Bootstrapper(
+        REFERENCE_DATE, helpers, ACT365(), Sweden(), incremental=True
+    )
+    curve = bootstrapper.bootstrap()
+    assert bootstrapper.recomputed == len(helpers)
+    assert bootstrapper.bootstrap() is curve
+    assert bootstrapper.recomputed == 0
+
+    # Moving the 3Y swap re-solves it and the pillars after it
+    helpers[4].quote += 0.0005
+    moved = bootstrapper.bootstrap()
+    assert bootstrapper.recomputed == len(helpers) - 4
+    assert len(bootstrapper.iterations) == len(helpers)
+    assert moved.rates[:5] == curve.rates[:5]
+
+    full = Bootstrapper(REFERENCE_DATE, helpers, ACT365(), Sweden()).bootstrap()
+    assert np.allclose(moved.rates, full.rates, atol=1e-10)
@@ -0,0 +1,105 @@
+import QuantLib as ql
+from supersnabb.time.date import Date
+from supersnabb.time.date_array import DateArray
+from supersnabb.time.daycounters.act360 import ACT360
+from supersnabb.time.calendars.sweden import Sweden
+from supersnabb.termstructure.curve import DiscountCurve
+from supersnabb.termstructure.interpolation import InterpolationType
+from supersnabb.indices.ibor_index import IborIndex
+from supersnabb.time.date import Tenor
+import numpy as np
+import pytest
+
+DATES = [Date(2018, 1, 1), Date(2019, 1, 1), Date(2020, 1, 1), Date(2024, 1, 1)]
+DISCOUNT_FACTORS = [1, 0.99, 0.97, 0.9]
+
+
+def _ql_date(dt):
+    return ql.Date(dt.day_of_month(), dt.month(), dt.year())
+
+
+@pytest.fixture
+def curves():
+    ss_curve = DiscountCurve(
+        DATES, DISCOUNT_FACTORS, ACT360(), Sweden(), InterpolationType.LOGLINEAR
+    )
+    ql_curve = ql.DiscountCurve(
+        [_ql_date(dt) for dt in DATES], DISCOUNT_FACTORS, ql.Actual360()
+    )
+    ql_curve.enableExtrapolation()
+    return ss_curve, ql_curve
+
+
+def test_curve_batch_with_ql(curves):
+    ss_curve, ql_curve = curves
+    dates = DateArray.from_serials(
+        np.arange(DATES[0].serial_number, DATES[-1].serial_number + 30, 3)
+    )
+    ql_dates = [_ql_date(dt) for dt in dates]
+
+    discount_factors = ss_curve.discount_factors(dates)
+    assert np.allclose(discount_factors, [ql_curve.discount(dt) for dt in ql_dates])
+    assert discount_factors[10] == ss_curve(dates[10])
+    assert np.array_equal(
+        ss_curve.discount_factors(list(dates[:5])), discount_factors[:5]
+    )
+
+    zero_rates = ss_curve.zero_rates(dates)
+    ql_zero_rates = [
+        ql_curve.zeroRate(dt, ql.Actual360(), ql.Continuous).rate() for dt in ql_dates
+    ]
+    assert np.allclose(zero_rates, ql_zero_rates)
+
+    end_dates = dates + 91
+    forward_rates = ss_curve.forward_rates(dates, end_dates, ACT360())
+    ql_forward_rates = [
+        ql_curve.forwardRate(start, _ql_date(end), ql.Actual360(), ql.Simple).rate()
+        for start, end in zip(ql_dates, end_dates)
+    ]
+    assert np.allclose(forward_rates, ql_forward_rates)
+
+
+def test_ibor_index_fixings(curves):
+    ss_curve, _ = curves
+    index = IborIndex(
+        Tenor("3M"),
+        Tenor("2D"),
+        "SEK",
+        Sweden(),
+        "modifiedfollowing",
+        ACT360(),
+        ss_curve,
+    )
+    start_dates = DateArray([Date(2018, 3, 1), Date(2019, 6, 3), Date(2022, 12, 30)])
+    end_dates = start_dates + Tenor("3M")
+    fixings = index.forecast_fixings_with_dates(start_dates, end_dates)
+    for fixing, start, end in zip(fixings, start_dates, end_dates):
+        assert fixing == pytest.approx(index.forecast_fixing_with_dates(start, end))
+
+
+@pytest.mark.parametrize(
+    "interpolation", [InterpolationType.LOGLINEAR, InterpolationType.MONOTONECONVEX]
+)
+def test_dense_curve(interpolation):
+    curve = DiscountCurve(DATES, DISCOUNT_FACTORS, ACT360(), Sweden(), interpolation)
+    dense_curve = DiscountCurve(
+        DATES, DISCOUNT_FACTORS, ACT360(), Sweden(), interpolation, dense=True
+    )
+    assert dense_curve.dense and not curve.dense
+
+    # Dates before and after the grid fall back to the interpolation
+    serials = np.arange(DATES[0].serial_number - 10, DATES[-1].serial_number + 10)
+    expected = curve.discount_factors(serials)
+    assert np.allclose(dense_curve.discount_factors(serials), expected)
+    assert np.allclose(
+        dense_curve.discount_factors(DateArray.from_serials(serials[10:-10])),
+        expected[10:-10],
+    )
+    assert np.allclose(
+        dense_curve.interpolate_many(serials + 0.5),
+        curve.interpolate_many(serials + 0.5),
+    )
+    for serial in serials[::97]:
+        dt = Date.from_serial(int(serial))
+        assert dense_curve(dt) == pytest.approx(curve(dt))
+    assert np.allclose(dense_curve.zero_rates(serials), curve.zero_rates(serials))
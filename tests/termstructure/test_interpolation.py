@@ -0,0 +1,133 @@
+import QuantLib as ql
+from supersnabb.time.date import Date
+from supersnabb.time.date_array import DateArray
+from supersnabb.time.daycounters.act365 import ACT365
+from supersnabb.termstructure.interpolation import Interpolation, InterpolationType
+import numpy as np
+import pytest
+
+DATES = [Date(2023, 1, 2), Date(2023, 4, 3), Date(2024, 1, 2), Date(2028, 1, 3)]
+RATES = [1.0, 0.99, 0.96, 0.83]
+
+
+@pytest.mark.parametrize(
+    "interpolation, ql_interpolation",
+    [
+        (InterpolationType.LINEAR, ql.LinearInterpolation),
+        (InterpolationType.LOGLINEAR, ql.LogLinearInterpolation),
+        (InterpolationType.FLATFORWARD, ql.BackwardFlatInterpolation),
+    ],
+)
+def test_interpolation_with_ql(interpolation, ql_interpolation):
+    ss_interpolation = Interpolation(DATES, RATES, ACT365, interpolation)
+    x = [float(dt.serial_number) for dt in DATES]
+    ql_interpolation = ql_interpolation(x, RATES)
+
+    serials = np.arange(DATES[0].serial_number - 30, DATES[-1].serial_number + 30)
+    if interpolation == InterpolationType.FLATFORWARD:
+        # The value at a pillar is that of the following segment
+        serials = serials[~np.isin(serials, x)]
+    expected = [ql_interpolation(float(serial), True) for serial in serials]
+    assert np.allclose(ss_interpolation.interpolate_many(serials), expected)
+    assert np.allclose(
+        ss_interpolation.interpolate_many(DateArray.from_serials(serials)), expected
+    )
+    for serial, value in zip(serials[::50], expected[::50]):
+        assert ss_interpolation.interpolate(Date.from_serial(int(serial))) == (
+            pytest.approx(value)
+        )
+    # The last pillar is interpolated on the last segment
+    assert ss_interpolation.interpolate(DATES[-1]) == pytest.approx(RATES[-1])
+
+
+def test_interpolation_pillars():
+    with pytest.raises(ValueError, match="strictly increasing"):
+        Interpolation(DATES[::-1], RATES, ACT365)
+    with pytest.raises(ValueError, match="at least two pillars"):
+        Interpolation(DATES[:1], RATES[:1], ACT365)
+
+
+@pytest.mark.parametrize(
+    "interpolation, ql_interpolation",
+    [
+        (InterpolationType.NATURALCUBIC, ql.CubicNaturalSpline),
+        (InterpolationType.MONOTONECUBIC, ql.MonotonicCubicNaturalSpline),
+    ],
+)
+def test_cubic_interpolation_with_ql(interpolation, ql_interpolation):
+    dates = DATES + [Date(2030, 6, 3), Date(2033, 1, 3)]
+    # Not monotone, so that the Hyman filter has slopes to limit
+    rates = RATES + [0.84, 0.7]
+    ss_interpolation = Interpolation(dates, rates, ACT365, interpolation)
+    x = [float(dt.serial_number) for dt in dates]
+    ql_interpolation = ql_interpolation(x, rates)
+
+    serials = np.arange(dates[0].serial_number - 30, dates[-1].serial_number + 30)
+    expected = [ql_interpolation(float(serial), True) for serial in serials]
+    assert np.allclose(ss_interpolation.interpolate_many(serials), expected)
+    for serial, value in zip(serials[::50], expected[::50]):
+        assert ss_interpolation.interpolate(Date.from_serial(int(serial))) == (
+            pytest.approx(value)
+        )
+
+
+def test_monotone_convex_interpolation():
+    ss_interpolation = Interpolation(
+        DATES, RATES, ACT365, InterpolationType.MONOTONECONVEX
+    )
+    x = np.array([dt.serial_number for dt in DATES])
+    assert np.allclose(ss_interpolation.interpolate_many(x), RATES)
+
+    serials = np.arange(DATES[0].serial_number - 30, DATES[-1].serial_number + 30)
+    discount_factors = ss_interpolation.interpolate_many(serials)
+    forwards = -np.diff(np.log(discount_factors))
+    # Decreasing discount factors give positive and continuous daily forwards
+    assert np.all(forwards > 0)
+    assert np.max(np.abs(np.diff(forwards))) < 1e-6
+
+
+@pytest.mark.parametrize("n_pillars", [2, 5])
+def test_monotone_convex_positivity_collar(n_pillars):
+    dates = [Date(2023 + idx, 1, 2) for idx in range(n_pillars)]
+    x = np.array([dt.serial_number for dt in dates], dtype=np.float64)
+    # The discrete forward of the second period is far below those of its neighbours
+    discrete_forwards = np.array([0.05, 0.001, 0.05, 0.05])[: n_pillars - 1]
+    rates = np.exp(
+        -np.concatenate(([0.0], np.cumsum(discrete_forwards * np.diff(x) / 365)))
+    )
+    ss_interpolation = Interpolation(
+        dates, list(rates), ACT365, InterpolationType.MONOTONECONVEX
+    )
+    assert np.allclose(ss_interpolation.interpolate_many(x), rates)
+    serials = np.arange(x[0] - 30, x[-1] + 30)
+    forwards = -np.diff(np.log(ss_interpolation.interpolate_many(serials))) * 365
+    assert np.all(forwards >= 0)
+    if n_pillars == 2:
+        # A single period extrapolates flat with its discrete forward on both sides
+        assert np.allclose(forwards, discrete_forwards[0])
+
+
+@pytest.mark.parametrize(
+    "interpolation",
+    [
+        InterpolationType.LINEAR,
+        InterpolationType.LOGLINEAR,
+        InterpolationType.FLATFORWARD,
+    ],
+)
+def test_pillar_sensitivities(interpolation):
+    ss_interpolation = Interpolation(DATES, RATES, ACT365, interpolation)
+    serials = np.arange(DATES[0].serial_number - 30, DATES[-1].serial_number + 30, 11)
+    sensitivities = ss_interpolation.pillar_sensitivities(serials)
+    assert sensitivities.shape == (len(serials), len(DATES))
+    for j in range(len(DATES)):
+        bumped = list(RATES)
+        bumped[j] += 1e-7
+        difference = Interpolation(
+            DATES, bumped, ACT365, interpolation
+        ).interpolate_many(serials) - ss_interpolation.interpolate_many(serials)
+        assert np.allclose(sensitivities[:, j], difference / 1e-7, atol=1e-6)
+    with pytest.raises(ValueError, match="not supported"):
+        Interpolation(
+            DATES, RATES, ACT365, InterpolationType.NATURALCUBIC
+        ).pillar_sensitivities(serials)
@@ -0,0 +1,105 @@
+import supersnabb as ss
+from supersnabb.termstructure.scenario_curve import (
+    ScenarioCurve,
+    parallel_shift,
+    twist,
+    key_rate_shifts,
+)
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def curve(pillar_dates, discount_factors):
+    return ss.DiscountCurve(
+        pillar_dates,
+        discount_factors,
+        ss.ACT365,
+        ss.Sweden,
+        ss.InterpolationType.LOGLINEAR,
+    )
+
+
+def _serials(dates):
+    return np.arange(dates[0].serial_number, dates[-1].serial_number + 30, 7)
+
+
+def test_parallel_shift(curve, pillar_dates):
+    shifts = np.array([-0.01, 0.0, 0.0001, 0.02])
+    scenarios = parallel_shift(curve, shifts)
+    assert scenarios.n_scenarios == 4
+    serials = _serials(pillar_dates)
+    t = (serials - pillar_dates[0].serial_number) / 365
+    discount_factors = scenarios.discount_factors(serials)
+    assert discount_factors.shape == (len(serials), 4)
+    expected = curve.discount_factors(serials)[:, None] * np.exp(-shifts * t[:, None])
+    assert np.allclose(discount_factors, expected)
+    assert np.allclose(scenarios(ss.Date.from_serial(int(serials[5]))), expected[5])
+    assert np.allclose(
+        scenarios.zero_rates(serials[1:]),
+        curve.zero_rates(serials[1:])[:, None] + shifts,
+    )
+
+    # Every column is the curve of a single scenario
+    for i in range(4):
+        single = scenarios.scenario(i)
+        assert np.allclose(single.discount_factors(serials), discount_factors[:, i])
+        start, end = serials[:-1], serials[1:]
+        assert np.allclose(
+            single.forward_rates(start, end, ss.ACT360),
+            scenarios.forward_rates(start, end, ss.ACT360)[:, i],
+        )
+
+
+def test_twist_and_key_rate_shifts(curve, pillar_dates):
+    scenarios = twist(curve, [0.001, -0.002], [-0.001, 0.003], pivot=pillar_dates[2])
+    pillars = ss.DateArray(pillar_dates[1:])
+    zero_rates = scenarios.zero_rates(pillars)
+    base = curve.zero_rates(pillars)[:, None]
+    assert np.allclose(zero_rates[1], base[1])
+    assert np.all(np.sign(zero_rates[[0, -1]] - base[[0, -1]]) == [[1, -1], [-1, 1]])
+
+    scenarios = key_rate_shifts(curve, 0.0001)
+    assert scenarios.n_scenarios == len(pillar_dates) - 1
+    serials = np.arange(
+        pillar_dates[0].serial_number, pillar_dates[-1].serial_number + 1
+    )
+    moved = ~np.isclose(
+        scenarios.discount_factors(serials),
+        curve.discount_factors(serials)[:, None],
+        rtol=0,
+        atol=1e-12,
+    )
+    for j in range(len(pillar_dates) - 1):
+        # Only the segments on either side of the shifted pillar move
+        start = pillar_dates[j].serial_number
+        end = pillar_dates[min(j + 2, len(pillar_dates) - 1)].serial_number
+        expected = (serials > start) & (serials < end)
+        if j == len(pillar_dates) - 2:
+            expected |= serials == end
+        assert np.array_equal(moved[:, j], expected)
+
+    with pytest.raises(ValueError, match="not supported"):
+        ScenarioCurve(
+            pillar_dates,
+            np.ones((len(pillar_dates), 2)),
+            ss.ACT365,
+            ss.Sweden,
+            ss.InterpolationType.NATURALCUBIC,
+        )
+
+
+def test_scenario_curve_in_legs(curve, make_legs):
+    scenarios = parallel_shift(curve, np.linspace(-0.02, 0.02, 5))
+
+    def legs(discount_curve):
+        return make_legs(discount_curve, tenor="1Y", daycount=ss.ACT360)
+
+    fixed_leg, float_leg = legs(scenarios)
+    assert fixed_leg.npv.shape == float_leg.npv.shape == (5,)
+    assert float_leg.coupons[1].coupon.shape == (5,)
+    for i in range(5):
+        fixed, floating = legs(scenarios.scenario(i))
+        assert fixed_leg.npv[i] == pytest.approx(fixed.npv)
+        assert float_leg.npv[i] == pytest.approx(floating.npv)
+        assert float_leg.npv[i] == pytest.approx(floating.cashflows["Coupon"].sum())
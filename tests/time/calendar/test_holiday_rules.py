@@ -0,0 +1,66 @@
+from supersnabb.time.date import Date
+from supersnabb.time.calendars.rule_based_calendar import RuleBasedCalendar
+from supersnabb.time.calendars.holiday_rules import (
+    EasterOffset,
+    FixedDate,
+    NthWeekday,
+    Observance,
+    WeekdayInRange,
+)
+import QuantLib as ql
+from datetime import date
+from dateutil.relativedelta import relativedelta
+
+
+class UnitedStatesSettlement(RuleBasedCalendar):
+    rules = (
+        FixedDate("New Year's Day", 1, 1, observance=Observance.NEARESTWEEKDAY),
+        NthWeekday("Martin Luther King's Birthday", 1, 0, 3, valid_from=1983),
+        NthWeekday("Washington's Birthday", 2, 0, 3, valid_from=1971),
+        NthWeekday("Memorial Day", 5, 0, -1, valid_from=1971),
+        FixedDate(
+            "Juneteenth", 6, 19, valid_from=2022, observance=Observance.NEARESTWEEKDAY
+        ),
+        FixedDate("Independence Day", 7, 4, observance=Observance.NEARESTWEEKDAY),
+        NthWeekday("Labor Day", 9, 0, 1),
+        NthWeekday("Columbus Day", 10, 0, 2, valid_from=1971),
+        FixedDate("Veterans Day", 11, 11, observance=Observance.NEARESTWEEKDAY),
+        NthWeekday("Thanksgiving Day", 11, 3, 4),
+        FixedDate("Christmas", 12, 25, observance=Observance.NEARESTWEEKDAY),
+    )
+
+
+def test_rule_based_calendar_ql():
+    ql_calendar = ql.UnitedStates(ql.UnitedStates.Settlement)
+    calendar = UnitedStatesSettlement()
+    dt = date(2000, 1, 1)
+    for idx in range(10000):
+        dt = dt + relativedelta(days=1)
+        ql_dt = ql.Date(dt.day, dt.month, dt.year)
+        ss_dt = Date(dt.year, dt.month, dt.day)
+        assert ql_calendar.isBusinessDay(ql_dt) == calendar.is_business_day(ss_dt)
+        assert ql_calendar.isBusinessDay(ql_dt) == calendar._is_business_day(ss_dt)
+
+
+def test_holiday_rules():
+    assert (
+        NthWeekday("", 5, 0, -1).serial_number(2023) == Date(2023, 5, 29).serial_number
+    )
+    assert (
+        NthWeekday("", 2, 2, -1).serial_number(2024) == Date(2024, 2, 28).serial_number
+    )
+    assert (
+        NthWeekday("", 11, 3, 4).serial_number(2023) == Date(2023, 11, 23).serial_number
+    )
+    assert EasterOffset("", -2).serial_number(2023) == Date(2023, 4, 7).serial_number
+    assert FixedDate("", 6, 6, valid_from=2005).serial_number(2004) is None
+    assert FixedDate("", 6, 6, valid_to=2004).serial_number(2005) is None
+    # 2023-12-24 is a Sunday and 2022-12-31 a Saturday
+    sunday = FixedDate("", 12, 24, observance=Observance.SUNDAYTOMONDAY)
+    assert sunday.serial_number(2023) == Date(2023, 12, 25).serial_number
+    saturday = FixedDate("", 12, 31, observance=Observance.NEXTWEEKDAY)
+    assert saturday.serial_number(2022) == Date(2023, 1, 2).serial_number
+    midsummer = WeekdayInRange("", 6, 4, 19, 25)
+    assert midsummer.serial_number(2023) == Date(2023, 6, 23).serial_number
+    assert WeekdayInRange("", 6, 4, 19, 21).serial_number(2023) is None
+    assert UnitedStatesSettlement().holidays(2022)[-1] == Date(2022, 12, 26)
@@ -0,0 +1,52 @@
+from supersnabb.time.date import Date, Tenor
+from supersnabb.time.calendars.sweden import Sweden
+from supersnabb.time.calendars.null_calendar import NullCalendar
+from supersnabb.time.calendars.joint_calendar import JointCalendar, JointCalendarRule
+from supersnabb.time.business_day_convention import BusinessDayConvention
+
+
+class Fourth(NullCalendar):
+    """
+    A calendar with weekends and the fourth of every month as holidays.
+    """
+
+    def _is_business_day(self, dt: Date) -> bool:
+        return not dt.is_week() and dt.day_of_month() != 4
+
+
+def test_joint_calendar():
+    join_holidays = JointCalendar(Sweden(), Fourth())
+    join_business_days = JointCalendar(
+        Sweden(), Fourth(), rule=JointCalendarRule.JOINBUSINESSDAYS
+    )
+    for serial_number in range(
+        Date(2000, 1, 1).serial_number, Date(2030, 1, 1).serial_number
+    ):
+        dt = Date.from_serial(serial_number)
+        sweden = Sweden().is_business_day(dt)
+        fourth = Fourth().is_business_day(dt)
+        assert join_holidays.is_business_day(dt) is (sweden and fourth)
+        assert join_business_days.is_business_day(dt) is (sweden or fourth)
+
+    assert (
+        JointCalendar(Fourth(), Sweden())._business_day_table()
+        is join_holidays._business_day_table()
+    )
+    assert join_holidays.adjust(
+        Date(2023, 12, 23), BusinessDayConvention.FOLLOWING
+    ) == Date(2023, 12, 27)
+    assert join_holidays.advance(
+        Date(2023, 7, 3), Tenor("1D"), BusinessDayConvention.FOLLOWING
+    ) == Date(2023, 7, 5)
+
+
+def test_joint_calendar_holidays():
+    class Holidays(NullCalendar):
+        pass
+
+    joint = JointCalendar(Holidays(), Fourth())
+    dt = Date(2023, 7, 5)
+    assert joint.is_business_day(dt) is True
+    Holidays().add_holiday(dt)
+    assert joint.is_business_day(dt) is False
+    assert JointCalendar(Holidays(), Fourth()).is_business_day(dt) is False
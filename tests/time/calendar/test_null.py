@@ -18,3 +18,19 @@ def test_swedish_calendar_ql():
             ss_dt
         )
         assert ql_null.isBusinessDay(ql_dt) == NullCalendar().is_business_day(ss_dt)
+
+
+def test_null_calendar_holidays():
+    class Holidays(NullCalendar):
+        pass
+
+    calendar = Holidays()
+    dt = Date(2023, 6, 30)
+    assert calendar.adjust(dt, BusinessDayConvention.FOLLOWING) == dt
+    calendar.add_holiday(dt)
+    assert Holidays().is_business_day(dt) is False
+    assert calendar.adjust(dt, BusinessDayConvention.FOLLOWING) == dt + 1
+    assert calendar.adjust(dt, BusinessDayConvention.MODIFIEDFOLLOWING) == dt - 1
+    calendar.remove_holiday(dt)
+    assert calendar.adjust(dt, BusinessDayConvention.FOLLOWING) == dt
+    assert NullCalendar().adjust(dt, "following") == dt
@@ -1,9 +1,12 @@
 from supersnabb.time.date import Date, Tenor
+from supersnabb.time.date_array import DateArray
 from supersnabb.time.calendars.sweden import Sweden
 from supersnabb.time.business_day_convention import BusinessDayConvention
 import QuantLib as ql
 from datetime import date
 from dateutil.relativedelta import relativedelta
+import numpy as np
+import pytest
 
 
 def test_swedish_calendar_ql():
@@ -108,3 +111,97 @@ def test_swedish_calendar():
     assert Sweden().is_business_day(Date(2023, 12, 25)) is False  # Christmas Day
     assert Sweden().is_business_day(Date(2023, 12, 26)) is False  # Boxing Day
     assert Sweden().is_business_day(Date(2023, 12, 31)) is False  # New Year's E
+
+
+def test_swedish_business_days_ql():
+    ql_sweden = ql.Sweden()
+    dt = date(2000, 1, 1)
+    for idx in range(2000):
+        dt = dt + relativedelta(days=3)
+        ql_dt = ql.Date(dt.day, dt.month, dt.year)
+        ss_dt = Date(dt.year, dt.month, dt.day)
+        for n in [-250, -20, 2, 250]:
+            assert (
+                ql_sweden.advance(ql_dt, ql.Period(n, ql.Days)).ISO()
+                == Sweden()
+                .advance(ss_dt, Tenor(f"{n}D"), BusinessDayConvention.FOLLOWING)
+                .ISO()
+            )
+        for n in [-40, 0, 17]:
+            for include_first, include_last in [(True, False), (False, True)]:
+                assert ql_sweden.businessDaysBetween(
+                    ql_dt, ql_dt + n, include_first, include_last
+                ) == Sweden().business_days_between(
+                    ss_dt, ss_dt + n, include_first, include_last
+                )
+    assert Sweden().nth_business_day(Date(2023, 4, 15), 1) == Date(2023, 4, 3)
+    assert Sweden().nth_business_day(Date(2023, 4, 15), 5) == Date(2023, 4, 11)
+    assert Sweden().nth_business_day(Date(2023, 12, 1), -1) == Date(2023, 12, 29)
+
+
+def test_swedish_half_month_modified_following_ql():
+    ql_sweden = ql.Sweden()
+    dt = date(2000, 1, 1)
+    for idx in range(10000):
+        dt = dt + relativedelta(days=1)
+        ql_dt = ql.Date(dt.day, dt.month, dt.year)
+        ss_dt = Date(dt.year, dt.month, dt.day)
+        assert (
+            ql_sweden.adjust(ql_dt, ql.HalfMonthModifiedFollowing).ISO()
+            == Sweden()
+            .adjust(ss_dt, BusinessDayConvention.HALFMONTHMODIFIEDFOLLOWING)
+            .ISO()
+        )
+
+
+def test_swedish_calendar_many():
+    calendar = Sweden()
+    dates = DateArray.from_serials(
+        np.arange(Date(2000, 1, 1).serial_number, Date(2004, 1, 1).serial_number)
+    )
+    for convention in BusinessDayConvention:
+        adjusted = calendar.adjust_many(dates, convention)
+        assert list(adjusted) == [calendar.adjust(dt, convention) for dt in dates]
+        for tenor in ["-3D", "2D", "1W", "-1M", "3M", "1Y"]:
+            advanced = calendar.advance_many(
+                dates.serial_number, Tenor(tenor), convention
+            )
+            assert advanced.tolist() == [
+                calendar.advance(dt, Tenor(tenor), convention).serial_number
+                for dt in dates
+            ]
+
+
+def test_swedish_calendar_tables(tmp_path):
+    class MappedSweden(Sweden):
+        pass
+
+    path = str(tmp_path / "sweden.bin")
+    MappedSweden().save_tables(path)
+    MappedSweden().add_holiday(Date(2023, 12, 28))
+    MappedSweden().load_tables(path)
+    assert MappedSweden().is_business_day(Date(2023, 12, 28)) is True
+    dates = DateArray.from_serials(
+        np.arange(Date(2000, 1, 1).serial_number, Date(2030, 1, 1).serial_number)
+    )
+    for convention in BusinessDayConvention:
+        assert (
+            MappedSweden().adjust_many(dates, convention)
+            == Sweden().adjust_many(dates, convention)
+        ).all()
+    assert (
+        MappedSweden().advance_many(
+            dates, Tenor("-5D"), BusinessDayConvention.FOLLOWING
+        )
+        == Sweden().advance_many(dates, Tenor("-5D"), BusinessDayConvention.FOLLOWING)
+    ).all()
+
+    MappedSweden().add_holiday(Date(2023, 12, 27))
+    assert MappedSweden().adjust(
+        Date(2023, 12, 23), BusinessDayConvention.FOLLOWING
+    ) == Date(2023, 12, 28)
+    assert Sweden().adjust(Date(2023, 12, 23), BusinessDayConvention.FOLLOWING) == Date(
+        2023, 12, 27
+    )
+    with pytest.raises(ValueError, match="holds the tables of MappedSweden"):
+        Sweden().load_tables(path)
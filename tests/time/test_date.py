@@ -1,7 +1,10 @@
 import QuantLib as ql
 from supersnabb.time.date import Tenor, Date
+from supersnabb.time.date_array import easter_monday
 from datetime import date
 from dateutil.relativedelta import relativedelta
+from dateutil import easter
+import numpy as np
 import pytest
 
 
@@ -90,3 +93,67 @@ def test_tenor():
     assert (Tenor("-1M") + Date(2022, 12, 31)).ISO() == Date(2022, 11, 30).ISO()
     assert (Tenor("-1M") - Date(2022, 12, 31)).ISO() == Date(2023, 1, 31).ISO()
     assert (Tenor("1M") - Date(2022, 12, 31)).ISO() == Date(2022, 11, 30).ISO()
+
+
+def test_date_with_ql():
+    num_dates = 10000
+    dt = date(2000, 1, 1)
+    for idx in range(num_dates):
+        dt = dt + relativedelta(days=1)
+        ss_dt = Date(dt.year, dt.month, dt.day)
+        ql_dt = ql.Date(dt.day, dt.month, dt.year)
+        assert ss_dt.serial_number == ql_dt.serialNumber()
+        assert ss_dt.year() == ql_dt.year()
+        assert ss_dt.month() == ql_dt.month()
+        assert ss_dt.day_of_month() == ql_dt.dayOfMonth()
+        assert ss_dt.day_of_year() == ql_dt.dayOfYear()
+        assert ss_dt.weekday() == dt.weekday()
+        assert ss_dt.date() == dt
+
+
+def test_date():
+    dt = Date(2023, 1, 31)
+    assert Date.from_serial(dt.serial_number) == dt
+    assert hash(Date.from_serial(dt.serial_number)) == hash(dt)
+    assert len({dt, Date(2023, 1, 31), dt + 1}) == 2
+    assert dt < dt + 1 <= Date(2023, 2, 1) < Date(2024, 1, 1)
+    assert (dt + 1).ISO() == "2023-02-01"
+    assert (dt - 31).ISO() == "2022-12-31"
+    assert dt != "2023-01-31"
+
+    with pytest.raises(ValueError, match="The given input for date are not valid"):
+        Date(2023, 2, 29)
+    with pytest.raises(ValueError, match="The given input for date are not valid"):
+        Date(1900, 2, 29)
+
+
+def test_easter_monday():
+    for year in range(1901, 2201):
+        em_date = easter.easter(year) + relativedelta(days=1)
+        assert Date(year, 7, 1).easter_monday() == em_date.timetuple().tm_yday
+    years = np.arange(1901, 2201)
+    assert (
+        easter_monday(years) == [Date(int(y), 1, 1).easter_monday() for y in years]
+    ).all()
+
+
+def test_tenor_value_type():
+    assert Tenor("6M") is Tenor("6M")
+    assert Tenor(6, "m") == Tenor("6M")
+    assert hash(Tenor(6, "M")) == hash(Tenor("6M"))
+    assert repr(Tenor("-3W")) == "-3W"
+    assert -Tenor("3W") == Tenor("-3W")
+    assert 2 * Tenor("3M") == Tenor("3M") * 2 == Tenor("6M")
+    assert Tenor("3M") + Tenor("3M") == Tenor("6M")
+    assert (Date(2023, 1, 31) + Tenor("1M")).ISO() == "2023-02-28"
+    assert (Date(2024, 2, 29) + Tenor("1Y")).ISO() == "2025-02-28"
+    assert (Date(2024, 3, 31) - Tenor("1M")).ISO() == "2024-02-29"
+
+    with pytest.raises(AttributeError):
+        Tenor("6M").length = 3
+    with pytest.raises(ValueError, match="tenor must end with D, W, M or Y"):
+        Tenor("6Q")
+    with pytest.raises(ValueError, match="tenor must start with a number"):
+        Tenor("M")
+    with pytest.raises(ValueError, match="between 1900 and 2200"):
+        Date(2200, 6, 1) + Tenor("1Y")
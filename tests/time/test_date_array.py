@@ -0,0 +1,69 @@
+from supersnabb.time.date import Date, Tenor
+from supersnabb.time.date_array import DateArray, add_tenor
+from supersnabb.time.daycounters.act360 import ACT360
+from datetime import date, timedelta
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def test_date_array_fields():
+    start = date(1901, 1, 1)
+    dts = [start + timedelta(days=idx) for idx in range(0, 109000, 7)]
+    dates = DateArray([Date(dt.year, dt.month, dt.day) for dt in dts])
+    assert dates.serial_number.dtype == np.int32
+    assert (dates.year() == [dt.year for dt in dts]).all()
+    assert (dates.month() == [dt.month for dt in dts]).all()
+    assert (dates.day_of_month() == [dt.day for dt in dts]).all()
+    assert (dates.day_of_year() == [dt.timetuple().tm_yday for dt in dts]).all()
+    assert (dates.weekday() == [dt.weekday() for dt in dts]).all()
+    assert (dates.is_week() == [dt.weekday() > 4 for dt in dts]).all()
+
+
+def test_date_array():
+    dates = DateArray([Date(2023, 1, 31), Date(2023, 2, 28), Date(2024, 2, 29)])
+    assert dates[0] == Date(2023, 1, 31)
+    assert isinstance(dates[1:], DateArray)
+    assert list(dates + 1) == [Date(2023, 2, 1), Date(2023, 3, 1), Date(2024, 3, 1)]
+    assert list(1 + dates) == list(dates + 1)
+    assert list(dates - np.array([1, 2, 3])) == [
+        Date(2023, 1, 30),
+        Date(2023, 2, 26),
+        Date(2024, 2, 26),
+    ]
+    assert (dates < Date(2024, 1, 1)).tolist() == [True, True, False]
+    assert (dates == dates + 0).all()
+
+    np.testing.assert_array_equal(
+        dates.to_datetime64(),
+        np.array(["2023-01-31", "2023-02-28", "2024-02-29"], dtype="datetime64[D]"),
+    )
+    assert (DateArray.from_datetime64(dates.to_datetime64()) == dates).all()
+    assert (
+        dates.to_pandas()
+        == pd.DatetimeIndex(["2023-01-31", "2023-02-28", "2024-02-29"])
+    ).all()
+    assert (DateArray.from_pandas(dates.to_pandas()) == dates).all()
+
+    np.testing.assert_allclose(
+        ACT360().year_fraction(dates[:-1], dates[1:]), [28 / 360, 366 / 360]
+    )
+
+    with pytest.raises(ValueError, match="serial numbers must be integers"):
+        DateArray(np.array([1.5]))
+
+
+def test_date_array_tenor():
+    dates = DateArray([Date(2023, 1, 31), Date(2024, 2, 29), Date(2024, 12, 31)])
+    for tenor in ["1D", "2W", "1M", "-1M", "13M", "1Y", "-5Y"]:
+        assert list(dates + Tenor(tenor)) == [dt + Tenor(tenor) for dt in dates]
+        assert list(dates - Tenor(tenor)) == [dt - Tenor(tenor) for dt in dates]
+    assert list(Tenor("1M") - dates) == list(dates - Tenor("1M"))
+
+    seed = Date(2023, 1, 31).serial_number
+    schedule = add_tenor(seed, Tenor("1M"), np.arange(12))
+    assert [Date.from_serial(int(s)).ISO() for s in schedule[:3]] == [
+        "2023-01-31",
+        "2023-02-28",
+        "2023-03-31",
+    ]
@@ -1,10 +1,13 @@
 import QuantLib as ql
 from supersnabb.time.date import Tenor, Date
 from supersnabb.time.schedule import Schedule
+from supersnabb.time.date_array import DateArray
 from supersnabb.time.calendars.sweden import Sweden
+from supersnabb.time.calendars.null_calendar import NullCalendar
 from supersnabb.time.business_day_convention import BusinessDayConvention
 from datetime import date
 from dateutil.relativedelta import relativedelta
+import numpy as np
 
 
 def test_schedule_with_ql():
@@ -37,3 +40,169 @@ def test_schedule_with_ql():
         )
         ss_schedule = [date.ISO() for date in ss_schedule.dates]
         assert ss_schedule == ql_schedule
+
+
+def test_backward_schedule_with_ql():
+    dt = date(2000, 1, 1)
+    for idx in range(0, 3000, 3):
+        dt = dt + relativedelta(days=3)
+        ss_dt = Date(dt.year, dt.month, dt.day)
+        ql_dt = ql.Date(dt.day, dt.month, dt.year)
+        for tenor, maturity in [("1W", "1Y"), ("3M", "5Y"), ("1Y", "10Y")]:
+            ql_schedule = ql.Schedule(
+                ql_dt,
+                ql_dt + ql.Period(maturity),
+                ql.Period(tenor),
+                ql.Sweden(),
+                ql.ModifiedFollowing,
+                ql.ModifiedFollowing,
+                ql.DateGeneration.Backward,
+                False,
+            )
+            ss_schedule = Schedule(
+                ss_dt,
+                Tenor(maturity) + ss_dt,
+                Tenor(tenor),
+                Sweden(),
+                BusinessDayConvention.MODIFIEDFOLLOWING,
+                BusinessDayConvention.MODIFIEDFOLLOWING,
+                "backward",
+                False,
+            )
+            assert [date.ISO() for date in ss_schedule.dates] == [
+                date.ISO() for date in ql_schedule
+            ]
+            assert ss_schedule.is_regular == list(ql_schedule.isRegular())
+
+
+def test_generate_many():
+    rng = np.random.default_rng(0)
+    n = 500
+    effective_dates = rng.integers(
+        Date(2000, 1, 1).serial_number, Date(2030, 1, 1).serial_number, n
+    )
+    maturities = rng.choice(["1Y", "5Y", "10Y"], n)
+    termination_dates = DateArray(
+        [
+            Tenor(maturity) + Date.from_serial(int(serial_number))
+            for maturity, serial_number in zip(maturities, effective_dates)
+        ]
+    )
+    tenors = list(rng.choice(["1M", "3M", "6M", "1Y", "2W"], n))
+    calendars = [Sweden() if idx % 3 else NullCalendar() for idx in range(n)]
+    conventions = list(rng.choice(["following", "modifiedfollowing", "preceding"], n))
+    rules = list(rng.choice(["forward", "backward"], n))
+
+    batch = Schedule.generate_many(
+        effective_dates, termination_dates, tenors, calendars, conventions, rules
+    )
+    assert len(batch) == n
+    assert batch.offsets[-1] == len(batch.serial_numbers)
+    assert batch.period_offsets[-1] == len(batch.is_regular)
+    for idx in range(n):
+        schedule = Schedule(
+            Date.from_serial(int(effective_dates[idx])),
+            termination_dates[idx],
+            tenors[idx],
+            calendars[idx],
+            conventions[idx],
+            conventions[idx],
+            rules[idx],
+        )
+        assert list(batch.dates(idx)) == schedule.dates
+        assert batch.regular(idx).tolist() == schedule.is_regular
+
+    # A single tenor, calendar, convention and rule is shared by all trades
+    batch = Schedule.generate_many(
+        effective_dates, termination_dates, "3M", Sweden(), "following", "forward"
+    )
+    assert len(batch) == n
+
+
+def test_schedule_cache():
+    def build():
+        return Schedule(
+            Date(2023, 1, 31),
+            Date(2028, 1, 31),
+            Tenor("3M"),
+            Sweden(),
+            BusinessDayConvention.MODIFIEDFOLLOWING,
+            BusinessDayConvention.MODIFIEDFOLLOWING,
+            "forward",
+        )
+
+    assert Sweden() == Sweden()
+    assert hash(Sweden()) == hash(Sweden())
+    assert Sweden() != NullCalendar()
+
+    uncached = build()
+    Schedule.enable_cache(maxsize=16)
+    try:
+        first, second = build(), build()
+        assert first.dates is second.dates
+        assert list(first.dates) == uncached.dates
+        assert list(first.is_regular) == uncached.is_regular
+        info = Schedule.cache_info()
+        assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 1, 16, 1)
+
+        # Modifying the calendar misses the cache
+        holiday = Date(2023, 4, 28)
+        Sweden().add_holiday(holiday)
+        try:
+            modified = build()
+            assert modified.dates is not first.dates
+            assert holiday not in modified.dates
+        finally:
+            Sweden().remove_holiday(holiday)
+        assert Schedule.cache_info().misses == 2
+
+        Schedule.cache_clear()
+        assert Schedule.cache_info().currsize == 0
+    finally:
+        Schedule.disable_cache()
+    assert Schedule.cache_info() is None
+    assert build().dates == uncached.dates
+
+
+def test_lazy_schedule():
+    for rule, first_date, next_to_last in [
+        ("forward", None, None),
+        ("backward", None, None),
+        ("forward", Date(2023, 3, 15), Date(2032, 11, 30)),
+        ("backward", Date(2023, 3, 15), Date(2032, 11, 30)),
+    ]:
+        args = (
+            Date(2023, 1, 31),
+            Date(2033, 1, 31),
+            Tenor("3M"),
+            Sweden(),
+            BusinessDayConvention.MODIFIEDFOLLOWING,
+            BusinessDayConvention.MODIFIEDFOLLOWING,
+            rule,
+            False,
+            first_date,
+            next_to_last,
+        )
+        eager = Schedule(*args)
+        lazy = Schedule(*args, lazy=True)
+
+        assert list(lazy.iter_dates()) == eager.dates
+        assert list(lazy.iter_dates(reverse=True)) == eager.dates[::-1]
+        periods = list(lazy.iter_periods())
+        assert [start for start, _, _ in periods] == eager.dates[:-1]
+        assert [end for _, end, _ in periods] == eager.dates[1:]
+        assert [regular for _, _, regular in periods] == eager.is_regular
+        assert list(lazy.iter_periods(reverse=True)) == periods[::-1]
+
+        dt = Date(2022, 12, 1)
+        while dt < Date(2033, 3, 1):
+            assert lazy.next_date(dt) == eager.next_date(dt)
+            assert lazy.previous_date(dt) == eager.previous_date(dt)
+            dt = dt + 5
+        assert lazy.next_date(Date(2033, 1, 31)) is None
+        assert lazy.previous_date(Date(2023, 1, 31)) is None
+
+        # Nothing is generated until the dates are accessed
+        assert lazy._dates is None
+        assert lazy.dates == eager.dates
+        assert lazy.is_regular == eager.is_regular